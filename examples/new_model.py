@@ -1,44 +1,26 @@
 import pyArchimate as pa
-from pyArchimate.writers.archimateWriter import archimate_writer
 
 
 def main():
     # create a new model
-    m = pa.Model("My Model")
-    m.prop("author", "X. Mayeur")
-    m.prop("version", "1.0.0")
+    m = pa.Model("My Model", author="X. Mayeur", version="1.0.0")
 
     # Add a view
     v = m.add(concept_type=pa.ArchiType.View, name="view 1")
 
-    # Add an node in the view and create the related element
-    n_app_srv = v.get_or_create_node(
-        "Application Service",
-        pa.ArchiType.ApplicationService,
-        20,
-        20,
-        create_elem=True,
-        create_node=True,
-    )
-    # Add another one
-    n_app_comp = v.get_or_create_node(
-        "Application Interaction",
-        pa.ArchiType.ApplicationInterface,
-        x=200,
-        y=20,
-        create_elem=True,
-        create_node=True,
-    )
-    # and create a relation between both
-    v.get_or_create_connection(
-        rel_type=pa.ArchiType.Serving,
-        source=n_app_comp,
-        target=n_app_srv,
-        create_conn=True,
-        name="Serves",
+    # Add two nodes, creating the related elements, and a relation between both
+    v.add_many(
+        nodes=[
+            ("Application Service", pa.ArchiType.ApplicationService, 20, 20),
+            ("Application Interaction", pa.ArchiType.ApplicationInterface, 200, 20),
+        ],
+        connections=[
+            (pa.ArchiType.Serving, "Application Interaction", "Application Service", "Serves"),
+        ],
     )
 
-    m.write("my_model.archimate", writer=archimate_writer)
+    # The writer is looked up by key, so its module is only imported by this call
+    m.write("my_model.archimate", writer=pa.Writers.archimate)
 
 
 if __name__ == "__main__":
@@ -52,8 +52,8 @@ if [ "$CLEAN" = true ]; then
   echo -e "${GREEN}✓${NC} Cleaned build directory"
 fi
 
-# Build with poetry
-poetry run sphinx-build -b html "${DOCS_DIR}" "${HTML_DIR}"
+# Build with poetry; -j auto reads/writes pages on all available cores
+poetry run sphinx-build -j auto -b html "${DOCS_DIR}" "${HTML_DIR}"
 
 echo -e "\n${GREEN}✓ Build complete!${NC}"
 echo -e "${BLUE}📁 Documentation: ${HTML_DIR}${NC}"
@@ -8,6 +8,7 @@ And generates symbol definitions with proper paths and colors.
 """
 
 import ssl
+from pathlib import Path
 from urllib.parse import quote
 from urllib.request import urlopen
 
@@ -128,6 +129,21 @@ ARCHIMATE_COLORS = {
 }
 
 
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Write content only when it differs, so unchanged output keeps its mtime.
+
+    Sphinx (autoapi/viewcode) re-reads every page whose source got newer, so rewriting
+    an identical module would needlessly invalidate the incremental docs build.
+
+    Returns:
+        True if the file was written
+    """
+    if path.exists() and path.read_text(encoding="utf-8") == content:
+        return False
+    path.write_text(content, encoding="utf-8")
+    return True
+
+
 def fetch_symbol(filename: str) -> dict | None:
     """Fetch a symbol SVG from the repository.
 
@@ -308,11 +324,11 @@ def validate_symbols() -> tuple[int, int]:
 '''
 
     # Write to file
-    output_path = "src/pyArchimate/view/layout/export/symbols/archimate_symbols.py"
-    with open(output_path, "w") as f:
-        f.write(code)
-
-    print(f"✓ Generated {output_path}")
+    output_path = Path("src/pyArchimate/view/layout/export/symbols/archimate_symbols.py")
+    if _write_if_changed(output_path, code):
+        print(f"✓ Generated {output_path}")
+    else:
+        print(f"✓ {output_path} is up to date")
     print(f"  Total symbols: {len(symbols)}")
 
     return symbols
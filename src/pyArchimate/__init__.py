@@ -2,19 +2,108 @@
 
 Provides tools for reading/writing .archimate files, managing models and views,
 and rendering diagrams to various formats. Supports ArchiMate 3.x specification.
+
+Public names are resolved lazily on first access (PEP 562), so ``import pyArchimate``
+only pays for the submodules a script actually touches. The eager, import-everything
+surface remains available through the legacy ``pyArchimate.pyArchimate`` shim.
 """
 
 # ruff: noqa: N999  # legacy module name preserved for API compatibility
-from .helpers.diagram import get_or_create_connection as get_or_create_connection  # noqa: E501
-from .helpers.diagram import get_or_create_node as get_or_create_node
-from .helpers.logging import log as log  # noqa: E501
-from .helpers.logging import log_set_level as log_set_level
-from .helpers.logging import log_to_file as log_to_file
-from .helpers.logging import log_to_stderr as log_to_stderr
-from .helpers.parsing import parse_bool as parse_bool  # noqa: E501
-from .helpers.properties import check_invalid_conn as check_invalid_conn  # noqa: E501
-from .helpers.properties import check_invalid_nodes as check_invalid_nodes
-from .helpers.properties import check_invalid_relationships as check_invalid_relationships
-from .helpers.properties import embed_props as embed_props
-from .helpers.properties import expand_props as expand_props
-from .pyArchimate import *  # noqa: F401,F403
+import math  # noqa: F401 - re-exported for legacy callers that do `from pyArchimate import *`
+import os
+from importlib import import_module
+
+# Public name -> (submodule, attribute) it is resolved from on first access
+_LAZY_ATTRS: dict[str, tuple[str, str]] = {
+    "archi_category": (".constants", "ARCHI_CATEGORY"),
+    "ARIS_type_map": (".constants", "ARIS_TYPE_MAP"),
+    "default_theme": (".constants", "DEFAULT_THEME"),
+    "RGBA": (".constants", "RGBA"),
+    "Element": (".element", "Element"),
+    "set_id": (".element", "set_id"),
+    "AccessType": (".enums", "AccessType"),
+    "ArchiType": (".enums", "ArchiType"),
+    "Readers": (".enums", "Readers"),
+    "TextAlignment": (".enums", "TextAlignment"),
+    "TextPosition": (".enums", "TextPosition"),
+    "Writers": (".enums", "Writers"),
+    "ArchimateConceptTypeError": (".exceptions", "ArchimateConceptTypeError"),
+    "ArchimateRelationshipError": (".exceptions", "ArchimateRelationshipError"),
+    "apply_profile_styles": (".helpers.diagram", "apply_profile_styles"),
+    "get_or_create_connection": (".helpers.diagram", "get_or_create_connection"),
+    "get_or_create_node": (".helpers.diagram", "get_or_create_node"),
+    "log": (".helpers.logging", "log"),
+    "log_set_level": (".helpers.logging", "log_set_level"),
+    "log_to_file": (".helpers.logging", "log_to_file"),
+    "log_to_stderr": (".helpers.logging", "log_to_stderr"),
+    "parse_bool": (".helpers.parsing", "parse_bool"),
+    "check_invalid_conn": (".helpers.properties", "check_invalid_conn"),
+    "check_invalid_nodes": (".helpers.properties", "check_invalid_nodes"),
+    "check_invalid_relationships": (".helpers.properties", "check_invalid_relationships"),
+    "embed_props": (".helpers.properties", "embed_props"),
+    "expand_props": (".helpers.properties", "expand_props"),
+    "Model": (".model", "Model"),
+    "default_color": (".model", "default_color"),
+    "Relationship": (".relationship", "Relationship"),
+    "check_valid_relationship": (".relationship", "check_valid_relationship"),
+    "get_default_rel_type": (".relationship", "get_default_rel_type"),
+    "Connection": (".view", "Connection"),
+    "Node": (".view", "Node"),
+    "Point": (".view", "Point"),
+    "Position": (".view", "Position"),
+    "Profile": (".view", "Profile"),
+    "View": (".view", "View"),
+    "register_writer": (".writers", "register_writer"),
+}
+
+# Subpackages/modules reachable as attributes (``pyArchimate.readers``) without an explicit import
+_SUBMODULES = frozenset(
+    {
+        "constants",
+        "element",
+        "enums",
+        "exceptions",
+        "helpers",
+        "logger",
+        "model",
+        "pyArchimate",
+        "readers",
+        "relationship",
+        "view",
+        "viewpoint",
+        "viewpoint_registry",
+        "writers",
+    }
+)
+
+__all__ = ["math", *_LAZY_ATTRS]
+
+
+def __getattr__(name: str) -> object:
+    """Resolve a public name or submodule on first access (PEP 562).
+
+    The resolved object is cached in the module globals, so later lookups are plain
+    attribute hits and never come back through here.
+    """
+    target = _LAZY_ATTRS.get(name)
+    if target is not None:
+        module_name, attr = target
+        obj = getattr(import_module(module_name, __name__), attr)
+    elif name in _SUBMODULES:
+        obj = import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    """List lazily-resolved names alongside the module globals for tab completion."""
+    return sorted({*globals(), *__all__, *_SUBMODULES})
+
+
+# Opt-in escape hatch: EAGER_IMPORT=1 resolves every public name now, so missing dependencies
+# or broken imports surface at import time (e.g. in CI) rather than on first use.
+if os.environ.get("EAGER_IMPORT", "") not in ("", "0"):
+    for _name in _LAZY_ATTRS:
+        __getattr__(_name)
@@ -8,11 +8,19 @@ No external pyArchimate imports - this is a Layer 1 base module.
 """
 
 import os
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
-import oyaml as yaml  # type: ignore[import-untyped]
+import yaml
+
+# libyaml's C parser when PyYAML was built with it; the rules file only uses plain YAML types either way
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pure-Python PyYAML build
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
 # ===== Configuration Constants =====
 
@@ -32,33 +40,25 @@ OPERATION_ERROR_MESSAGES = {
 # This is populated dynamically by loading checker_rules.yml
 ALLOWED_RELATIONSHIPS: dict[str, dict[str, list[str]]] = {}
 
-# Mapping of ARIS types to Archimate types
-ARIS_TYPE_MAP: dict[str, str] = {}
+# Flattened (source_type, target_type, relationship_key) view of ALLOWED_RELATIONSHIPS,
+# so validating a relationship is a single tuple-hash lookup
+ALLOWED_RELATIONSHIP_TRIPLES: set[tuple[str, str, str]] = set()
+
+# Mapping of ARIS types to Archimate types: filled once from checker_rules.yml and exposed read-only,
+# so the AML readers can alias it into loop locals without guarding against later mutation
+_ARIS_TYPE_MAP: dict[str, str] = {}
+ARIS_TYPE_MAP: Mapping[str, str] = MappingProxyType(_ARIS_TYPE_MAP)
 
 # Mapping of relationship keys
 RELATIONSHIP_KEYS: dict[str, str] = {}
 
-# Mapping of Archimate element categories
-ARCHI_CATEGORY: dict[str, str] = {}
-
-# Influence strength values
-INFLUENCE_STRENGTH = {
-    "+": "+",
-    "++": "++",
-    "-": "-",
-    "--": "--",
-    "0": "0",
-    "1": "1",
-    "2": "2",
-    "3": "3",
-    "4": "4",
-    "5": "5",
-    "6": "6",
-    "7": "7",
-    "8": "8",
-    "9": "9",
-    "10": "10",
-}
+# Mapping of Archimate element categories: filled once from checker_rules.yml; the public name is a read-only
+# view, so readers, writers and the derived per-type color tables can never see it change underneath them
+_ARCHI_CATEGORY: dict[str, str] = {}
+ARCHI_CATEGORY: Mapping[str, str] = MappingProxyType(_ARCHI_CATEGORY)
+
+# Influence strength values: every value maps to itself, so a set answers membership without a lookup table
+INFLUENCE_STRENGTH = frozenset({"+", "++", "-", "--", "0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10"})
 
 # Junction types (for Junction elements)
 JUNCTION_TYPES = {"and", "or", "xor"}
@@ -128,17 +128,23 @@ def _initialize_archimate_metadata():
         checker_rules_path = os.path.join(__location__, "checker_rules.yml")
 
         with open(checker_rules_path) as fd:
-            data = yaml.load(fd, Loader=yaml.Loader)
+            data = yaml.load(fd, Loader=_YamlLoader)
 
         # Populate the global dictionaries
         if "archimate_rels" in data:
             ALLOWED_RELATIONSHIPS.update(data["archimate_rels"])
+            ALLOWED_RELATIONSHIP_TRIPLES.update(
+                (src, dst, key)
+                for src, targets in data["archimate_rels"].items()
+                for dst, keys in targets.items()
+                for key in keys
+            )
         if "ARIS_type_map" in data:
-            ARIS_TYPE_MAP.update(data["ARIS_type_map"])
+            _ARIS_TYPE_MAP.update(data["ARIS_type_map"])
         if "relationship_keys" in data:
             RELATIONSHIP_KEYS.update(data["relationship_keys"])
         if "archi_category" in data:
-            ARCHI_CATEGORY.update(data["archi_category"])
+            _ARCHI_CATEGORY.update(data["archi_category"])
     except Exception as e:
         # Log but don't fail - this allows the module to load even if checker_rules.yml is missing
         print(f"Warning: Could not load Archimate metadata from checker_rules.yml: {e}")
@@ -151,6 +157,20 @@ _initialize_archimate_metadata()
 # ===== Color Utilities =====
 
 
+def _clip(value, hi):
+    """Return ``int(value)`` clamped to ``0..hi`` with plain comparisons rather than min()/max() calls."""
+    v = int(value)
+    return 0 if v < 0 else hi if v > hi else v
+
+
+# Models reuse a few colors across thousands of nodes, so each distinct hex string is decoded once;
+# the bound keeps custom per-node colors from growing the cache without limit
+@lru_cache(maxsize=256)
+def _parse_hex_rgb(color_string: str) -> tuple[int, int, int]:
+    """Return the ``(r, g, b)`` channels of a ``#RRGGBB`` string."""
+    return int(color_string[1:3], 16), int(color_string[3:5], 16), int(color_string[5:], 16)
+
+
 class RGBA:
     """Manage RGB/hex color and alpha (opacity) channels.
 
@@ -160,25 +180,26 @@ class RGBA:
     :param a: alpha channel 0-100
     """
 
+    # Built for every styled node and connection: no per-instance __dict__
+    __slots__ = ("r", "g", "b", "a")
+
     def __init__(self, r=0, g=0, b=0, a=100):
         """Initialize RGBA color with RGB values (0-255) and alpha (0-100)."""
-        self.r = max(0, min(255, int(r)))
-        self.g = max(0, min(255, int(g)))
-        self.b = max(0, min(255, int(b)))
-        self.a = max(0, min(100, int(a)))
+        self.r = _clip(r, 255)
+        self.g = _clip(g, 255)
+        self.b = _clip(b, 255)
+        self.a = _clip(a, 100)
 
     @property
     def color(self):
         """Return #RRGGBB hex string."""
-        return f"#{self.r:02x}{self.g:02x}{self.b:02x}".upper()
+        return f"#{self.r:02X}{self.g:02X}{self.b:02X}"
 
     @color.setter
     def color(self, color_string):
         """Set RGB from a #RRGGBB hex string."""
         if color_string is not None:
-            self.r = int(color_string[1:3], 16)
-            self.g = int(color_string[3:5], 16)
-            self.b = int(color_string[5:], 16)
+            self.r, self.g, self.b = _parse_hex_rgb(color_string)
 
 
 # ===== P3 Element Grouping & Visual Style Constants =====
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Any, cast
 from uuid import UUID, uuid4
 
 from .constants import ARCHI_CATEGORY, JUNCTION_TYPES, NAMED_COLORS
-from .enums import ArchiType
+from .enums import ARCHI_TYPE_NAMES, ArchiType, intern_type
 from .exceptions import ArchimateConceptTypeError
 from .viewpoint_registry import validate_viewpoint_slug
 
@@ -13,6 +13,11 @@ if TYPE_CHECKING:
     from .model import Model
 
 
+# Canonical string form of a version-4 UUID, i.e. exactly the strings for which _is_valid_uuid() is True
+_CANONICAL_UUID4_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}")
+_HEX_COLOR_RE = re.compile(r"#[0-9a-fA-F]{6}")
+
+
 def _is_valid_uuid(uuid_to_test, version=4):
     """
     Check if uuid_to_test is a valid UUID.
@@ -30,6 +35,9 @@ def _is_valid_uuid(uuid_to_test, version=4):
     False
 
     """
+    if version == 4:
+        # Fast path: the canonical v4 form is one regex match, with no UUID object or exception on failure
+        return isinstance(uuid_to_test, str) and _CANONICAL_UUID4_RE.fullmatch(uuid_to_test) is not None
     try:
         uuid_obj = UUID(uuid_to_test, version=version)
     except ValueError:
@@ -47,12 +55,15 @@ def set_id(uuid: str | None = None) -> str:
     :rtype: str
 
     """
-    _id = str(uuid4()) if (uuid is None) else uuid
-    if _is_valid_uuid(_id):
-        _id = _id.replace("-", "")
-        if not _id.startswith("id-"):
-            _id = "id-" + _id
-    return _id
+    if uuid is None:
+        return "id-" + uuid4().hex
+    # Identifiers read back from files already carry the prefix and can never match the UUID pattern
+    if uuid.startswith("id-"):
+        return uuid
+    # Same acceptance as _is_valid_uuid (canonical lowercase v4 form) without building a UUID object
+    if _CANONICAL_UUID4_RE.fullmatch(uuid):
+        return "id-" + uuid.replace("-", "")
+    return uuid
 
 
 def _normalize_color(color: str | None) -> str | None:
@@ -67,7 +78,7 @@ def _normalize_color(color: str | None) -> str | None:
         return None
     color = str(color).strip()
     if color.startswith("#"):
-        if not re.match(r"^#[0-9a-fA-F]{6}$", color):
+        if not _HEX_COLOR_RE.fullmatch(color):
             raise ValueError(f"Invalid hex color: {color} (expected #RRGGBB)")
         return color.lower()
     named = NAMED_COLORS.get(color.lower())
@@ -145,7 +156,7 @@ class Element:
     def __init__(self, elem_type=None, name=None, uuid=None, desc=None, folder=None, parent=None, profile=None):
         """Initialize an ArchiMate element with type, name, and parent model."""
         # Check validity of arguments according to Archimate standard
-        if elem_type is None or not hasattr(ArchiType, elem_type):
+        if elem_type is None or elem_type not in ARCHI_TYPE_NAMES:
             raise ArchimateConceptTypeError(f"Invalid Element type '{elem_type}'")
         if ARCHI_CATEGORY[elem_type] == "Relationship":
             raise ArchimateConceptTypeError(f"Element type '{elem_type}' cannot be a Relationship type")
@@ -157,7 +168,7 @@ class Element:
         self.parent: Model = cast("Model", parent)
         self.model: Model = cast("Model", parent)
         self.name: str | None = name
-        self._type: str | None = elem_type
+        self._type: str | None = intern_type(elem_type)
         self.desc: str | None = desc
         self.folder: str | None = folder
         self._properties: dict[str, object] = {}
@@ -168,14 +179,14 @@ class Element:
         self._visual_style: dict[str, Any] = {}
 
     def _delete_view_refs(self, _id: str) -> None:
-        for n in self.parent.nodes_dict.copy().values():
-            if n.ref == _id:
-                n.delete()
-                del n
-        for r in self.parent.rels_dict.copy().values():
-            if r.source.uuid == _id or r.target.uuid == _id:
-                r.delete()
-                del r
+        # Collect only the affected items before mutating, rather than snapshotting the whole dicts;
+        # endpoints are compared on the stored ids, so no source/target object is resolved per relationship
+        nodes = [n for n in self.parent.nodes_dict.values() if n.ref == _id]
+        for n in nodes:
+            n.delete()
+        rels = [r for r in self.parent.rels_dict.values() if r._source == _id or r._target == _id]
+        for r in rels:
+            r.delete()
 
     def _orphan_children(self, _id: str) -> None:
         for child_uuid in self.parent._element_children.get(_id, set()).copy():
@@ -214,6 +225,7 @@ class Element:
 
         if _id in self.parent.elems_dict:
             del self.parent.elems_dict[_id]
+            self.parent._elements_by_type.get(self._type, {}).pop(_id, None)
 
     @property
     def uuid(self) -> str:
@@ -249,7 +261,13 @@ class Element:
         if value is not None:
             if value not in ARCHI_CATEGORY or ARCHI_CATEGORY[value] == "Relationship":
                 raise ValueError("Invalid Archimate element type")
-            self._type = value
+            old_type = self._type
+            self._type = intern_type(value)
+            # Move the element to its new bucket in the model's type index, keeping the model's order
+            by_type = getattr(self.parent, "_elements_by_type", None)
+            if by_type is not None and self._uuid in by_type.get(old_type, {}):
+                del by_type[old_type][self._uuid]
+                self.parent._rebuild_type_bucket(self._type)
 
     @property
     def profile_name(self):
@@ -332,7 +350,7 @@ class Element:
         :rtype: str
         """
         if value is None:
-            return self._properties[key] if key in self._properties else None
+            return self._properties.get(key)
         else:
             self._properties[key] = value
             return value
@@ -345,13 +363,26 @@ class Element:
         :type key: str
 
         """
-        if key in self._properties:
-            del self._properties[key]
+        self._properties.pop(key, None)
+
+    def update_props(self, props):
+        """
+        Method to set several element properties at once
+
+        Use it rather than repeated prop() calls when importing many properties
+
+        :param props:   Property keys and values
+        :type props: dict
+        """
+        self._properties.update(props)
 
     def _merge_properties_and_desc(self, elem: "Element") -> None:
-        for key, val in elem.props.items():
-            if key not in self.props:
-                self.prop(key, val)
+        # Properties are merged straight into this element's dict: the merged element is deleted afterwards,
+        # so its values are taken over without copies; existing keys win and None values are skipped as prop() does
+        own = self._properties
+        for key, val in elem._properties.items():
+            if val is not None and key not in own:
+                own[key] = val
         if elem.desc != self.desc:
             self.desc = (self.desc or "") + "\n----\n" + (elem.desc or "")
 
@@ -373,20 +404,34 @@ class Element:
         if merge_props:
             self._merge_properties_and_desc(elem)
 
-        # Re-assign othe element related node references to this element (merge target)
-        for n in [self.model.nodes_dict[x] for x in self.model.nodes_dict if self.model.nodes_dict[x].ref == elem.uuid]:
-            n.ref = self.uuid
+        merged_id = elem.uuid
+        # Re-assign other element related node references to this element (merge target)
+        for n in self.model.nodes_dict.values():
+            if n.ref == merged_id:
+                n.ref = self.uuid
 
-        # Re-assign other element inboud and outbound relationship references to this element
-        for r in self.model.filter_relationships(lambda x: x.target is not None and x.target.uuid == elem.uuid):
-            r.target = self
-
-        for r in self.model.filter_relationships(lambda x: x.source is not None and x.source.uuid == elem.uuid):
-            r.source = self
+        # Re-assign other element inbound and outbound relationship references to this element in a single
+        # pass over the relationship index, matching the stored endpoint ids rather than resolving endpoints
+        for r in self.model.rels_dict.values():
+            if r._target == merged_id:
+                r.target = self
+            if r._source == merged_id:
+                r.source = self
 
         # finally delete the merged element
         elem.delete()
 
+    def _endpoint_rels(self, rel_type, inbound: bool, outbound: bool) -> list:
+        # Single pass over the relationship index matching the stored endpoint ids, as merge() does,
+        # instead of resolving both endpoint objects of every relationship through a predicate callback
+        _id = self.uuid
+        return [
+            r
+            for r in self.model.rels_dict.values()
+            if ((inbound and r._target == _id) or (outbound and r._source == _id))
+            and (rel_type is None or r.type == rel_type)
+        ]
+
     def in_rels(self, rel_type=None):
         """
         Method to get a list of the inbound relationships
@@ -397,12 +442,7 @@ class Element:
         :rtype: list
 
         """
-        if rel_type is None:
-            return self.model.filter_relationships(lambda x: x.target is not None and x.target.uuid == self.uuid)
-        else:
-            return self.model.filter_relationships(
-                lambda x: x.target is not None and x.target.uuid == self.uuid and x.type == rel_type
-            )
+        return self._endpoint_rels(rel_type, inbound=True, outbound=False)
 
     def out_rels(self, rel_type=None):
         """
@@ -414,12 +454,7 @@ class Element:
         :rtype: list
 
         """
-        if rel_type is None:
-            return self.model.filter_relationships(lambda x: x.source is not None and x.source.uuid == self.uuid)
-        else:
-            return self.model.filter_relationships(
-                lambda x: x.source is not None and x.source.uuid == self.uuid and x.type == rel_type
-            )
+        return self._endpoint_rels(rel_type, inbound=False, outbound=True)
 
     def rels(self, rel_type=None):
         """
@@ -431,23 +466,7 @@ class Element:
         :return:         [Relationship]
         :rtype: list
         """
-        if rel_type is None:
-            return self.model.filter_relationships(
-                lambda x: (
-                    (x.target is not None and x.target.uuid == self.uuid)
-                    or (x.source is not None and x.source.uuid == self.uuid)
-                )
-            )
-        else:
-            return self.model.filter_relationships(
-                lambda x: (
-                    (
-                        (x.target is not None and x.target.uuid == self.uuid)
-                        or (x.source is not None and x.source.uuid == self.uuid)
-                    )
-                    and x.type == rel_type
-                )
-            )
+        return self._endpoint_rels(rel_type, inbound=True, outbound=True)
 
     def remove_folder(self):
         """
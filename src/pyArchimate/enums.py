@@ -7,6 +7,7 @@ including element types, relationship types, and UI-related enumerations.
 No external pyArchimate imports - this is a Layer 1 base module.
 """
 
+import sys
 from enum import Enum
 
 
@@ -181,3 +182,26 @@ class ArchiType(str, Enum):
 
     # Special
     View = "View"
+
+
+# Member names of ArchiType, for O(1) type validation; ``hasattr(ArchiType, name)`` walks the class MRO
+# on every call and also accepts non-member attributes such as ``name`` or ``upper``
+ARCHI_TYPE_NAMES: frozenset[str] = frozenset(ArchiType.__members__)
+
+
+def intern_type(value):
+    """
+    Return an ArchiMate concept type name as an interned plain ``str``.
+
+    Types come from a closed vocabulary, so interning lets every element and relationship share one
+    string per type instead of each keeping the copy its reader parsed. ``ArchiType`` members are
+    unwrapped to their value; anything that is not a string is returned unchanged for the caller to reject.
+
+    :param value: concept type name or ``ArchiType`` member
+    :type value: str
+    :return: interned type name
+    :rtype: str
+    """
+    if isinstance(value, Enum):
+        value = value.value
+    return sys.intern(value) if type(value) is str else value
@@ -5,6 +5,7 @@ import os
 import sys
 import zipfile
 from collections import defaultdict, deque
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 import lxml.etree as et
@@ -17,7 +18,7 @@ from .constants import (
     OPERATION_ERROR_MESSAGES,
 )
 from .element import Element, set_id
-from .enums import ArchiType
+from .enums import ArchiType, intern_type
 from .exceptions import ArchimateConceptTypeError
 from .logger import log
 from .view import Node, Profile, View
@@ -30,6 +31,9 @@ __mod__ = __name__.split(".")[-1]
 
 ARCHIMATE_EXCEPTION_GROUP = (ArchimateConceptTypeError,)
 
+# Stateless, so one decoder serves every embedded properties block
+_JSON_DECODER = json.JSONDecoder()
+
 
 def _matches_rel(r: Any, rel_type: str | None, elem_uuid: str, wants_in: bool, wants_out: bool) -> bool:
     if wants_in and r.target.uuid == elem_uuid:
@@ -45,6 +49,10 @@ def _find_props_block(text: str) -> tuple[int, int, dict[str, Any]] | None:
     Uses json.JSONDecoder.raw_decode instead of a backtracking regex (S5852).
     Returns (block_start, block_end, parsed_dict) or None.
     """
+    # Every marker variant contains "properties": one linear scan settles the common no-block case
+    # before the four marker searches below
+    if "properties" not in text:
+        return None
     for prefix in ("", "#"):
         for sep in (" = ", "="):
             marker = prefix + "properties" + sep
@@ -55,7 +63,7 @@ def _find_props_block(text: str) -> tuple[int, int, dict[str, Any]] | None:
             if brace == -1:
                 continue
             try:
-                parsed, length = json.JSONDecoder().raw_decode(text, brace)
+                parsed, length = _JSON_DECODER.raw_decode(text, brace)
                 return idx, brace + length, parsed
             except json.JSONDecodeError:  # noqa: S110
                 pass
@@ -68,6 +76,10 @@ def _strip_props_block(text: str) -> str:
     if result is None:
         return text
     start, end, _ = result
+    return _cut_props_block(text, start, end)
+
+
+def _cut_props_block(text: str, start: int, end: int) -> str:
     return (text[:start] + text[end:].lstrip(";")).strip()
 
 
@@ -82,8 +94,7 @@ def _embed_object(o: Any, remove_props: bool) -> None:
         desc += desc.strip(" \n") + "\n\nproperties = " + json.dumps(o.props, indent=2) + "\n"
         o.desc = desc
         if remove_props:
-            for x in o.props.copy():
-                o.remove_prop(x)
+            o.props.clear()
 
 
 def _apply_rel_identity_props(o: Any, p: Any) -> None:
@@ -117,8 +128,9 @@ def _expand_element(o: Any, clean_doc: bool) -> None:
         return
     result = _find_props_block(o.desc)
     if result is not None:
-        _, _, props = result
-        o.desc = _strip_props_block(o.desc)
+        start, end, props = result
+        # The block was just located and parsed: cut it out directly instead of parsing it a second time
+        o.desc = _cut_props_block(o.desc, start, end)
         for key, val in props.items():
             o.prop(key, val)
     if clean_doc:
@@ -134,17 +146,10 @@ def _expand_object(o: Any, clean_doc: bool) -> None:
         _expand_element(o, clean_doc)
 
 
-def default_color(elem_type: str, theme: Any = DEFAULT_THEME) -> str:
-    """
-    Get the default color of a Node, according to its type
-
-    :param elem_type:       archimate element type
-    :type elem_type: str
-    :param theme:  'archi' or 'aris' color theme - default = 'archi'
-    :type theme: str
-    :return: #Hex color str
-    """
-    default_colors = {
+_OTHER_COLOR = "#FFFFFF"
+# Built-in theme palettes, read-only so the per-type tables derived from them below cannot drift out of sync
+_ARCHI_COLORS = MappingProxyType(
+    {
         "strategy": "#F5DEAA",
         "business": "#FFFFB5",
         "application": "#B5FFFF",
@@ -154,10 +159,12 @@ def default_color(elem_type: str, theme: Any = DEFAULT_THEME) -> str:
         "implementation & migration": "#FFE0E0",
         "motivation": "#CCCCFF",
         "relationship": "#DDDDDD",
-        "other": "#FFFFFF",
+        "other": _OTHER_COLOR,
         "junction": "#000000",
     }
-    aris_colors = {
+)
+_ARIS_COLORS = MappingProxyType(
+    {
         "strategy": "#D38300",
         "business": "#F5C800",
         "application": "#00A0FF",
@@ -167,23 +174,38 @@ def default_color(elem_type: str, theme: Any = DEFAULT_THEME) -> str:
         "implementation & migration": "#FFE0E0",
         "motivation": "#F099FF",
         "relationship": "#DDDDDD",
-        "other": "#FFFFFF",
+        "other": _OTHER_COLOR,
         "junction": "#000000",
     }
-    if elem_type in ARCHI_CATEGORY:
-        cat = ARCHI_CATEGORY[elem_type].lower()
-        cat = cat.split(" & ")[0].split("-")[0]
-
-        if theme == "archi" or theme is None:
-            return default_colors.get(cat, default_colors["other"])
-        if theme == "aris":
-            return aris_colors.get(cat, aris_colors["other"])
-        else:
-            try:
-                return str(theme[cat])
-            except (KeyError, TypeError):
-                return default_colors.get(cat, default_colors["other"])
-    return default_colors["other"]
+)
+# Element type -> theme key, and -> color for each built-in theme, resolved once from the categories
+# loaded with the constants module: the common default_color() call is a single dict lookup
+_THEME_KEY_BY_TYPE = {t: c.lower().split(" & ")[0].split("-")[0] for t, c in ARCHI_CATEGORY.items()}
+_ARCHI_COLOR_BY_TYPE = {t: _ARCHI_COLORS.get(k, _OTHER_COLOR) for t, k in _THEME_KEY_BY_TYPE.items()}
+_ARIS_COLOR_BY_TYPE = {t: _ARIS_COLORS.get(k, _OTHER_COLOR) for t, k in _THEME_KEY_BY_TYPE.items()}
+
+
+def default_color(elem_type: str, theme: Any = DEFAULT_THEME) -> str:
+    """
+    Get the default color of a Node, according to its type
+
+    :param elem_type:       archimate element type
+    :type elem_type: str
+    :param theme:  'archi' or 'aris' color theme - default = 'archi'
+    :type theme: str
+    :return: #Hex color str
+    """
+    if theme == "archi" or theme is None:
+        return _ARCHI_COLOR_BY_TYPE.get(elem_type, _OTHER_COLOR)
+    if theme == "aris":
+        return _ARIS_COLOR_BY_TYPE.get(elem_type, _OTHER_COLOR)
+    key = _THEME_KEY_BY_TYPE.get(elem_type)
+    if key is None:
+        return _OTHER_COLOR
+    try:
+        return str(theme[key])
+    except (KeyError, TypeError):
+        return _ARCHI_COLOR_BY_TYPE[elem_type]
 
 
 class Model:
@@ -230,6 +252,8 @@ class Model:
     :type uuid: str
     :param desc:    Model documentation
     :type desc: str
+    :param props:   Initial model properties, e.g. ``Model('EA', author='X. Mayeur', version='1.0')``
+    :type props: dict
 
     :returns: Model object
     :rtype: Model
@@ -267,12 +291,12 @@ class Model:
 
     """
 
-    def __init__(self, name=None, uuid=None, desc=None):
-        """Initialize an ArchiMate model with name and description."""
+    def __init__(self, name=None, uuid=None, desc=None, **props):
+        """Initialize an ArchiMate model with name, description and optional properties."""
         self._uuid = set_id(uuid)
         self.name = name
         self.desc = desc
-        self._properties = {}
+        self._properties = props
         self.pdefs = {}
         self._profiles_dict = {}
         self.elems_dict = {}
@@ -283,6 +307,7 @@ class Model:
         self.labels_dict = {}
         self.orgs = defaultdict(list)
         self.theme = "archi"
+        self._elements_by_type: dict[str, dict[str, Element]] = {}  # type → {uuid: Element}, in insertion order
         self._viewpoint_elements: dict[str, set[str]] = {}  # slug → set of element UUIDs
         self._viewpoint_views: dict[str, str] = {}  # view UUID → primary viewpoint slug
         self._element_hierarchy: dict[str, str | None] = {}  # child_uuid → parent_uuid
@@ -320,7 +345,14 @@ class Model:
             return v
         else:
             _e = Element(concept_type, name, uuid, desc, folder, parent=self, profile=profile)
+            replaced = self.elems_dict.get(_e.uuid)
             self.elems_dict[_e.uuid] = _e
+            if replaced is not None and replaced.type != _e.type:
+                self._elements_by_type.get(replaced.type, {}).pop(_e.uuid, None)
+                # The id keeps its place in elems_dict, so the new type bucket is rebuilt around it
+                self._rebuild_type_bucket(_e.type)
+            else:
+                self._elements_by_type.setdefault(_e.type, {})[_e.uuid] = _e
             return _e
 
     def add_relationship(
@@ -461,7 +493,7 @@ class Model:
         :rtype: str
         """
         if value is None:
-            return self._properties[key] if key in self._properties else None
+            return self._properties.get(key)
         else:
             self._properties[key] = value
             return value
@@ -474,8 +506,18 @@ class Model:
         :type key: str
 
         """
-        if key in self._properties:
-            del self._properties[key]
+        self._properties.pop(key, None)
+
+    def update_props(self, props):
+        """
+        Method to set several model properties at once
+
+        Use it rather than repeated prop() calls, or for keys that are not valid Python identifiers
+
+        :param props:   Property keys and values
+        :type props: dict
+        """
+        self._properties.update(props)
 
     @property
     def views(self):
@@ -595,10 +637,14 @@ class Model:
             >>> content = Model._extract_xml_from_zip("model.archimate")
             >>> assert content.startswith("<?xml")
         """
+        with zipfile.ZipFile(file_path, "r") as zf:
+            return Model._read_model_xml(zf, file_path)
+
+    @staticmethod
+    def _read_model_xml(zf: zipfile.ZipFile, file_path: str) -> str:
         try:
-            with zipfile.ZipFile(file_path, "r") as zf:
-                with zf.open("model.xml") as xml_file:
-                    return xml_file.read().decode("utf-8")
+            with zf.open("model.xml") as xml_file:
+                return xml_file.read().decode("utf-8")
         except KeyError as e:
             raise KeyError(f"Invalid .archimate file - model.xml not found in archive: {file_path}") from e
 
@@ -621,16 +667,23 @@ class Model:
         """
         try:
             with zipfile.ZipFile(file_path, "r") as zf:
-                # Extract all files in images/ folder
-                for file_info in zf.filelist:
-                    if file_info.filename.startswith("images/") and not file_info.is_dir():
-                        # Extract image data
-                        image_data = zf.read(file_info.filename)
-                        self._images_dict[file_info.filename] = image_data
-                        self._image_files.append(file_info.filename)
+                self._read_images(zf)
+        except zipfile.BadZipFile as e:
+            # Images are optional - skip if extraction fails
+            log.debug("Failed to extract images from archive: %s", e)
+
+    def _read_images(self, zf: zipfile.ZipFile) -> None:
+        try:
+            # Extract all files in images/ folder
+            for file_info in zf.filelist:
+                if file_info.filename.startswith("images/") and not file_info.is_dir():
+                    # Extract image data
+                    image_data = zf.read(file_info)
+                    self._images_dict[file_info.filename] = image_data
+                    self._image_files.append(file_info.filename)
         except (zipfile.BadZipFile, KeyError) as e:
             # Images are optional - skip if extraction fails
-            log.debug(f"Failed to extract images from archive: {e}")
+            log.debug("Failed to extract images from archive: %s", e)
 
     def _load_file_contents(self, file_path, operation):
         """Load file contents with automatic ZIP/XML format detection.
@@ -652,9 +705,11 @@ class Model:
             # Detect and handle ZIP archives (.archimate format)
             if self._detect_zip_file(file_path):
                 try:
-                    # Extract images from archive (for round-trip preservation)
-                    self._extract_images_from_zip(file_path)
-                    return self._extract_xml_from_zip(file_path)
+                    # One pass over the archive's central directory serves both the images and model.xml
+                    with zipfile.ZipFile(file_path, "r") as zf:
+                        # Extract images from archive (for round-trip preservation)
+                        self._read_images(zf)
+                        return self._read_model_xml(zf, file_path)
                 except zipfile.BadZipFile:
                     log.error(
                         f"{__mod__} {self.__class__.__name__}.{operation}: Invalid .archimate file - ZIP archive is corrupted: '{file_path}'"
@@ -690,7 +745,9 @@ class Model:
         data = self._load_file_contents(file_path, operation)
 
         if data != "":
-            parser = et.XMLParser(recover=True)
+            # huge_tree lifts libxml2's 10 MB text-node cap: long documentation would otherwise be cut short,
+            # and silently so under recover=True
+            parser = et.XMLParser(recover=True, huge_tree=True)
             root = et.fromstring(data.encode(), parser=parser)
             entry = self._match_reader_entry(root.tag)
 
@@ -751,6 +808,11 @@ class Model:
         """
         return [x for x in self.elems_dict.values() if fct(x)]
 
+    def _rebuild_type_bucket(self, elem_type: str) -> None:
+        # Only needed when an existing element changes type (rare): rebuilding from elems_dict keeps
+        # find_elements(elem_type=...) in the same order as elems_dict instead of appending the retyped element
+        self._elements_by_type[elem_type] = {uuid: e for uuid, e in self.elems_dict.items() if e.type == elem_type}
+
     def find_elements(self, name=None, elem_type=None):
         """
         Method to find elements by name or type or both
@@ -762,12 +824,14 @@ class Model:
         :return: list(Element)
         :rtype: list
         """
-        if name and not elem_type:
+        if elem_type:
+            # Type lookups only walk the elements of that type, via the index maintained by add/delete
+            candidates = self._elements_by_type.get(intern_type(elem_type), {}).values()
+            if name:
+                return [e for e in candidates if e.name == name]
+            return list(candidates)
+        elif name:
             return [e for e in self.elems_dict.values() if e.name == name]
-        elif elem_type and not name:
-            return [e for e in self.elems_dict.values() if e.type == elem_type]
-        elif elem_type and name:
-            return [e for e in self.elems_dict.values() if e.name == name and e.type == elem_type]
         else:
             return list(self.elems_dict.values())
 
@@ -985,12 +1049,7 @@ class Model:
         """
         Method to check the validity of a list of connections
         """
-        invalids = []
-
-        for conn_id, c in self.conns_dict.items():
-            if not self.check_connection(c):
-                invalids.append(conn_id)
-        return invalids
+        return [conn_id for conn_id, c in self.conns_dict.items() if not self.check_connection(c)]
 
     def check_invalid_relationships(self):
         """
@@ -1006,11 +1065,11 @@ class Model:
         """
         from .relationship import check_valid_relationship  # noqa: PLC0415  # circular: model↔relationship init cycle
 
-        invalids = []
-        for rel_id, r in self.rels_dict.items():
-            if not check_valid_relationship(r.type, r.source.type, r.target.type):
-                invalids.append(rel_id)
-        return invalids
+        return [
+            rel_id
+            for rel_id, r in self.rels_dict.items()
+            if not check_valid_relationship(r.type, r.source.type, r.target.type)
+        ]
 
     def _check_connection_refs(self, c: Any) -> bool:
         _ok = True
@@ -1306,7 +1365,7 @@ class Model:
         if parent_uuid is None:
             return []
         siblings = self._element_children.get(parent_uuid, set())
-        return [e for e in [self.elems_dict[uuid] for uuid in siblings] if e.uuid != elem_uuid]
+        return [self.elems_dict[uuid] for uuid in siblings if uuid != elem_uuid]
 
     def find_by_hierarchy_path(self, path: str) -> list[Element]:
         """Find elements by hierarchy path (e.g., '/parent/child/element').
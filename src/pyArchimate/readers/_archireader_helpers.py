@@ -1,5 +1,6 @@
 """Private helpers extracted from archiReader to reduce cognitive complexity (S3776)."""
 
+import sys
 from typing import Any
 
 try:
@@ -8,8 +9,6 @@ try:
     from ..helpers.parsing import parse_bool
     from ..view import Node, Point, View
 except ImportError:
-    import sys
-
     sys.path.insert(0, "..")
     from pyArchimate import (  # type: ignore[no-redef,attr-defined]
         AccessType,
@@ -22,6 +21,13 @@ except ImportError:
     )
 
 
+def _prop_key(prop: Any) -> Any:
+    # Property keys repeat on every concept of a model; interning keeps one shared string per distinct key
+    # instead of the copy lxml allocates for each attribute read
+    key = prop.get("key")
+    return sys.intern(key) if key is not None else None
+
+
 def _handle_diagram_object(parent: Any, child: Any) -> Any:
     node = parent.add(ref=child.get("archimateElement"), uuid=child.get("id"))
     if node is not None:
@@ -29,7 +35,7 @@ def _handle_diagram_object(parent: Any, child: Any) -> Any:
             if node.concept.prop("label") is not None:
                 node.label_expression = str(node.concept.prop("label"))
         except Exception as e:
-            log.debug(f"Failed to set label expression for node {getattr(node, 'uuid', None)}: {e}")
+            log.debug("Failed to set label expression for node %s: %s", getattr(node, "uuid", None), e)
     return node
 
 
@@ -110,7 +116,7 @@ def get_node(tag: Any, parent: Any, xsi: str) -> None:
     for child in tag.findall("child"):
         node, type_n = _parse_node_type(parent, child, xsi)
         if node is None:
-            log.warning(f"Invalid node {child.get('id')} with type {type_n}")
+            log.warning("Invalid node %s with type %s", child.get("id"), type_n)
             continue
         _parse_node_attributes(node, child, parent)
         get_node(child, node, xsi)
@@ -147,12 +153,12 @@ def _resolve_bp_coords(bp: Any, source_node: Any, target_node: Any) -> tuple[int
 def _parse_connection(sc: Any, parent: View) -> None:
     ref = sc.get("archimateRelationship")
     if ref not in parent.model.rels_dict:
-        log.debug(f"Unknown connection ref {ref}")
+        log.debug("Unknown connection ref %s", ref)
         return
     try:
         conn = parent.add_connection(ref=ref, source=sc.get("source"), target=sc.get("target"), uuid=sc.get("id"))
     except (ValueError, KeyError) as exc:
-        log.warning(f"Skipping connection {sc.get('id')}: {exc}")
+        log.warning("Skipping connection %s: %s", sc.get("id"), exc)
         return
     if sc.get("fontColor") is not None:
         conn.font_color = sc.get("fontColor")
@@ -216,7 +222,7 @@ def _parse_rel_attributes(elem: Any, e: Any) -> None:
     if doc is not None:
         elem.desc = doc.text
     for p in e.findall("property"):
-        elem.prop(p.get("key"), p.get("value"))
+        elem.prop(_prop_key(p), p.get("value"))
 
 
 def _process_viewpoint_property(elem: Any, slug: str) -> None:
@@ -228,12 +234,12 @@ def _process_viewpoint_property(elem: Any, slug: str) -> None:
     if get_viewpoint(slug) is not None:
         elem.assign_viewpoint(slug)
     else:
-        log.warning(f"Unknown viewpoint slug '{slug}' ignored during import")
+        log.warning("Unknown viewpoint slug '%s' ignored during import", slug)
 
 
 def _process_property(elem: Any, prop: Any) -> None:
     """Process element property, handling viewpoint assignment or visual style restoration."""
-    key = prop.get("key")
+    key = _prop_key(prop)
     if key == "viewpoint":
         slug = (prop.get("value") or "").strip().lower()
         if slug:
@@ -340,7 +346,7 @@ def _retry_unresolved_rels(unresolved: list[Any], model: Any, merge_flg: bool) -
             break
         unresolved = still_unresolved
     for e, _type_e, _folder in still_unresolved:
-        log.debug(f"Unable to resolve relationship {e.get('id')}: endpoints not found")
+        log.debug("Unable to resolve relationship %s: endpoints not found", e.get("id"))
 
 
 def get_folders_rel(
@@ -380,7 +386,7 @@ def get_folders_view(tag: Any, model: Any, xsi: str, folder_path: str = "") -> N
         if doc is not None:
             elem.desc = doc.text
         for p in e.findall("property"):
-            elem.prop(p.get("key"), p.get("value"))
+            elem.prop(_prop_key(p), p.get("value"))
         # Read view-level primary viewpoint from 'viewpoint' XML attribute
         vp_attr = (e.get("viewpoint") or "").strip().lower()
         if vp_attr:
@@ -391,7 +397,7 @@ def get_folders_view(tag: Any, model: Any, xsi: str, folder_path: str = "") -> N
             if get_viewpoint(vp_attr) is not None:
                 elem.set_primary_viewpoint(vp_attr)
             else:
-                log.warning(f"Unknown viewpoint slug '{vp_attr}' on view ignored")
+                log.warning("Unknown viewpoint slug '%s' on view ignored", vp_attr)
         get_node(e, elem, xsi)
         get_connection(e, elem)
     for f in tag.findall("folder"):
@@ -3,10 +3,13 @@
 import ctypes
 import platform
 import sys
+from collections.abc import Iterable, Iterator
+from functools import cache, lru_cache
 from typing import Any, cast
 
 try:
     from ..constants import ARIS_TYPE_MAP as ARIS_type_map  # noqa: N811  # alias matches public API export name
+    from ..element import Element
     from ..enums import ArchiType, TextAlignment
     from ..exceptions import ArchimateConceptTypeError, ArchimateRelationshipError
     from ..helpers.logging import log
@@ -20,6 +23,7 @@ except ImportError:
         ArchimateRelationshipError,
         ArchiType,
         ARIS_type_map,
+        Element,
         Model,
         Node,
         Point,
@@ -43,57 +47,89 @@ _FONT_SEARCH_PATHS = [
 ]
 
 
-def get_text_size(text: str, points: int, font: str) -> tuple[float, float]:
-    """Calculate text dimensions for given font and size (platform-dependent)."""
-    if platform.system() == "Windows":
-
-        class SIZE(ctypes.Structure):
-            """Windows API SIZE structure for text dimensions."""
-
-            _fields_ = [("cx", ctypes.c_long), ("cy", ctypes.c_long)]
-
-        hdc = ctypes.windll.user32.GetDC(0)  # type: ignore[attr-defined]
-        hfont = ctypes.windll.gdi32.CreateFontA(  # type: ignore[attr-defined]
-            points, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, font
-        )
-        hfont_old = ctypes.windll.gdi32.SelectObject(hdc, hfont)  # type: ignore[attr-defined]
-        size = SIZE(0, 0)
-        ctypes.windll.gdi32.GetTextExtentPoint32A(  # type: ignore[attr-defined]
-            hdc, text, len(text), ctypes.byref(size)
-        )
-        ctypes.windll.gdi32.SelectObject(hdc, hfont_old)  # type: ignore[attr-defined]
-        ctypes.windll.gdi32.DeleteObject(hfont)  # type: ignore[attr-defined]
-        return size.cx, size.cy
-    else:
-        from PIL import (
-            ImageFont,  # noqa: PLC0415  # optional dependency: PIL only available at call time on non-Windows
-        )
-
-        for path in _FONT_SEARCH_PATHS:
-            try:
-                fnt = ImageFont.truetype(path, points)
-                bbox = fnt.getbbox(text)
-                return bbox[2] - bbox[0], bbox[3] - bbox[1]
-            except OSError:
-                continue
+class _SIZE(ctypes.Structure):
+    """Windows API SIZE structure for text dimensions."""
+
+    _fields_ = [("cx", ctypes.c_long), ("cy", ctypes.c_long)]
+
+
+@cache
+def _win_screen_dc() -> int:
+    return ctypes.windll.user32.GetDC(0)  # type: ignore[attr-defined]
+
+
+@cache
+def _win_font(points: int, font: str) -> int:
+    # One GDI font handle per (points, font), kept for the life of the process
+    return ctypes.windll.gdi32.CreateFontW(points, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, font)  # type: ignore[attr-defined]
+
+
+def _get_text_size_windows(text: str, points: int, font: str) -> tuple[float, float]:
+    # Wide-char (W) entry points take the str as-is: ctypes passes it as UTF-16, which the
+    # ANSI (A) variants misread, and no ASCII/ANSI re-encoding of every label is needed
+    hdc = _win_screen_dc()
+    ctypes.windll.gdi32.SelectObject(hdc, _win_font(points, font))  # type: ignore[attr-defined]
+    size = _SIZE(0, 0)
+    ctypes.windll.gdi32.GetTextExtentPoint32W(hdc, text, len(text), ctypes.byref(size))  # type: ignore[attr-defined]
+    return size.cx, size.cy
+
+
+@cache
+def _pil_font(points: int) -> Any:
+    from PIL import (
+        ImageFont,  # noqa: PLC0415  # optional dependency: PIL only available at call time on non-Windows
+    )
+
+    for path in _FONT_SEARCH_PATHS:
+        try:
+            return ImageFont.truetype(path, points)
+        except OSError:
+            continue
+    return None
+
+
+def _get_text_size_pil(text: str, points: int, font: str) -> tuple[float, float]:
+    fnt = _pil_font(points)
+    if fnt is None:
         # Fallback: approximate with a character-count heuristic
         return len(text) * points * 0.6, float(points)
+    bbox = fnt.getbbox(text)
+    return bbox[2] - bbox[0], bbox[3] - bbox[1]
+
+
+# The platform is resolved once at import instead of on every label measurement
+_TEXT_SIZE_IMPL = _get_text_size_windows if platform.system() == "Windows" else _get_text_size_pil
+
+
+@lru_cache(maxsize=4096)
+def get_text_size(text: str, points: int, font: str) -> tuple[float, float]:
+    """Calculate text dimensions for given font and size (platform-dependent)."""
+    return _TEXT_SIZE_IMPL(text, points, font)
 
 
+@lru_cache(maxsize=65536)
 def id_of(_id: str) -> str:
     """Convert ARIS ID to normalized format."""
-    if "." in _id:
-        return "id-" + _id.split(".")[1]
+    # Memoised: each ID is resolved once per pass (elements, relationships, views, labels)
+    _, dot, rest = _id.partition(".")
+    if dot:
+        return "id-" + rest.partition(".")[0]
     return "id-" + _id
 
 
+def _attr_text(attr: Any) -> str:
+    """Concatenate the PlainText values of an AttrDef, one line each."""
+    # A plain iter() walk: measured faster than a precompiled XPath for these small subtrees
+    return "".join(v.get("TextValue") + "\n" for v in attr.iter("PlainText"))
+
+
 def _parse_aris_attrs(elem: Any) -> tuple[str | None, str | None, dict[str, str]]:
     name: str | None = None
     desc: str | None = None
     props: dict[str, str] = {}
-    for attr in elem.findall("AttrDef"):
+    for attr in elem.iterchildren("AttrDef"):
         key = attr.attrib[_ATTRDEF_TYPE]
-        val = "".join(v.get("TextValue") + "\n" for v in attr.iter("PlainText"))
+        val = _attr_text(attr)
         if key == "AT_NAME":
             name = val
         elif key == "AT_DESC":
@@ -104,80 +140,118 @@ def _parse_aris_attrs(elem: Any) -> tuple[str | None, str | None, dict[str, str]
 
 
 def _parse_objdef(o: Any, model: Model, folder: str) -> None:
-    if "SymbolNum" not in o.attrib:
+    symbol = o.get("SymbolNum")
+    if symbol is None:
         return
-    o_type = ARIS_type_map[o.attrib["SymbolNum"]]
+    o_type = ARIS_type_map[symbol]
     if o_type == "":
         return
-    guid = o.find("GUID").text
     o_uuid = id_of(o.attrib["ObjDef.ID"])
     o_name, o_desc, props = _parse_aris_attrs(o)
-    props["GUID"] = guid
+    guid = o.findtext("GUID")
+    if guid is not None:
+        props["GUID"] = guid
     elem = model.add(concept_type=o_type, name=o_name, desc=o_desc, uuid=o_uuid, folder=folder)
-    for k, v in props.items():
-        elem.prop(k, v)
+    elem.update_props(props)
 
 
-def parse_elements(group: Any, root: Any, model: Model, folder: str = "") -> None:
-    """Recursively parse and add elements from ARIS model hierarchy."""
-    if group is None:
-        group = root
-    for g in group.findall("Group"):
+def _child_groups(group: Any, folder: str) -> list[tuple[Any, str]]:
+    # Each group's folder string is built once here, in one join, and shared by everything under it
+    children = []
+    for g in group.iterchildren("Group"):
         a = g.find("AttrDef")
-        old_folder = folder
-        if a is not None:
-            for n in a.iter("PlainText"):
-                folder += "/" + n.get("TextValue")
-        for o in g.findall("ObjDef"):
+        if a is None:
+            children.append((g, folder))
+        else:
+            children.append((g, folder + "".join("/" + n.get("TextValue") for n in a.iter("PlainText"))))
+    return children
+
+
+def iter_groups(group: Any, folder: str = "") -> Iterator[tuple[Any, str]]:
+    """Yield every Group nested below ``group`` in document order, with its folder path."""
+    # Explicit stack rather than recursion: deep ARIS folder trees cost no nested generator
+    # frames and cannot hit the recursion limit
+    stack = _child_groups(group, folder)[::-1]
+    while stack:
+        g, g_folder = stack.pop()
+        yield g, g_folder
+        stack.extend(reversed(_child_groups(g, g_folder)))
+
+
+def add_group_elements(groups: Iterable[tuple[Any, str]], model: Model) -> None:
+    """Add the elements (ObjDef) of already collected groups."""
+    for g, folder in groups:
+        for o in g.iterchildren("ObjDef"):
             _parse_objdef(o, model, folder)
-        parse_elements(g, root, model, folder)
-        folder = old_folder
+
+
+def parse_elements(group: Any, root: Any, model: Model, folder: str = "") -> None:
+    """Recursively parse and add elements from ARIS model hierarchy."""
+    add_group_elements(iter_groups(root if group is None else group, folder), model)
 
 
 def _add_rel_with_fallback(
-    model: Model, r_type: str, o_uuid: str, r_target: str, r_id: str, props: dict[str, str]
+    model: Model, r_type: str, source: Element, target: Element, r_id: str, props: dict[str, str]
 ) -> None:
     try:
-        r = model.add_relationship(rel_type=r_type, source=o_uuid, target=r_target, uuid=r_id)
+        r = model.add_relationship(rel_type=r_type, source=source, target=target, uuid=r_id)
     except ArchimateRelationshipError as exc:
-        fallback_type = get_default_rel_type(model.elems_dict[o_uuid].type, model.elems_dict[r_target].type)
+        fallback_type = get_default_rel_type(source.type, target.type)
         log.warning(str(exc) + f" - Replacing by {fallback_type}")
         if fallback_type is None:
             return
-        r = model.add_relationship(rel_type=fallback_type, source=o_uuid, target=r_target, uuid=r_id)
+        r = model.add_relationship(rel_type=fallback_type, source=source, target=target, uuid=r_id)
     if r is not None:
-        for key, value in props.items():
-            r.prop(key, value)
+        r.update_props(props)
 
 
 def _collect_cxn_props(rel: Any) -> dict[str, str]:
     props: dict[str, str] = {}
-    for attr in rel.findall("AttrDef"):
-        key = attr.attrib[_ATTRDEF_TYPE]
-        val = "".join(v.get("TextValue") + "\n" for v in attr.iter("PlainText"))
-        props[key] = val
+    for attr in rel.iterchildren("AttrDef"):
+        props[attr.attrib[_ATTRDEF_TYPE]] = _attr_text(attr)
     return props
 
 
 def _process_objdef_rels(o: Any, model: Model) -> None:
-    o_uuid = id_of(o.attrib["ObjDef.ID"])
-    for rel in o.findall("CxnDef"):
-        r_type = ARIS_type_map[rel.attrib["CxnDef.Type"]]
-        r_id = id_of(rel.attrib["CxnDef.ID"])
-        r_target = id_of(rel.attrib.get("ToObjDef.IdRef"))
-        if r_target not in model.elems_dict:
+    # Locals for the per-CxnDef loop: fast local loads instead of global/attribute lookups
+    type_map = ARIS_type_map
+    elems = model.elems_dict
+    # Source and target are resolved once and handed on as objects, so neither the fallback
+    # nor the Relationship constructor has to look them up again
+    source = elems.get(id_of(o.attrib["ObjDef.ID"]))
+    if source is None:
+        # ObjDef skipped as an element (no or unmapped SymbolNum): none of its CxnDefs can be added
+        return
+    for rel in o.iterchildren("CxnDef"):
+        attrib = rel.attrib
+        target = elems.get(id_of(attrib.get("ToObjDef.IdRef")))
+        if target is None:
             continue
-        _add_rel_with_fallback(model, r_type, o_uuid, r_target, r_id, _collect_cxn_props(rel))
+        r_type = type_map[attrib["CxnDef.Type"]]
+        r_id = id_of(attrib["CxnDef.ID"])
+        _add_rel_with_fallback(model, r_type, source, target, r_id, _collect_cxn_props(rel))
+
+
+def add_group_relationships(groups: Iterable[tuple[Any, str]], model: Model) -> None:
+    """Add the relationships (CxnDef) of already collected groups; their elements must exist."""
+    for g, _ in groups:
+        for o in g.iterchildren("ObjDef"):
+            _process_objdef_rels(o, model)
 
 
 def parse_relationships(groups: Any, root: Any, model: Model) -> None:
     """Recursively parse and add relationships from ARIS model hierarchy."""
-    if groups is None:
-        groups = root
-    for g in groups.findall("Group"):
-        for o in g.findall("ObjDef"):
-            _process_objdef_rels(o, model)
-        parse_relationships(g, root, model)
+    add_group_relationships(iter_groups(root if groups is None else groups), model)
+
+
+def _scaled_bounds(pos: Any, size: Any, scale_x: float, scale_y: float) -> tuple[int, int, int, int]:
+    """Scale an ARIS Position/Size pair to view coordinates (x, y, w, h)."""
+    return (
+        int(int(pos.get(_POS_X)) * scale_x),
+        int(int(pos.get(_POS_Y)) * scale_y),
+        int(int(size.get("Size.dX")) * scale_x),
+        int(int(size.get("Size.dY")) * scale_y),
+    )
 
 
 def parse_nodes(grp: Any, view: View | None, model: Model, scale_x: float, scale_y: float) -> None:
@@ -186,20 +260,19 @@ def parse_nodes(grp: Any, view: View | None, model: Model, scale_x: float, scale
         return
     if not isinstance(view, View):
         raise ArchimateConceptTypeError(_NOT_A_VIEW)
-    for o in grp.findall("ObjOcc"):
-        o_type = ARIS_type_map[o.attrib["SymbolNum"]]
-        o_id = id_of(o.attrib["ObjOcc.ID"])
-        o_elem_ref = model.elems_dict[id_of(o.attrib["ObjDef.IdRef"])].uuid
-        pos = o.find("Position")
-        size = o.find("Size")
-        n = view.add(
-            ref=o_elem_ref,
-            x=int(int(pos.get(_POS_X)) * scale_x),
-            y=int(int(pos.get(_POS_Y)) * scale_y),
-            w=int(int(size.get("Size.dX")) * scale_x),
-            h=int(int(size.get("Size.dY")) * scale_y),
-            uuid=o_id,
-        )
+    type_map = ARIS_type_map
+    elems = model.elems_dict
+    add_node = view.add
+    for o in grp.iterchildren("ObjOcc"):
+        attrib = o.attrib
+        o_type = type_map[attrib["SymbolNum"]]
+        o_id = id_of(attrib["ObjOcc.ID"])
+        elem = elems.get(id_of(attrib["ObjDef.IdRef"]))
+        if elem is None:
+            log.warning("Node %s refers to unknown element %s - ignoring", o_id, attrib["ObjDef.IdRef"])
+            continue
+        x, y, w, h = _scaled_bounds(o.find("Position"), o.find("Size"), scale_x, scale_y)
+        n = add_node(ref=elem.uuid, x=x, y=y, w=w, h=h, uuid=o_id)
         if o_type == "Grouping":
             n.fill_color = "#FFFFFF"
             n.opacity = 100
@@ -231,9 +304,11 @@ def _handle_regular_conn(conn: Any, o_id: str, view: View, model: Model, scale_x
     if c_rel_id not in model.rels_dict:
         return
     c = view.add_connection(ref=c_rel_id, source=o_id, target=c_target, uuid=c_id)
-    for i, pos in enumerate(conn.findall("Position")):
-        if 0 < i < len(conn.findall("Position")) - 1:
-            c.add_bendpoint(Point(int(pos.get(_POS_X)) * scale_x, int(pos.get(_POS_Y)) * scale_y))
+    # First and last positions are the end points; only the inner ones are bendpoints.
+    # Collected once: re-running findall() per position made this quadratic in the bendpoint count
+    positions = conn.findall("Position")
+    for pos in positions[1:-1]:
+        c.add_bendpoint(Point(int(pos.get(_POS_X)) * scale_x, int(pos.get(_POS_Y)) * scale_y))
 
 
 def parse_connections(grp: Any, view: View | None, model: Model, scale_x: float, scale_y: float) -> None:
@@ -242,10 +317,10 @@ def parse_connections(grp: Any, view: View | None, model: Model, scale_x: float,
         return
     if not isinstance(view, View):
         raise ValueError(_NOT_A_VIEW)
-    for o in grp.findall("ObjOcc"):
+    for o in grp.iterchildren("ObjOcc"):
         o_id = id_of(o.attrib["ObjOcc.ID"])
-        for conn in o.findall("CxnOcc"):
-            if "Embedding" in conn.attrib and conn.attrib["Embedding"] == "YES":
+        for conn in o.iterchildren("CxnOcc"):
+            if conn.get("Embedding") == "YES":
                 _handle_embedding(conn, o_id, model)
             else:
                 _handle_regular_conn(conn, o_id, view, model, scale_x, scale_y)
@@ -257,20 +332,14 @@ def parse_containers(grp: Any, view: View | None, scale_x: float, scale_y: float
         return
     if not isinstance(view, View):
         raise ArchimateConceptTypeError(_NOT_A_VIEW)
-    for objs in grp.findall("GfxObj"):
-        for o in objs.findall("RoundedRectangle"):
+    for objs in grp.iterchildren("GfxObj"):
+        for o in objs.iterchildren("RoundedRectangle"):
             pos = o.find("Position")
             size = o.find("Size")
             brush = o.find("Brush")
             if pos is not None and size is not None:
-                n = view.add(
-                    ref=None,
-                    x=int(int(pos.get(_POS_X)) * scale_x),
-                    y=int(int(pos.get(_POS_Y)) * scale_y),
-                    w=int(int(size.get("Size.dX")) * scale_x),
-                    h=int(int(size.get("Size.dY")) * scale_y),
-                    node_type="Container",
-                )
+                x, y, w, h = _scaled_bounds(pos, size, scale_x, scale_y)
+                n = view.add(ref=None, x=x, y=y, w=w, h=h, node_type="Container")
                 n.line_color = f"#{int(brush.get('Color')):0>6X}" if brush is not None else "#000000"
                 n.fill_color = "#FFFFFF"
                 n.opacity = 100
@@ -278,17 +347,14 @@ def parse_containers(grp: Any, view: View | None, scale_x: float, scale_y: float
 
 def parse_labels(root: Any, model: Model) -> None:
     """Parse and register text labels from ARIS model."""
-    for o in root.findall("FFTextDef"):
+    for o in root.iterchildren("FFTextDef"):
         o_id = id_of(o.attrib["FFTextDef.ID"])
         if o.attrib["IsModelAttr"] == "TEXT":
             o_name = None
-            for attr in o.findall("AttrDef"):
-                key = attr.attrib[_ATTRDEF_TYPE]
-                val = ""
-                for v in attr.iter("PlainText"):
-                    val += v.get("TextValue") + "\n"
-                if key == "AT_NAME":
-                    o_name = val
+            # Only the label text is kept, so other attributes' values are never assembled
+            for attr in o.iterchildren("AttrDef"):
+                if attr.attrib[_ATTRDEF_TYPE] == "AT_NAME":
+                    o_name = _attr_text(attr)
             model.labels_dict[o_id] = o_name
 
 
@@ -298,23 +364,28 @@ def parse_labels_in_view(grp: Any, view: View | None, model: Model, scale_x: flo
         return
     if not isinstance(view, View):
         raise ArchimateConceptTypeError(_NOT_A_VIEW)
-    for objs in grp.findall("FFTextOcc"):
+    for objs in grp.iterchildren("FFTextOcc"):
         lbl_ref = id_of(objs.attrib["FFTextDef.IdRef"])
-        if lbl_ref not in model.labels_dict:
+        # One lookup; also skips text definitions that had no AT_NAME (stored as None)
+        o_name = model.labels_dict.get(lbl_ref)
+        if o_name is None:
             continue
-        o_name = model.labels_dict[lbl_ref]
         o = objs.find("Position")
         if o is None:
             continue
         pos = o.attrib
-        w, h = max([get_text_size(x, 9, "Segoe UI") for x in o_name.split("\n")])
+        # Widest and tallest line taken independently; max() over (w, h) tuples compared widths only
+        lines = o_name.split("\n")
+        sizes = [get_text_size(line, 9, "Segoe UI") for line in lines]
+        w = max(size[0] for size in sizes)
+        h = max(size[1] for size in sizes)
         try:
             n = view.add(
                 ref=lbl_ref,
                 x=max(int(float(pos.get(_POS_X, "0")) * scale_x), 0),
                 y=max(int(float(pos.get(_POS_Y, "0")) * scale_y), 0),
                 w=int(w) + 18,
-                h=30 + (h * 1.5) * (o_name.count("\n") + 1),
+                h=30 + (h * 1.5) * len(lines),
                 node_type="Label",
                 label=o_name,
             )
@@ -324,7 +395,7 @@ def parse_labels_in_view(grp: Any, view: View | None, model: Model, scale_x: flo
             n.border_type = "2"
             n.text_alignment = TextAlignment.Left
         except ValueError:
-            log.warning(f"Node {o_name} has unknown element reference {lbl_ref} - ignoring")
+            log.warning("Node %s has unknown element reference %s - ignoring", o_name, lbl_ref)
 
 
 def _build_view(o: Any, model: Model, folder: str, scale_x: float, scale_y: float) -> None:
@@ -332,35 +403,36 @@ def _build_view(o: Any, model: Model, folder: str, scale_x: float, scale_y: floa
     o_name, o_desc, _ = _parse_aris_attrs(o)
     view = cast(View, model.add(concept_type=ArchiType.View, name=o_name, uuid=view_id, desc=o_desc))
     view.folder = folder
-    log.info("Parsing & adding nodes")
+    # One progress line per view, and only at DEBUG: aris_reader already logs each phase at INFO
+    log.debug("Parsing nodes, connections, containers and labels of view %s", o_name)
     parse_nodes(o, view, model, scale_x, scale_y)
-    log.info("Parsing & adding conns")
     parse_connections(o, view, model, scale_x, scale_y)
-    log.info("Parsing and adding container groups")
     parse_containers(o, view, scale_x, scale_y)
-    log.info("Parsing and adding labels")
     parse_labels_in_view(o, view, model, scale_x, scale_y)
 
 
+def add_group_views(groups: Iterable[tuple[Any, str]], model: Model, scale_x: float, scale_y: float) -> None:
+    """Add the views (Model) of already collected groups; their elements and relationships must exist."""
+    for g, folder in groups:
+        for o in g.iterchildren("Model"):
+            _build_view(o, model, folder, scale_x, scale_y)
+
+
 def parse_views(group: Any, root: Any, model: Model, scale_x: float, scale_y: float, folder: str = "") -> None:
     """Recursively parse and add views from ARIS model hierarchy."""
-    if group is None:
-        group = root
-    for g in group.findall("Group"):
-        a = g.find("AttrDef")
-        old_folder = folder
-        if a is not None:
-            for n in a.iter("PlainText"):
-                folder += "/" + n.get("TextValue")
-        for o in g.findall("Model"):
-            _build_view(o, model, folder, scale_x, scale_y)
-        parse_views(g, root, model, scale_x, scale_y, folder)
-        folder = old_folder
+    add_group_views(iter_groups(root if group is None else group, folder), model, scale_x, scale_y)
 
 
 def clean_nested_conns(model: Model) -> None:
-    """Remove connections that reference their parent node as source."""
-    for c in [x for x in model.conns_dict.values() if x.source.uuid == x.parent.uuid and isinstance(x.parent, Node)]:
-        c.delete()
-    for c in [x for x in model.conns_dict.values() if x.target.uuid == x.parent.uuid and isinstance(x.parent, Node)]:
+    """Remove connections that reference their parent node as source or target."""
+    # Single pass; the cheap parent type test runs first so endpoints are only resolved when it matters
+    nested = []
+    for c in model.conns_dict.values():
+        parent = c.parent
+        if not isinstance(parent, Node):
+            continue
+        parent_uuid = parent.uuid
+        if c.source.uuid == parent_uuid or c.target.uuid == parent_uuid:
+            nested.append(c)
+    for c in nested:
         c.delete()
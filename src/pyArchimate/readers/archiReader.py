@@ -37,7 +37,7 @@ def _process_hierarchy_folder(folder_elem, model):
             try:
                 model.add_child(parent_id, elem_id)
             except (ValueError, KeyError) as e:
-                log.debug(f"Failed to establish parent-child relationship: {e}")
+                log.debug("Failed to establish parent-child relationship: %s", e)
     for folder in folder_elem.findall("folder"):
         _process_hierarchy_folder(folder, model)
 
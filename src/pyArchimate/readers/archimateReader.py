@@ -8,6 +8,7 @@ Handles color normalization, style properties, and visual formatting preservatio
 import os
 import re
 import sys
+from functools import lru_cache
 from typing import Any
 
 try:
@@ -24,6 +25,9 @@ except ImportError:
 __mod__ = __name__.split(".")[len(__name__.split(".")) - 1]
 __location__ = os.path.realpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
 
+# Compiled once: every fill/line colour of every element, node and connection goes through here
+_HEX_COLOR_RE = re.compile(r"#[0-9a-f]{6}")
+
 
 def _normalize_color_on_import(color_str: str | None) -> str | None:
     """
@@ -37,13 +41,13 @@ def _normalize_color_on_import(color_str: str | None) -> str | None:
     if not color_str:
         return None
     if color_str.startswith("#"):
-        if re.match(r"^#[0-9a-f]{6}$", color_str):
+        if _HEX_COLOR_RE.fullmatch(color_str):
             return color_str
-        log.warning(f"Invalid hex color format on import: {color_str}")
+        log.warning("Invalid hex color format on import: %s", color_str)
         return None
     if color_str in NAMED_COLORS:
         return NAMED_COLORS[color_str].lower()
-    log.warning(f"Unknown color on import: {color_str}")
+    log.warning("Unknown color on import: %s", color_str)
     return None
 
 
@@ -56,14 +60,14 @@ def _parse_style_property_value(key: str, val: str) -> Any:
             width_val = float(val)
             if width_val >= 0:
                 return width_val
-            log.warning(f"Invalid lineWidth on import (negative): {val}")
+            log.warning("Invalid lineWidth on import (negative): %s", val)
         elif key == "transparency":
             alpha_val = float(val)
             if 0.0 <= alpha_val <= 1.0:
                 return alpha_val
-            log.warning(f"Invalid transparency on import (out of range): {val}")
+            log.warning("Invalid transparency on import (out of range): %s", val)
     except (ValueError, TypeError) as e:
-        log.warning(f"Failed to parse visual style property {key}={val}: {e}")
+        log.warning("Failed to parse visual style property %s=%s: %s", key, val, e)
     return None
 
 
@@ -100,12 +104,12 @@ def _build_hierarchy_from_parents(model: Any, parent_map: dict[str, str | None])
         if parent_uuid is None or child_uuid not in model.elems_dict:
             continue
         if parent_uuid not in model.elems_dict:
-            log.warning(f"Parent element {parent_uuid} not found during import, skipping hierarchy")
+            log.warning("Parent element %s not found during import, skipping hierarchy", parent_uuid)
             continue
         try:
             model.add_child(parent_uuid, child_uuid)
         except (KeyError, ValueError) as e:
-            log.warning(f"Failed to add hierarchy during import: {e}, skipping relationship")
+            log.warning("Failed to add hierarchy during import: %s, skipping relationship", e)
 
 
 def _read_pdefs(model, root, ns, merge_flg):
@@ -113,14 +117,26 @@ def _read_pdefs(model, root, ns, merge_flg):
     pdefs = root.find(ns + "propertyDefinitions")
     if pdefs is None:
         return pdef_merge_map
+    # Reverse index of the definitions already in the model, so a merged name resolves in one dict hit
+    ids_by_name: dict[str, str] = {}
+    if merge_flg:
+        for prop_id, name in model.pdefs.items():
+            ids_by_name.setdefault(name, prop_id)
     for p in pdefs.findall(ns + "propertyDefinition"):
         _id = p.get("identifier")
         val = p.find(ns + "name").text
+        known_id = ids_by_name.get(val)
+        if known_id is not None:
+            # Same property name already defined: reuse that definition instead of adding a duplicate
+            pdef_merge_map[_id] = known_id
+            continue
         pdef_merge_map[_id] = _id
         if merge_flg and _id in model.pdefs and model.pdefs[_id] != val:
             pdef_merge_map[_id] = "propid-" + str(len(model.pdefs) + 1)
             _id = pdef_merge_map[_id]
         model.pdefs[_id] = val
+        if merge_flg:
+            ids_by_name[val] = _id
     return pdef_merge_map
 
 
@@ -150,7 +166,7 @@ def _assign_viewpoint(obj: Any, slug: str, method: str = "assign_viewpoint") ->
     if get_viewpoint(slug) is not None:
         getattr(obj, method)(slug)
     else:
-        log.warning(f"Unknown viewpoint slug '{slug}' ignored during import")
+        log.warning("Unknown viewpoint slug '%s' ignored during import", slug)
 
 
 def _apply_viewpoint_props(elem: Any, props_xml: Any, ns: str, pdef_merge_map: dict[str, str], model: Any) -> None:
@@ -177,7 +193,7 @@ def _set_junction_type_from_prop(elem: Any, prop_xml: Any, ns: str) -> None:
         try:
             elem.set_junction_type(junction_type)
         except ValueError as e:
-            log.warning(f"Invalid junctionType on import: {e}")
+            log.warning("Invalid junctionType on import: %s", e)
 
 
 def _apply_junction_type_props(elem: Any, props_xml: Any, ns: str) -> None:
@@ -196,8 +212,8 @@ def _read_elements(model, root, ns, xsi, pdef_merge_map, merge_flg):
     visual_style_map = {}
     for e in elements_xml.findall(ns + "element"):
         _uuid = e.get("identifier")
-        name = None if e.find(ns + "name") is None else e.find(ns + "name").text
-        desc = None if e.find(ns + "documentation") is None else e.find(ns + "documentation").text
+        name = _get_xml_text(e, "name", ns)
+        desc = _get_xml_text(e, "documentation", ns)
         if merge_flg and _uuid in model.elems_dict:
             elem = model.elems_dict[_uuid]
             elem.name = name
@@ -226,8 +242,8 @@ def _read_elements(model, root, ns, xsi, pdef_merge_map, merge_flg):
 
 def _process_one_relationship(model, r, ns, xsi, pdef_merge_map, merge_flg):
     _uuid = r.get("identifier")
-    name = None if r.find(ns + "name") is None else r.find(ns + "name").text
-    desc = None if r.find(ns + "documentation") is None else r.find(ns + "documentation").text
+    name = _get_xml_text(r, "name", ns)
+    desc = _get_xml_text(r, "documentation", ns)
     if merge_flg and _uuid in model.rels_dict:
         rel = model.rels_dict[_uuid]
         rel.name = name
@@ -273,17 +289,27 @@ def _read_relationships(model, root, ns, xsi, pdef_merge_map, merge_flg):
         remaining = deferred
 
 
+# Views reuse a small palette, so each distinct r/g/b attribute triple is converted to hex once per process
+@lru_cache(maxsize=1024)
+def _rgb_hex(r: str | None, g: str | None, b: str | None) -> str:
+    return RGBA(r, g, b).color
+
+
+def _xml_color(color_xml) -> str:
+    return _rgb_hex(color_xml.get("r"), color_xml.get("g"), color_xml.get("b"))
+
+
 def _apply_node_style(node, style_xml, ns):
     if style_xml is None:
         return
     fc = style_xml.find(ns + "fillColor")
     if fc is not None:
-        node.fill_color = RGBA(fc.get("r"), fc.get("g"), fc.get("b")).color
+        node.fill_color = _xml_color(fc)
         if fc.get("a") is not None:
             node.opacity = int(fc.get("a"))
     lc = style_xml.find(ns + "lineColor")
     if lc is not None:
-        node.line_color = RGBA(lc.get("r"), lc.get("g"), lc.get("b")).color
+        node.line_color = _xml_color(lc)
         if lc.get("a") is not None:
             node.lc_opacity = int(lc.get("a"))
     ft = style_xml.find(ns + "font")
@@ -292,7 +318,7 @@ def _apply_node_style(node, style_xml, ns):
         node.font_size = ft.get("size")
         ftc = ft.find(ns + "color")
         if ftc is not None:
-            node.font_color = RGBA(ftc.get("r"), ftc.get("g"), ftc.get("b")).color
+            node.font_color = _xml_color(ftc)
 
 
 def _add_node(parent, node_xml, ns, xsi, model, merge_flg):
@@ -336,13 +362,13 @@ def _apply_conn_style(conn, style_xml, ns):
         return
     lc = style_xml.find(ns + "lineColor")
     if lc is not None:
-        conn.line_color = RGBA(lc.get("r"), lc.get("g"), lc.get("b")).color
+        conn.line_color = _xml_color(lc)
     ft = style_xml.find(ns + "font")
     if ft is not None:
         conn.font_name = ft.get("name")
         conn.font_size = ft.get("size")
         ftc = ft.find(ns + "color")
-        conn.font_color = RGBA(ftc.get("r"), ftc.get("g"), ftc.get("b")).color
+        conn.font_color = _xml_color(ftc)
     conn.line_width = style_xml.get("lineWidth")
 
 
@@ -355,7 +381,7 @@ def _read_view_connection(view, c, ns, merge_flg):
     # Skip view-only lines (xsi:type="Line") — no backing model relationship.
     rel_ref = c.get("relationshipRef")
     if not rel_ref:
-        log.debug(f"Skipping connection {c.get('identifier')}: no relationshipRef")
+        log.debug("Skipping connection %s: no relationshipRef", c.get("identifier"))
         return
     source_id = c.get("source")
     target_id = c.get("target")
@@ -371,7 +397,7 @@ def _read_view_connection(view, c, ns, merge_flg):
         for bp in c.findall(ns + "bendpoint"):
             _c.add_bendpoint(Point(bp.get("x"), bp.get("y")))
     except (ValueError, KeyError) as e:
-        log.debug(f"Skipping connection {c.get('identifier')}: {e}")
+        log.debug("Skipping connection %s: %s", c.get("identifier"), e)
 
 
 def _read_views(model, root, ns, xsi, pdef_merge_map, merge_flg):
@@ -457,7 +483,7 @@ def _apply_visual_styles(model: Any, visual_style_map: dict[str, Any]) -> None:
                 try:
                     getattr(elem, setter_name)(style[key])
                 except (ValueError, TypeError) as e:
-                    log.warning(f"Failed to apply {key} to {elem_uuid}: {e}")
+                    log.warning("Failed to apply %s to %s: %s", key, elem_uuid, e)
 
 
 def archimate_reader(model, root, merge_flg=False):
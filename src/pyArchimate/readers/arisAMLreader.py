@@ -23,25 +23,27 @@ try:
     from ..helpers.logging import log
     from ..model import Model
     from ._arisamlreader_helpers import (
+        add_group_elements,
+        add_group_relationships,
+        add_group_views,
         clean_nested_conns,
         get_text_size,
         id_of,
-        parse_elements,
+        iter_groups,
         parse_labels,
-        parse_relationships,
-        parse_views,
     )
 except ImportError:
     sys.path.insert(0, "..")
     from pyArchimate import Model, log  # type: ignore[no-redef,attr-defined]
     from pyArchimate.readers._arisamlreader_helpers import (
+        add_group_elements,
+        add_group_relationships,
+        add_group_views,
         clean_nested_conns,
         get_text_size,
         id_of,
-        parse_elements,
+        iter_groups,
         parse_labels,
-        parse_relationships,
-        parse_views,
     )
 
 # Re-export for backward compatibility
@@ -69,23 +71,31 @@ def aris_reader(model: Model, root: Any, scale_x: float = 0.3, scale_y: float =
     scale_x = float(scale_x)
     scale_y = float(scale_y)
 
+    # Walk the Group tree once; elements, then relationships, then views are added from that list
+    # because each pass may reference concepts defined in any later group
+    groups = list(iter_groups(root))
     log.info("Parsing elements")
-    parse_elements(None, root, model)
+    add_group_elements(groups, model)
     log.info("Parsing relationships")
-    parse_relationships(None, root, model)
+    add_group_relationships(groups, model)
 
-    if not no_view:
-        log.info("Parsing Labels")
-        parse_labels(root, model)
-        log.info("Parsing Views")
-        parse_views(None, root, model, scale_x, scale_y)
-        clean_nested_conns(model)
+    if no_view:
+        # No node or connection is created without views, so the diagram checks below have nothing to validate
+        model.expand_props(clean_doc=True)
+        return
+
+    log.info("Parsing Labels")
+    parse_labels(root, model)
+    log.info("Parsing Views")
+    add_group_views(groups, model, scale_x, scale_y)
+    clean_nested_conns(model)
 
     model.expand_props(clean_doc=True)
     log.info("Performing final model validation checks")
     inv_c = model.check_invalid_conn()
     inv_n = model.check_invalid_nodes()
     if len(inv_n) > 0 or len(inv_c) > 0:
+        # Each invalid node/connection is already logged by the checks; the raw id lists are debug detail
         log.error("Errors found in the model")
-        print(inv_n)
-        print(inv_c)
+        log.debug("Invalid nodes: %s", inv_n)
+        log.debug("Invalid connections: %s", inv_c)
@@ -1,10 +1,12 @@
 """Relationship module - extracted from the legacy monolith."""
 
+import re
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Optional, cast
 from uuid import UUID, uuid4
 
-from .constants import ALLOWED_RELATIONSHIPS, ARCHI_CATEGORY, RELATIONSHIP_KEYS
-from .enums import ArchiType
+from .constants import ALLOWED_RELATIONSHIP_TRIPLES, ALLOWED_RELATIONSHIPS, ARCHI_CATEGORY, RELATIONSHIP_KEYS
+from .enums import ARCHI_TYPE_NAMES, ArchiType, intern_type
 from .exceptions import ArchimateConceptTypeError, ArchimateRelationshipError
 from .logger import log
 
@@ -13,6 +15,10 @@ if TYPE_CHECKING:
     from .model import Model
 
 
+# Canonical string form of a version-4 UUID, i.e. exactly the strings for which _is_valid_uuid() is True
+_CANONICAL_UUID4_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}")
+
+
 def _is_valid_uuid(uuid_to_test, version=4):
     """
     Check if uuid_to_test is a valid UUID.
@@ -22,6 +28,9 @@ def _is_valid_uuid(uuid_to_test, version=4):
     :return: True if uuid_to_test is a valid UUID, otherwise `False`.
     :rtype: bool
     """
+    if version == 4:
+        # Fast path: the canonical v4 form is one regex match, with no UUID object or exception on failure
+        return isinstance(uuid_to_test, str) and _CANONICAL_UUID4_RE.fullmatch(uuid_to_test) is not None
     try:
         uuid_obj = UUID(uuid_to_test, version=version)
     except ValueError:
@@ -37,12 +46,15 @@ def set_id(uuid=None):
     :return: a formatted identifier
     :rtype: str
     """
-    _id = str(uuid4()) if (uuid is None) else uuid
-    if _is_valid_uuid(_id):
-        _id = _id.replace("-", "")
-        if not _id.startswith("id-"):
-            _id = "id-" + _id
-    return _id
+    if uuid is None:
+        return "id-" + uuid4().hex
+    # Identifiers read back from files already carry the prefix and can never match the UUID pattern
+    if uuid.startswith("id-"):
+        return uuid
+    # Same acceptance as _is_valid_uuid (canonical lowercase v4 form) without building a UUID object
+    if _CANONICAL_UUID4_RE.fullmatch(uuid):
+        return "id-" + uuid.replace("-", "")
+    return uuid
 
 
 def _report(exc: Exception, raise_flg: bool) -> None:
@@ -51,30 +63,22 @@ def _report(exc: Exception, raise_flg: bool) -> None:
     log.error(exc)
 
 
-def check_valid_relationship(rel_type, source_type, target_type, raise_flg=False):
-    """
-    Check if a relationship is used according to Archimate language or raise an exception
+def _relationship_problem(rel_type, source_type, target_type) -> tuple[type[Exception], str] | None:
+    # Type names come from input files, so unknown ones are rejected here, before the cached lookup
+    if rel_type not in ARCHI_TYPE_NAMES or ARCHI_CATEGORY[rel_type] != "Relationship":
+        return ArchimateConceptTypeError, f"Invalid Archimate Relationship Concept type '{rel_type}'"
+    if source_type not in ARCHI_TYPE_NAMES:
+        return ArchimateConceptTypeError, f"Invalid Archimate Source Concept type '{source_type}'"
+    if target_type not in ARCHI_TYPE_NAMES:
+        return ArchimateConceptTypeError, f"Invalid Archimate Target Concept type '{target_type}'"
+    return _triple_problem(rel_type, source_type, target_type)
 
-    :param rel_type:        relationship type
-    :type rel_type: str
-    :param source_type:     source concept type
-    :type source_type: str
-    :param target_type:     target concept type
-    :type target_type: str
-    :param raise_flg: Throw an exception instead of logging an error
-    :return:            True if the relationship type/endpoint combination is valid
-    :rtype: bool
-    """
-    if not hasattr(ArchiType, rel_type) or ARCHI_CATEGORY[rel_type] != "Relationship":
-        _report(ArchimateConceptTypeError(f"Invalid Archimate Relationship Concept type '{rel_type}'"), raise_flg)
-        return False
-    if not hasattr(ArchiType, source_type):
-        _report(ArchimateConceptTypeError(f"Invalid Archimate Source Concept type '{source_type}'"), raise_flg)
-        return False
-    if not hasattr(ArchiType, target_type):
-        _report(ArchimateConceptTypeError(f"Invalid Archimate Target Concept type '{target_type}'"), raise_flg)
-        return False
 
+# Only reached with valid ArchiType names, so the cache is bounded by the closed type vocabulary and every
+# combination is resolved once per process; the error is cached as (class, message) so each report still
+# raises a fresh exception
+@lru_cache(maxsize=None)
+def _triple_problem(rel_type, source_type, target_type) -> tuple[type[Exception], str] | None:
     if ARCHI_CATEGORY[source_type] == "Relationship":
         source_type = "Relationship"
     if ARCHI_CATEGORY[target_type] == "Relationship":
@@ -86,15 +90,34 @@ def check_valid_relationship(rel_type, source_type, target_type, raise_flg=False
     if "Junction" in target_type:
         target_type = "Junction"
 
-    if RELATIONSHIP_KEYS[rel_type] not in ALLOWED_RELATIONSHIPS[source_type][target_type]:
-        _report(
-            ArchimateRelationshipError(
-                f"Invalid Relationship type '{rel_type}' from '{source_type}' and '{target_type}' "
-            ),
-            raise_flg,
+    if (source_type, target_type, RELATIONSHIP_KEYS[rel_type]) not in ALLOWED_RELATIONSHIP_TRIPLES:
+        return (
+            ArchimateRelationshipError,
+            f"Invalid Relationship type '{rel_type}' from '{source_type}' and '{target_type}' ",
         )
-        return False
-    return True
+    return None
+
+
+def check_valid_relationship(rel_type, source_type, target_type, raise_flg=False):
+    """
+    Check if a relationship is used according to Archimate language or raise an exception
+
+    :param rel_type:        relationship type
+    :type rel_type: str
+    :param source_type:     source concept type
+    :type source_type: str
+    :param target_type:     target concept type
+    :type target_type: str
+    :param raise_flg: Throw an exception instead of logging an error
+    :return:            True if the relationship type/endpoint combination is valid
+    :rtype: bool
+    """
+    problem = _relationship_problem(rel_type, source_type, target_type)
+    if problem is None:
+        return True
+    exc_type, message = problem
+    _report(exc_type(message), raise_flg)
+    return False
 
 
 def _resolve_and_validate_ref(ref: Any, elems_dict: dict[str, Any], rels_dict: dict[str, Any], arg_name: str) -> str:
@@ -102,11 +125,12 @@ def _resolve_and_validate_ref(ref: Any, elems_dict: dict[str, Any], rels_dict: d
     if isinstance(ref, str):
         uid: str = ref
     else:
-        from .element import Element  # noqa: PLC0415  # circular: element↔relationship init cycle
-
-        if not (isinstance(ref, Element) or isinstance(ref, Relationship) or hasattr(ref, "uuid")):
-            raise ValueError(f"'{arg_name}' argument is not an instance of 'Element or Relationship' class.")
-        uid = cast(str, ref.uuid)
+        # Element and Relationship both expose .uuid, so one attribute read covers every accepted type
+        # without importing Element or walking the MRO twice per endpoint
+        try:
+            uid = cast(str, ref.uuid)
+        except AttributeError:
+            raise ValueError(f"'{arg_name}' argument is not an instance of 'Element or Relationship' class.") from None
     if uid not in elems_dict and uid not in rels_dict:
         raise ValueError(f'Invalid {arg_name} reference "{uid}')
     return uid
@@ -120,9 +144,9 @@ def _get_concept_type(uid: str, elems_dict: dict[str, Any], rels_dict: dict[str,
 
 def get_default_rel_type(source_type, target_type):
     """Return the default valid relationship type between two element types."""
-    if not hasattr(ArchiType, source_type) or ARCHI_CATEGORY[source_type] == "Relationship":
+    if source_type not in ARCHI_TYPE_NAMES or ARCHI_CATEGORY[source_type] == "Relationship":
         raise ArchimateConceptTypeError(f"Invalid Archimate Source Concept type '{source_type}'")
-    if not hasattr(ArchiType, target_type) or ARCHI_CATEGORY[target_type] == "Relationship":
+    if target_type not in ARCHI_TYPE_NAMES or ARCHI_CATEGORY[target_type] == "Relationship":
         raise ArchimateConceptTypeError(f"Invalid Archimate Target Concept type '{target_type}'")
     rels = ALLOWED_RELATIONSHIPS[source_type][target_type]
     if len(rels) > 0:
@@ -131,7 +155,8 @@ def get_default_rel_type(source_type, target_type):
             if preferred in rels:
                 t = preferred
                 break
-        return [k for k, v in RELATIONSHIP_KEYS.items() if v == t][0]
+        # Stop at the first matching key rather than materialising every match to keep one
+        return next(k for k, v in RELATIONSHIP_KEYS.items() if v == t)
 
 
 class Relationship:
@@ -195,7 +220,7 @@ class Relationship:
         self._target = _resolve_and_validate_ref(target, self.parent.elems_dict, self.parent.rels_dict, "target")
 
         self._uuid = set_id(uuid)
-        self._type = rel_type
+        self._type = intern_type(rel_type)
         self.name = name
         self.desc = desc
         self._properties = {}
@@ -222,7 +247,7 @@ class Relationship:
         """
         _id = self._uuid
         # remove related conns
-        for c in self.parent.conns_dict.copy().values():
+        for c in list(self.parent.conns_dict.values()):
             if c.ref == _id:
                 c.delete()
                 del c
@@ -269,7 +294,7 @@ class Relationship:
         """
         if isinstance(src, str):
             self._source = src
-        elif not isinstance(src, type(None)):
+        elif src is not None:
             from .element import Element  # noqa: PLC0415  # circular: element↔relationship init cycle
 
             if not isinstance(src, Element):
@@ -304,7 +329,7 @@ class Relationship:
         """
         if isinstance(dst, str):
             self._target = dst
-        elif not isinstance(dst, type(None)):
+        elif dst is not None:
             from .element import Element  # noqa: PLC0415  # circular: element↔relationship init cycle
 
             if not isinstance(dst, Element):
@@ -337,7 +362,7 @@ class Relationship:
         check_valid_relationship(
             new_type, self.source.type if self.source else "", self.target.type if self.target else ""
         )  # noqa: E501
-        self._type = new_type
+        self._type = intern_type(new_type)
 
     @property
     def profile_name(self):
@@ -423,7 +448,7 @@ class Relationship:
         :rtype: str
         """
         if value is None:
-            return self._properties[key] if key in self._properties else None
+            return self._properties.get(key)
         else:
             self._properties[key] = value
             return value
@@ -436,8 +461,18 @@ class Relationship:
         :type key: str
 
         """
-        if key in self._properties:
-            del self._properties[key]
+        self._properties.pop(key, None)
+
+    def update_props(self, props):
+        """
+        Method to set several relationship properties at once
+
+        Use it rather than repeated prop() calls when importing many properties
+
+        :param props:   Property keys and values
+        :type props: dict
+        """
+        self._properties.update(props)
 
     @property
     def access_type(self):
@@ -4,12 +4,13 @@ All classes are self-contained and carry no dependency on the legacy module.
 """
 
 import math
-from collections import defaultdict
+from collections.abc import Iterable
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Optional, cast
 
 from ..constants import ARCHI_CATEGORY, DEFAULT_THEME
 from ..element import Element, set_id
-from ..enums import ArchiType
+from ..enums import ARCHI_TYPE_NAMES
 from ..exceptions import ArchimateConceptTypeError
 from ..logger import log
 
@@ -22,11 +23,13 @@ if TYPE_CHECKING:
 
 
 def _sort_nodes(nodes: list[Any], sort: str) -> list[Any]:
+    # One key tuple per node; equal areas fall back to reading order (top-to-bottom, left-to-right)
+    # instead of whatever order the children happened to be added in
     s = sort.lower()
     if "asc" in s:
-        return sorted(nodes, key=lambda x: x.w * x.h)
+        return sorted(nodes, key=lambda x: (x.w * x.h, x.y, x.x))
     if "desc" in s:
-        return sorted(nodes, key=lambda x: x.w * x.h, reverse=True)
+        return sorted(nodes, key=lambda x: (-(x.w * x.h), x.y, x.x))
     return nodes
 
 
@@ -63,9 +66,8 @@ def _classify_outer_quadrant(angle: float) -> str:
 # ---------------------------------------------------------------------------
 
 
-def default_color(elem_type: str, theme: "str | dict[str, str] | None" = DEFAULT_THEME) -> str:
-    """Return the default fill colour for a node, keyed by Archimate element type."""
-    _archi_colors = {
+_ARCHI_COLORS = MappingProxyType(
+    {
         "strategy": "#F5DEAA",
         "business": "#FFFFB5",
         "application": "#B5FFFF",
@@ -77,7 +79,9 @@ def default_color(elem_type: str, theme: "str | dict[str, str] | None" = DEFAULT
         "other": "#FFFFFF",
         "junction": "#000000",
     }
-    _aris_colors = {
+)
+_ARIS_COLORS = MappingProxyType(
+    {
         "strategy": "#D38300",
         "business": "#F5C800",
         "application": "#00A0FF",
@@ -89,18 +93,25 @@ def default_color(elem_type: str, theme: "str | dict[str, str] | None" = DEFAULT
         "other": "#FFFFFF",
         "junction": "#000000",
     }
-    if elem_type in ARCHI_CATEGORY:
-        cat = ARCHI_CATEGORY[elem_type].lower()
-        if theme == "archi" or theme is None:
-            return _archi_colors.get(cat, "#FFFFFF")
-        if theme == "aris":
-            return _aris_colors.get(cat, "#FFFFFF")
-        try:
-            theme_dict = cast("dict[str, str]", theme)
-            return str(theme_dict[cat])
-        except (KeyError, TypeError):
-            return _archi_colors.get(cat, "#FFFFFF")
-    return "#FFFFFF"
+)
+# Resolved once per element type, so every node created without a fill colour costs one dict lookup
+_ARCHI_COLOR_BY_TYPE = {t: _ARCHI_COLORS.get(c.lower(), "#FFFFFF") for t, c in ARCHI_CATEGORY.items()}
+_ARIS_COLOR_BY_TYPE = {t: _ARIS_COLORS.get(c.lower(), "#FFFFFF") for t, c in ARCHI_CATEGORY.items()}
+
+
+def default_color(elem_type: str, theme: "str | dict[str, str] | None" = DEFAULT_THEME) -> str:
+    """Return the default fill colour for a node, keyed by Archimate element type."""
+    if theme == "archi" or theme is None:
+        return _ARCHI_COLOR_BY_TYPE.get(elem_type, "#FFFFFF")
+    if theme == "aris":
+        return _ARIS_COLOR_BY_TYPE.get(elem_type, "#FFFFFF")
+    if elem_type not in ARCHI_CATEGORY:
+        return "#FFFFFF"
+    try:
+        theme_dict = cast("dict[str, str]", theme)
+        return str(theme_dict[ARCHI_CATEGORY[elem_type].lower()])
+    except (KeyError, TypeError):
+        return _ARCHI_COLOR_BY_TYPE[elem_type]
 
 
 # ---------------------------------------------------------------------------
@@ -118,6 +129,8 @@ class Point:
     integer offset exactly during export.
     """
 
+    __slots__ = ("_x", "_y", "end_x", "end_y", "idx", "start_x", "start_y")
+
     def __init__(
         self,
         x: float = 0,
@@ -144,7 +157,7 @@ class Point:
     @x.setter
     def x(self, val: float) -> None:
         """Set X coordinate (enforced non-negative)."""
-        self._x = max(0, val)
+        self._x = val if val > 0 else 0
 
     @property
     def y(self) -> float:
@@ -154,12 +167,14 @@ class Point:
     @y.setter
     def y(self, val: float) -> None:
         """Set Y coordinate (enforced non-negative)."""
-        self._y = max(0, val)
+        self._y = val if val > 0 else 0
 
 
 class Position:
     """Positional relationship between two nodes (distance, angle, orientation)."""
 
+    __slots__ = ("angle", "dx", "dy", "gap_x", "gap_y", "orientation")
+
     def __init__(self):
         """Initialize empty position descriptor."""
         self.dx: float | None = None
@@ -173,7 +188,7 @@ class Position:
     def dist(self) -> float | None:
         """Euclidean distance between nodes."""
         if self.dx is not None and self.dy is not None:
-            return math.sqrt(self.dx**2 + self.dy**2)
+            return math.hypot(self.dx, self.dy)
         return None
 
 
@@ -191,7 +206,7 @@ class Profile:
             raise ValueError("Name of Profile must be present.")
         if not concept:
             raise ValueError("concept of Profile must be specified as a class of type: Element")
-        if not hasattr(ArchiType, concept):
+        if concept not in ARCHI_TYPE_NAMES:
             raise ArchimateConceptTypeError("'concept' argument is not an instance of 'ArchiType' class.")
         if concept == "View":
             raise ValueError("The concept type cannot be a View for a Profile")
@@ -256,7 +271,7 @@ class Node:
         if node_type == "Label" and ref is not None and ref not in self.model.labels_dict:
             from ..logger import log
 
-            log.debug(f'Label reference "{ref}" not found in model')
+            log.debug('Label reference "%s" not found in model', ref)
 
     def __init__(self, ref=None, x=0, y=0, w=120, h=55, uuid=None, node_type="Element", label=None, parent=None):
         """Initialize a visual node with position, size, and element reference."""
@@ -314,11 +329,11 @@ class Node:
 
     def delete(self, recurse=True, delete_from_model=False):
         """Delete this node and its related connections."""
-        for c in self.view.conns_dict.copy().values():
+        for c in list(self.view.conns_dict.values()):
             if c._source == self._uuid or c._target == self._uuid:
                 c.delete()
                 del c
-        for n in self.nodes_dict.copy().values():
+        for n in list(self.nodes_dict.values()):
             if recurse:
                 n.delete()
             else:
@@ -374,7 +389,7 @@ class Node:
         except KeyError:
             from ..logger import log
 
-            log.debug(f'Element reference "{self._ref}" not found in model')
+            log.debug('Element reference "%s" not found in model', self._ref)
             return None
 
     @property
@@ -910,19 +925,19 @@ class Connection:
         if self._ref not in self.model.rels_dict:
             from ..logger import log
 
-            log.debug(f'Relationship reference "{self._ref}" not found in model')
+            log.debug('Relationship reference "%s" not found in model', self._ref)
 
         self._source = self._resolve_node_uuid(source, "source")
         if self._source not in self.model.nodes_dict and self._source not in self.model.conns_dict:
             from ..logger import log
 
-            log.debug(f'Source node reference "{self._source}" not found in model')
+            log.debug('Source node reference "%s" not found in model', self._source)
 
         self._target = self._resolve_node_uuid(target, "target")
         if self._target not in self.model.nodes_dict and self._target not in self.model.conns_dict:
             from ..logger import log
 
-            log.debug(f'Target node reference "{self._target}" not found in model')
+            log.debug('Target node reference "%s" not found in model', self._target)
 
         self._uuid = set_id(uuid)
         self.bendpoints: list[Point] = []
@@ -1127,8 +1142,8 @@ class View:
         self.name = name
         self.desc = desc
         self.unions: list[object] = []
-        self.nodes_dict: dict[str, Node] = defaultdict(Node)
-        self.conns_dict: dict[str, Connection] = defaultdict(Connection)
+        self.nodes_dict: dict[str, Node] = {}
+        self.conns_dict: dict[str, Connection] = {}
         self._properties: dict[str, object] = {}
         self.folder = folder
         self._primary_viewpoint: str | None = None
@@ -1141,10 +1156,10 @@ class View:
     def delete(self) -> None:
         """Remove this view and all its nodes and connections."""
         _id = self.uuid
-        for n in self.nodes_dict.copy().values():
+        for n in list(self.nodes_dict.values()):
             n.delete(recurse=True)
             del n
-        for c in self.conns_dict.copy().values():
+        for c in list(self.conns_dict.values()):
             c.delete()
             del c
         if _id in self.parent.views_dict:
@@ -1349,8 +1364,7 @@ class View:
 
     def remove_prop(self, key: str) -> None:
         """Remove a custom property."""
-        if key in self._properties:
-            del self._properties[key]
+        self._properties.pop(key, None)
 
     @property
     def nodes(self) -> list[Node]:
@@ -1483,6 +1497,53 @@ class View:
             return self.add_connection(r, source, target)
         return None
 
+    def add_many(
+        self,
+        nodes: Iterable[tuple[Any, ...]] = (),
+        connections: Iterable[tuple[Any, ...]] = (),
+    ) -> list[Node]:
+        """Get or create several nodes and connections in one pass.
+
+        Equivalent to repeated ``get_or_create_node(..., create_elem=True, create_node=True)``
+        and ``get_or_create_connection(..., create_conn=True)`` calls, but the model's
+        elements and this view's nodes/connections are indexed once up-front instead of
+        being scanned again for every item.
+
+        :param nodes:       ``(name, elem_type, x, y[, w, h])`` tuples
+        :param connections: ``(rel_type, source, target[, name])`` tuples, where source and
+                            target are Nodes or names of nodes given in ``nodes``
+        :return: the node for each entry of ``nodes``, in order
+        """
+        # First match wins, as in get_or_create_node(), when names repeat or an element is shown twice
+        elems: dict[tuple[Any, Any], Element] = {}
+        for e in self.model.elems_dict.values():
+            elems.setdefault((e.name, e.type), e)
+        nodes_by_ref: dict[Any, Node] = {}
+        for n in self.nodes_dict.values():
+            nodes_by_ref.setdefault(n.ref, n)
+        by_name: dict[str, Node] = {}
+        result = []
+        for name, elem_type, *geometry in nodes:
+            elem = elems.get((name, elem_type))
+            if elem is None:
+                elem = elems[name, elem_type] = self.model.add(elem_type, name=name)
+            node = nodes_by_ref.get(elem.uuid)
+            if node is None:
+                node = nodes_by_ref[elem.uuid] = self.add(elem, *geometry)
+            by_name[name] = node
+            result.append(node)
+
+        conns = {(c.ref, c.type) for c in self.conns_dict.values()}
+        for rel_type, source, target, *rel_name in connections:
+            source = by_name[source] if isinstance(source, str) else source
+            target = by_name[target] if isinstance(target, str) else target
+            r = self._find_or_create_rel(source, target, rel_type, rel_name[0] if rel_name else None)
+            if r is None or (r.uuid, rel_type) in conns or target.parent.uuid == source.uuid:
+                continue
+            self.add_connection(r, source, target)
+            conns.add((r.uuid, rel_type))
+        return result
+
     def to_svg(self, filepath: str | None = None, show_stereotypes: bool = False) -> str:
         """Export view to SVG string and optionally write to file.
 
@@ -176,7 +176,7 @@ class ForceDirectedLayout(LayoutAlgorithm):
                     force = forces[node_id]
                     vx = force.x * self.damping
                     vy = force.y * self.damping
-                    v_mag = math.sqrt(vx * vx + vy * vy)
+                    v_mag = math.hypot(vx, vy)
                     if v_mag > self.max_velocity:
                         scale = self.max_velocity / v_mag
                         vx *= scale
@@ -6,6 +6,7 @@ Archi desktop tool.
 """
 
 import math
+import re
 from typing import Any
 from xml.etree import ElementTree as ET
 
@@ -16,6 +17,12 @@ from .symbols.archimate_relationships import (
 from .symbols.archimate_symbols import ARCHIMATE_SYMBOLS
 from .symbols.color_palette import get_element_color
 
+# Coordinate pairs separated by whitespace or comma (SVG path spec), compiled once for every icon path
+_COORD_PAIR_RE = re.compile(
+    r"(-?\d+(?:\.\d+)?)[ \t\n\r,]+(-?\d+(?:\.\d+)?)",  # NOSONAR literal \. makes groups non-overlapping; no polynomial backtracking
+    re.ASCII,
+)
+
 
 class SVGExportService:
     """Service for exporting pyArchimate views as SVG diagrams."""
@@ -497,7 +504,6 @@ class SVGExportService:
         Returns:
             Transformed path
         """
-        import re
 
         def transform_number(match: Any) -> str:
             """Transform a single coordinate."""
@@ -512,13 +518,7 @@ class SVGExportService:
             y_fmt = f"{y_new:.1f}".rstrip("0").rstrip(".")
             return f"{x_fmt} {y_fmt}"
 
-        # Match coordinate pairs separated by whitespace or comma (SVG path spec)
-        result = re.sub(
-            r"(-?\d+(?:\.\d+)?)[ \t\n\r,]+(-?\d+(?:\.\d+)?)",  # NOSONAR literal \. makes groups non-overlapping; no polynomial backtracking
-            transform_number,
-            svg_path,
-        )
-        return result
+        return _COORD_PAIR_RE.sub(transform_number, svg_path)
 
     def _render_node(self, svg: ET.Element, node: Any) -> None:
         """Render a single node as an ArchiMate symbol with text.
@@ -1043,7 +1043,7 @@ class SVGExportService:
         dx = direction_from[0] - ex
         dy = direction_from[1] - ey
 
-        dist = math.sqrt(dx * dx + dy * dy)
+        dist = math.hypot(dx, dy)
         if dist < 0.1:
             return
 
@@ -1842,7 +1842,7 @@ class SVGExportService:
             p2 = points[i + 1]
             dx = p2[0] - p1[0]
             dy = p2[1] - p1[1]
-            length = math.sqrt(dx * dx + dy * dy)
+            length = math.hypot(dx, dy)
 
             if length > max_length:
                 max_length = length
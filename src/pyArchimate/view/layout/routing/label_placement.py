@@ -1,5 +1,7 @@
 """Label placement for connections without overlaps."""
 
+import math
+
 from ..utils.geometry import Point, Rectangle
 
 
@@ -37,7 +39,7 @@ def position_label_on_connection(
 
     # Perpendicular vector (rotate 90 degrees)
     if abs(dx) > 0.1 or abs(dy) > 0.1:
-        length = (dx**2 + dy**2) ** 0.5
+        length = math.hypot(dx, dy)
         perp_x = -dy / length
         perp_y = dx / length
     else:
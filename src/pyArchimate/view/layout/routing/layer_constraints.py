@@ -126,9 +126,7 @@ class LayerConstraint:
         # Group elements by layer
         layers: dict[ArchiMateLayer, list[int]] = {}
         for elem_id, layer in self.element_layers.items():
-            if layer not in layers:
-                layers[layer] = []
-            layers[layer].append(elem_id)
+            layers.setdefault(layer, []).append(elem_id)
 
         updated_positions = dict(positions)
 
@@ -181,9 +179,7 @@ class LayerConstraint:
         layers: dict[ArchiMateLayer, list[int]] = {}
         for elem_id, layer in self.element_layers.items():
             if elem_id not in excluded_ids:
-                if layer not in layers:
-                    layers[layer] = []
-                layers[layer].append(elem_id)
+                layers.setdefault(layer, []).append(elem_id)
 
         updated_positions = dict(positions)
 
@@ -123,13 +123,8 @@ def spread_connection_endpoints(
     incoming_per_node: dict[int, list[int]] = {}
 
     for source, target in connections:
-        if source not in outgoing_per_node:
-            outgoing_per_node[source] = []
-        outgoing_per_node[source].append(target)
-
-        if target not in incoming_per_node:
-            incoming_per_node[target] = []
-        incoming_per_node[target].append(source)
+        outgoing_per_node.setdefault(source, []).append(target)
+        incoming_per_node.setdefault(target, []).append(source)
 
     # Calculate endpoint positions
     for source, target in connections:
@@ -201,13 +196,8 @@ def apply_barycentric_crossing_reduction(
         # Group connections by node
         neighbors: dict[int, list[int]] = {}
         for source, target in connections:
-            if source not in neighbors:
-                neighbors[source] = []
-            neighbors[source].append(target)
-
-            if target not in neighbors:
-                neighbors[target] = []
-            neighbors[target].append(source)
+            neighbors.setdefault(source, []).append(target)
+            neighbors.setdefault(target, []).append(source)
 
         # Move nodes toward neighbors' barycenter
         new_positions = dict(positions)
@@ -36,6 +36,13 @@ def _normalize_dict_edge(edge: dict[str, Any], uuid_to_index: dict[str, int]) ->
 
 
 def _normalize_single_edge(edge: Any, uuid_to_index: dict[str, int]) -> tuple[int | None, int | None]:
+    # Edge lists are homogeneous, so the plain tuple and dict shapes are resolved with one exact type test;
+    # Connection objects and subclasses of the builtins fall through to the isinstance/hasattr checks
+    edge_type = type(edge)
+    if edge_type is tuple:
+        return _normalize_tuple_edge(edge) if len(edge) == 2 else (None, None)
+    if edge_type is dict:
+        return _normalize_dict_edge(edge, uuid_to_index)
     if isinstance(edge, tuple) and len(edge) == 2:
         return _normalize_tuple_edge(edge)
     if hasattr(edge, "_source") and hasattr(edge, "_target"):
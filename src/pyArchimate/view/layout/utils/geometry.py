@@ -4,7 +4,8 @@ import math
 from dataclasses import dataclass
 
 
-@dataclass
+# Allocated per node on every force-directed iteration and per routing probe: no per-instance __dict__
+@dataclass(slots=True)
 class Point:
     """A point in 2D space."""
 
@@ -13,7 +14,7 @@ class Point:
 
     def distance_to(self, other: "Point") -> float:
         """Calculate Euclidean distance to another point."""
-        return math.sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2)
+        return math.hypot(self.x - other.x, self.y - other.y)
 
     def __add__(self, other: "Point") -> "Point":
         """Add two points."""
@@ -28,7 +29,7 @@ class Point:
         return Point(self.x * scalar, self.y * scalar)
 
 
-@dataclass
+@dataclass(slots=True)
 class Rectangle:
     """An axis-aligned rectangle."""
 
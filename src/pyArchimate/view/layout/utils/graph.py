@@ -12,15 +12,14 @@ class Graph:
     def add_node(self, node_id: str) -> None:
         """Add a node to the graph."""
         self.nodes.add(node_id)
-        if node_id not in self.edges:
-            self.edges[node_id] = set()
+        self.edges.setdefault(node_id, set())
 
     def add_edge(self, node1: str, node2: str) -> None:
         """Add an edge between two nodes."""
-        self.add_node(node1)
-        self.add_node(node2)
-        self.edges[node1].add(node2)
-        self.edges[node2].add(node1)
+        self.nodes.add(node1)
+        self.nodes.add(node2)
+        self.edges.setdefault(node1, set()).add(node2)
+        self.edges.setdefault(node2, set()).add(node1)
 
     def get_neighbors(self, node_id: str) -> set[str]:
         """Get all neighbors of a node."""
@@ -4,6 +4,7 @@ Writer registry helpers extracted from the legacy module.
 """
 
 from collections.abc import Callable
+from importlib import import_module
 from typing import Any
 
 from ..enums import Writers
@@ -11,6 +12,13 @@ from ..enums import Writers
 _writer_registry: dict[Writers, Callable[..., Any]] = {}
 _default_writers_initialized = False
 
+# Built-in writers: key -> (module, callable name), resolved on first use by _load_default_writer
+_DEFAULT_WRITERS: dict[Writers, tuple[str, str]] = {
+    Writers.archimate: (".archimateWriter", "archimate_writer"),
+    Writers.archi: (".archiWriter", "archi_writer"),
+    Writers.csv: (".csvWriter", "csv_writer"),
+}
+
 
 def register_writer(key, writer_callable):
     """Register a writer function for a given format key.
@@ -24,20 +32,20 @@ def register_writer(key, writer_callable):
     _writer_registry[key] = writer_callable
 
 
+def _load_default_writer(key):
+    """Import a built-in writer's module on first use and register its callable."""
+    module_name, attr = _DEFAULT_WRITERS[key]
+    # Imported lazily: only the requested writer is loaded, and writers import model types at module level
+    writer_callable = getattr(import_module(module_name, __name__), attr)
+    return _writer_registry.setdefault(key, writer_callable)
+
+
 def _ensure_default_writers():
     global _default_writers_initialized
     if _default_writers_initialized:
         return
-    # Import lazily to avoid circular imports during Model module load
-    from .archimateWriter import (
-        archimate_writer,  # noqa: PLC0415  # circular: writers import model types at module level
-    )
-    from .archiWriter import archi_writer  # noqa: PLC0415  # circular: writers import model types at module level
-    from .csvWriter import csv_writer  # noqa: PLC0415  # circular: writers import model types at module level
-
-    register_writer(Writers.archimate, archimate_writer)
-    register_writer(Writers.archi, archi_writer)
-    register_writer(Writers.csv, csv_writer)
+    for key in _DEFAULT_WRITERS:
+        _load_default_writer(key)
     _default_writers_initialized = True
 
 
@@ -66,7 +74,6 @@ def _resolve_writer(writer):
     if callable(writer):
         return writer
 
-    _ensure_default_writers()
     key = writer
     if isinstance(writer, Writers):
         key = writer
@@ -83,8 +90,11 @@ def _resolve_writer(writer):
 
     if key in _writer_registry:
         return _writer_registry[key]
+    if key in _DEFAULT_WRITERS:
+        return _load_default_writer(key)
 
-    raise ValueError(f"Unknown writer '{writer}'. Registered writers: {list(_writer_registry.keys())}")
+    known = list(dict.fromkeys([*_DEFAULT_WRITERS, *_writer_registry]))
+    raise ValueError(f"Unknown writer '{writer}'. Registered writers: {known}")
 
 
 __all__ = ["register_writer", "_resolve_writer", "_ensure_default_writers", "_detect_writer_from_extension"]
@@ -0,0 +1,24 @@
+"""Private text helpers shared by the XML writers."""
+
+import re
+from functools import lru_cache
+
+# Characters XML 1.0 cannot carry (C0 controls other than tab/LF/CR, surrogates, U+FFFE/U+FFFF);
+# lxml refuses them with ValueError, so they are replaced by a visible "[#xHHHH]" marker instead
+_INVALID_XML_RE = re.compile("[^\t\n\r\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]")
+
+
+def _invalid_char_marker(match: re.Match[str]) -> str:
+    return f"[#x{ord(match.group(0)):04X}]"
+
+
+# Names, property keys and enumerated values repeat heavily across a model, so results are memoized;
+# long-running processes can bound the cache with ``escape_invalid_xml.cache_clear()``
+@lru_cache(maxsize=8192)
+def escape_invalid_xml(text: str) -> str:
+    """Return ``text`` with characters that are not allowed in XML 1.0 replaced by ``[#xHHHH]``."""
+    # Fast path: printable text never contains control, surrogate or non-character code points,
+    # so the common case is a single C-level scan with no regex dispatch
+    if text.isprintable():
+        return text
+    return _INVALID_XML_RE.sub(_invalid_char_marker, text)
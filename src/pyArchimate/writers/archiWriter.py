@@ -5,6 +5,7 @@ Handles XML structure, folder organization, elements, relationships, and views.
 """
 
 # ruff: noqa: N999  # legacy module name preserved for API compatibility
+import copy
 import os
 import sys
 import zipfile
@@ -22,13 +23,29 @@ try:
     from ..helpers.logging import log
     from ..model import Model
     from ..view import View
+    from ._xml_helpers import escape_invalid_xml
 except ImportError:
     sys.path.insert(0, "..")
     from pyArchimate import ArchiType, Model, View, archi_category, log, set_id  # type: ignore[no-redef,attr-defined]
+    from pyArchimate.writers._xml_helpers import escape_invalid_xml  # type: ignore[no-redef]
 
 __mod__ = __name__.split(".")[len(__name__.split(".")) - 1]
 __location__ = os.path.realpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
 
+# Per-document invariants, set up once at import rather than on every write
+_MODEL_TEMPLATE = et.fromstring(
+    b"""<?xml version="1.0" encoding="UTF-8"?>
+    <archimate:model xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns:archimate="http://www.archimatetool.com/archimate" name="(new model)" id="id-2b0c639b388044d09709ceaaadbcf40f" version="4.9.0">
+    </archimate:model>
+    """
+)
+_XSI_URL = "http://www.w3.org/2001/XMLSchema-instance"  # NOSONAR
+_XSI_TYPE = et.QName(_XSI_URL, "type")
+
+# Image formats that are already compressed: deflating them again costs CPU on write and an inflate pass on
+# every read while saving next to nothing, so they are stored as-is in .archimate archives
+_PRECOMPRESSED_IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".gif", ".webp")
+
 
 def _create_folders(root: _Element) -> dict[str, _Element]:
     f_strategy = et.SubElement(root, "folder", name="Strategy", id=set_id(), type="strategy")
@@ -70,10 +87,14 @@ def _is_same_top_folder(folder_str: str, cat: str) -> bool:
 
 
 def _get_folder(folders: dict[str, _Element], folder_str: str) -> _Element:
+    # Most concepts share a handful of folders: once a path has been built it is a single dict hit
+    known = folders.get(folder_str)
+    if known is not None:
+        return known
     paths = folder_str.split("/")[1:]
     first_folder = "/" + paths[0]
     if first_folder not in folders:
-        log.warning(f"Unknown folder category '{first_folder}', using /Other as parent")
+        log.warning("Unknown folder category '%s', using /Other as parent", first_folder)
         prev_f = folders["/Other"]
     else:
         prev_f = folders[first_folder]
@@ -100,13 +121,13 @@ def _resolve_folder_path(obj_folder: str | None, cat: str) -> str:
 def _write_element_metadata(e: _Element, elem: object, elem_type: str) -> None:
     name = getattr(elem, "name", None)
     if name is not None:
-        e.set("name", name)
+        e.set("name", escape_invalid_xml(name))
     desc = getattr(elem, "desc", None)
     if desc is not None:
         doc = et.SubElement(e, "documentation")
-        doc.text = desc
+        doc.text = escape_invalid_xml(desc)
     for k, v in getattr(elem, "props", {}).items():
-        et.SubElement(e, "property", key=k, value=str(v))
+        et.SubElement(e, "property", key=escape_invalid_xml(k), value=escape_invalid_xml(str(v)))
     if elem_type == "Junction":
         junction_type = getattr(elem, "junction_type", None)
         if junction_type is not None:
@@ -159,7 +180,7 @@ def _write_relationship(folders: dict[str, _Element], rel: object, xsi: et.QName
     )
     name = getattr(rel, "name", None)
     if name is not None:
-        r.set("name", name)
+        r.set("name", escape_invalid_xml(name))
     access_type = getattr(rel, "access_type", None)
     if access_type == "Read":
         r.set("accessType", "1")
@@ -176,9 +197,9 @@ def _write_relationship(folders: dict[str, _Element], rel: object, xsi: et.QName
     desc = getattr(rel, "desc", None)
     if desc is not None:
         doc = et.SubElement(r, "documentation")
-        doc.text = desc
+        doc.text = escape_invalid_xml(desc)
     for k, v in getattr(rel, "props", {}).items():
-        et.SubElement(r, "property", key=k, value=str(v))
+        et.SubElement(r, "property", key=escape_invalid_xml(k), value=escape_invalid_xml(str(v)))
     profile_id = getattr(rel, "profile_id", None)
     if profile_id is not None:
         r.set("profiles", profile_id)
@@ -188,7 +209,7 @@ def _write_connection(child: _Element, conn: object, xsi: et.QName) -> None:  #
     conn_source = getattr(conn, "source", None)
     conn_target = getattr(conn, "target", None)
     if conn_source is None or conn_target is None:
-        log.debug(f"Skipping connection {getattr(conn, 'uuid', '?')}: missing source or target node")
+        log.debug("Skipping connection %s: missing source or target node", getattr(conn, "uuid", "?"))
         return
     attrs = {
         str(xsi): "archimate:Connection",
@@ -224,14 +245,18 @@ def _write_connection(child: _Element, conn: object, xsi: et.QName) -> None:  #
     text_position = getattr(conn, "text_position", None)
     if text_position is not None:
         c.set("textPosition", text_position)
+    # Endpoint centres are the same for every bendpoint: read them (and each bendpoint's coordinates) once
+    s_cx, s_cy = conn_source.cx, conn_source.cy
+    t_cx, t_cy = conn_target.cx, conn_target.cy
     for bp in getattr(conn, "bendpoints", []):
+        x, y = bp.x, bp.y
         et.SubElement(
             c,
             "bendpoint",
-            startX=str(round(bp.x - conn_source.cx)),
-            startY=str(round(bp.y - conn_source.cy)),
-            endX=str(round(bp.x - conn_target.cx)),
-            endY=str(round(bp.y - conn_target.cy)),
+            startX=str(round(x - s_cx)),
+            startY=str(round(y - s_cy)),
+            endX=str(round(x - t_cx)),
+            endY=str(round(y - t_cy)),
         )
 
 
@@ -290,11 +315,11 @@ def _set_node_cat_content(child: _Element, node: object, xsi: et.QName) -> None:
         child.set("archimateElement", node_ref or "")
     elif cat == "Container":
         child.set(str(xsi), "archimate:Group")
-        child.set("name", node_label or "")
+        child.set("name", escape_invalid_xml(node_label or ""))
     elif cat == "Label":
         child.set(str(xsi), "archimate:Note")
         content = et.SubElement(child, "content")
-        content.text = node_label
+        content.text = None if node_label is None else escape_invalid_xml(node_label)
     elif cat == "Model":
         child.set(str(xsi), "archimate:DiagramModelReference")
         child.set("model", node_ref or "")
@@ -364,7 +389,7 @@ def _write_view_element(view_folder: _Element, view: object, xsi: et.QName) -> N
         "element",
         {
             str(xsi): "archimate:ArchimateDiagramModel",
-            "name": getattr(view, "name", ""),
+            "name": escape_invalid_xml(getattr(view, "name", None) or ""),
             "id": getattr(view, "uuid", ""),
         },
     )
@@ -377,18 +402,18 @@ def _write_view_element(view_folder: _Element, view: object, xsi: et.QName) -> N
     view_desc = getattr(view, "desc", None)
     if view_desc is not None:
         doc = et.SubElement(e, "documentation")
-        doc.text = view_desc
+        doc.text = escape_invalid_xml(view_desc)
     for k, v in getattr(view, "props", {}).items():
-        et.SubElement(e, "property", key=k, value=str(v))
+        et.SubElement(e, "property", key=escape_invalid_xml(k), value=escape_invalid_xml(str(v)))
 
 
 def _write_model_metadata(root: _Element, model: Model) -> None:
-    root.set("name", model.name or "")
+    root.set("name", escape_invalid_xml(model.name or ""))
     if model.desc is not None:
         doc = et.SubElement(root, "purpose")
-        doc.text = model.desc
+        doc.text = escape_invalid_xml(model.desc)
     for k, v in model.props.items():
-        et.SubElement(root, "property", key=k, value=str(v))
+        et.SubElement(root, "property", key=escape_invalid_xml(k), value=escape_invalid_xml(str(v)))
     for p in model.profiles:
         et.SubElement(root, "profile", name=p.name, id=p.uuid, conceptType=p.concept)
 
@@ -400,14 +425,8 @@ def archi_writer(model: Model, file_path: str) -> str:
     :param model: the model to write
     :param file_path: output file path
     """
-    xml = b"""<?xml version="1.0" encoding="UTF-8"?>
-    <archimate:model xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns:archimate="http://www.archimatetool.com/archimate" name="(new model)" id="id-2b0c639b388044d09709ceaaadbcf40f" version="4.9.0">
-    </archimate:model>
-    """
-
-    root = et.fromstring(xml)
-    xsi_url = "http://www.w3.org/2001/XMLSchema-instance"  # NOSONAR
-    xsi = et.QName(xsi_url, "type")
+    root = copy.deepcopy(_MODEL_TEMPLATE)
+    xsi = _XSI_TYPE
     folders = _create_folders(root)
 
     for elem in model.elements:
@@ -432,7 +451,10 @@ def archi_writer(model: Model, file_path: str) -> str:
                     zf.writestr("model.xml", xml_str)
                     # Write images if they exist
                     for img_filename, img_bytes in model._images_dict.items():
-                        zf.writestr(img_filename, img_bytes)
+                        if img_filename.lower().endswith(_PRECOMPRESSED_IMAGE_EXTS):
+                            zf.writestr(img_filename, img_bytes, compress_type=zipfile.ZIP_STORED)
+                        else:
+                            zf.writestr(img_filename, img_bytes)
             else:
                 # Write plain XML for .xml format
                 with open(file_path, "wb") as fd:
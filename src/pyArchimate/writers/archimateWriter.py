@@ -5,12 +5,13 @@ Supports ArchiMate 3.x specification and standard exchange metadata.
 """
 
 # ruff: noqa: N999  # legacy module name preserved for API compatibility
+import copy
 import os
 import sys
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
+from functools import lru_cache
 from typing import Any
-from typing import cast as _cast
 
 from lxml import etree as et
 from lxml.etree import _Element
@@ -27,6 +28,7 @@ try:
     from ..helpers.logging import log
     from ..model import Model, default_color
     from ..view import Node
+    from ._xml_helpers import escape_invalid_xml
 except ImportError:
     sys.path.insert(0, "..")
     from pyArchimate import (  # type: ignore[no-redef,attr-defined]  # noqa: E401
@@ -39,83 +41,88 @@ except ImportError:
         default_theme,
         log,
     )
+    from pyArchimate.writers._xml_helpers import escape_invalid_xml  # type: ignore[no-redef]
 
 __mod__ = __name__.split(".")[len(__name__.split(".")) - 1]
 __location__ = os.path.realpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
 
-_NS_ITEM = "ns:item"
-
 _GetPropId = Callable[[str], str]
 
-
-def _get_prop_def_id(model: Model, k: str) -> str:
-    id_list = [x for x, y in model.pdefs.items() if y == k]
-    if len(id_list) == 0:
-        prop_id: str = "propid-" + str(len(model.pdefs) + 1)
-        model.pdefs[prop_id] = k
+# Per-document invariants, set up once at import rather than on every write
+_MODEL_TEMPLATE = et.fromstring(
+    b"""<?xml version="1.0" encoding="UTF-8"?>
+    <model xmlns="http://www.opengroup.org/xsd/archimate/3.0/" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://www.opengroup.org/xsd/archimate/3.0/ http://www.opengroup.org/xsd/archimate/3.0/archimate3.xsd" identifier="id-a84d2455d48c44a2847b3407e270599f">
+    </model>
+    """
+)
+_XSI_URL = "http://www.w3.org/2001/XMLSchema-instance"  # NOSONAR
+_XSI_TYPE = et.QName(_XSI_URL, "type")
+
+
+def _prop_def_lookup(model: Model) -> _GetPropId:
+    """Return a resolver from property name to ``model.pdefs`` identifier, registering unknown names."""
+    # Reverse index built once per write: each property reference is a dict hit instead of a scan of pdefs
+    ids: dict[str, str] = {}
+    for prop_id, name in model.pdefs.items():
+        ids.setdefault(name, prop_id)
+
+    def get_prop_id(k: str) -> str:
+        prop_id = ids.get(k)
+        if prop_id is None:
+            prop_id = "propid-" + str(len(model.pdefs) + 1)
+            model.pdefs[prop_id] = k
+            ids[k] = prop_id
         return prop_id
-    return str(id_list[0])
+
+    return get_prop_id
+
+
+def _text_child(parent: _Element, tag: str, text: str | None) -> _Element:
+    """Append a ``<tag>`` child holding ``text``: the single place user text is escaped for this format."""
+    child = et.SubElement(parent, tag)
+    if text is not None:
+        child.text = escape_invalid_xml(text)
+    return child
 
 
-def _write_properties(parent: _Element, props: dict[str, object], model: Model) -> None:
-    pp = et.SubElement(parent, "properties")
-    for k, v in props.items():
-        prop_id = _get_prop_def_id(model, k)
-        p = et.SubElement(pp, "property", propertyDefinitionRef=prop_id)
-        pv = et.SubElement(p, "value")
-        pv.text = str(v)
+def _write_properties(parent: _Element, props: dict[str, object], get_prop_id: _GetPropId) -> None:
+    _write_property_values(parent, props.items(), get_prop_id)
+
+
+def _write_property_values(parent: _Element, values: Iterable[tuple[str, object]], get_prop_id: _GetPropId) -> None:
+    # Single <properties> block, only created once there is a first value to put in it
+    pp = None
+    for k, v in values:
+        if pp is None:
+            pp = et.SubElement(parent, "properties")
+        p = et.SubElement(pp, "property", propertyDefinitionRef=get_prop_id(k))
+        _text_child(p, "value", str(v))
 
 
 def _write_elem_name_doc(elem: _Element, e: Any) -> None:
     if e.name is None:
         e.name = e.type
     if e.name is not None:
-        e_name = et.SubElement(elem, "name")
-        e_name.text = e.name
+        _text_child(elem, "name", e.name)
     if e.desc is not None and e.desc != "":
-        e_desc = et.SubElement(elem, "documentation")
-        e_desc.text = e.desc
-
+        _text_child(elem, "documentation", e.desc)
 
-def _write_elem_viewpoints(elem: _Element, e: Any, model: Model) -> None:
-    for slug in getattr(e, "viewpoints", []):
-        vp_prop_id = _get_prop_def_id(model, "viewpoint")
-        pp = elem.find("properties")
-        if pp is None:
-            pp = et.SubElement(elem, "properties")
-        p = et.SubElement(pp, "property", propertyDefinitionRef=vp_prop_id)
-        pv = et.SubElement(p, "value")
-        pv.text = slug
 
-
-def _write_elem_visual_style(elem: _Element, e: Any, model: Model) -> None:
+def _elem_property_values(e: Any) -> Iterator[tuple[str, object]]:
+    """Yield an element's (property name, value) pairs in export order: props, visual style, junction, viewpoints."""
+    yield from e.props.items()
     visual_style = getattr(e, "_visual_style", {})
-    if not visual_style:
-        return
-    pp = elem.find("properties")
-    if pp is None:
-        pp = et.SubElement(elem, "properties")
     for key in ["fillColor", "lineColor", "lineWidth", "transparency"]:
         if key in visual_style:
-            prop_id = _get_prop_def_id(model, key)
-            p = et.SubElement(pp, "property", propertyDefinitionRef=prop_id)
-            pv = et.SubElement(p, "value")
-            pv.text = str(visual_style[key])
-
-
-def _write_elem_junction_type(elem: _Element, e: Any, model: Model) -> None:
+            yield key, visual_style[key]
     # Junction semantics are encoded in the element's xsi:type (OrJunction /
     # AndJunction) written by _write_elements, so a redundant junctionType
     # property is only written when the type is the plain 'Junction' fallback.
     junction_type = getattr(e, "junction_type", None)
     if junction_type and getattr(e, "type", None) == "Junction":
-        pp = elem.find("properties")
-        if pp is None:
-            pp = et.SubElement(elem, "properties")
-        prop_id = _get_prop_def_id(model, "junctionType")
-        p = et.SubElement(pp, "property", propertyDefinitionRef=prop_id)
-        pv = et.SubElement(p, "value")
-        pv.text = junction_type
+        yield "junctionType", junction_type
+    for slug in getattr(e, "viewpoints", []):
+        yield "viewpoint", slug
 
 
 def _get_elem_xsi_type(e: Any) -> str:
@@ -137,7 +144,7 @@ def _ensure_folder(e: Any) -> None:
         e.folder = "/" + cat
 
 
-def _write_elements(root: _Element, model: Model, xsi: et.QName) -> None:
+def _write_elements(root: _Element, model: Model, xsi: et.QName, get_prop_id: _GetPropId) -> None:
     elems = et.SubElement(root, "elements")
     for e in model.elements:
         _ensure_folder(e)
@@ -148,37 +155,25 @@ def _write_elements(root: _Element, model: Model, xsi: et.QName) -> None:
             elem_attrs["parentId"] = parent_uuid
         elem = et.SubElement(elems, "element", elem_attrs)
         _write_elem_name_doc(elem, e)
-        if e.props:
-            _write_properties(elem, e.props, model)
-        _write_elem_visual_style(elem, e, model)
-        _write_elem_junction_type(elem, e, model)
-        _write_elem_viewpoints(elem, e, model)
+        _write_property_values(elem, _elem_property_values(e), get_prop_id)
 
 
-def _write_rel_attrs(elem: _Element, e: Any, model: Model) -> None:
+def _write_rel_attrs(elem: _Element, e: Any, get_prop_id: _GetPropId) -> None:
     if e.access_type is not None and e.type == ArchiType.Access:
         elem.set("accessType", e.access_type)
     if e.is_directed is not None and e.type == ArchiType.Association:
         elem.set("isDirected", "true")
     if e.name is not None:
-        e_name = et.SubElement(elem, "name")
-        e_name.text = e.name
+        _text_child(elem, "name", e.name)
     if e.desc is not None:
-        e_desc = et.SubElement(elem, "documentation")
-        e_desc.text = e.desc
-    if e.props:
-        _write_properties(elem, e.props, model)
+        _text_child(elem, "documentation", e.desc)
+    values: list[tuple[str, object]] = list(e.props.items())
     if e.influence_strength is not None and e.type == ArchiType.Influence:
-        pp = elem.find("properties")
-        if pp is None:
-            pp = et.SubElement(elem, "properties")
-        prop_id = _get_prop_def_id(model, "influenceStrength")
-        p = et.SubElement(pp, "property", propertyDefinitionRef=prop_id)
-        pv = et.SubElement(p, "value")
-        pv.text = e.influence_strength
+        values.append(("influenceStrength", e.influence_strength))
+    _write_property_values(elem, values, get_prop_id)
 
 
-def _write_relationships(root: _Element, model: Model, xsi: et.QName) -> None:
+def _write_relationships(root: _Element, model: Model, xsi: et.QName, get_prop_id: _GetPropId) -> None:
     rels = et.SubElement(root, "relationships")
     for e in model.relationships:
         assert e.source is not None and e.target is not None
@@ -187,7 +182,7 @@ def _write_relationships(root: _Element, model: Model, xsi: et.QName) -> None:
             "relationship",
             {"identifier": e.uuid, "source": e.source.uuid, "target": e.target.uuid, str(xsi): e.type},
         )
-        _write_rel_attrs(elem, e, model)
+        _write_rel_attrs(elem, e, get_prop_id)
 
 
 def _collect_orgs_dict(model: Model) -> dict[str, list[str]]:
@@ -204,60 +199,57 @@ def _collect_orgs_dict(model: Model) -> dict[str, list[str]]:
     return orgs_dict
 
 
-def _write_org_path(orgs: _Element, k: str, orgs_dict: dict[str, list[str]], ns_find: dict[str, str]) -> None:
-    labels = k.split("/")
-    item = orgs
-    for label in labels[1:-1]:
-        if item.find(_NS_ITEM, ns_find) is None:
-            item = et.SubElement(item, "item")
-        else:
-            item = _cast(_Element, item.find(_NS_ITEM, ns_find))
-        lbl = et.SubElement(item, "label")
-        lbl.text = label
-    if item.find(_NS_ITEM, ns_find) is None:
-        item = et.SubElement(item, "item")
-    else:
-        item = _cast(_Element, item.find(_NS_ITEM, ns_find))
-    lbl = et.SubElement(item, "label")
-    lbl.text = labels[-1]
-    for i in orgs_dict[k]:
-        et.SubElement(item, "item", identifierRef=i)
+def _org_item(items: dict[str, _Element], path: str) -> _Element:
+    item = items.get(path)
+    if item is None:
+        parent_path, _, label = path.rpartition("/")
+        item = et.SubElement(_org_item(items, parent_path), "item")
+        _text_child(item, "label", label)
+        items[path] = item
+    return item
 
 
-def _write_organizations(root: _Element, model: Model, ns_find: dict[str, str]) -> None:
+def _write_organizations(root: _Element, model: Model) -> None:
     orgs_dict = _collect_orgs_dict(model)
     orgs = et.SubElement(root, "organizations")
+    # Folder path -> its <item>: a shared prefix such as "/Application" is built once and reused by every subfolder
+    items: dict[str, _Element] = {"": orgs}
     for k in sorted(orgs_dict.keys()):
-        _write_org_path(orgs, k, orgs_dict, ns_find)
+        item = _org_item(items, k)
+        for i in orgs_dict[k]:
+            et.SubElement(item, "item", identifierRef=i)
+
+
+# Views reuse a small palette, so each distinct hex color is decoded and stringified once per process
+@lru_cache(maxsize=1024)
+def _rgb_attrs(color: str | None) -> tuple[str, str, str]:
+    """Return the decimal ``r``, ``g``, ``b`` attribute strings of a ``#RRGGBB`` color."""
+    rgb = RGBA()
+    rgb.color = color
+    return str(rgb.r), str(rgb.g), str(rgb.b)
+
+
+def _color_child(parent: _Element, tag: str, color: str | None) -> _Element:
+    child = et.SubElement(parent, tag)
+    r, g, b = _rgb_attrs(color)
+    child.set("r", r)
+    child.set("g", g)
+    child.set("b", b)
+    return child
 
 
 def _write_node_style(n_elem: _Element, n: Node) -> None:
     style = et.SubElement(n_elem, "style")
     if n.line_color is not None:
-        lc = et.SubElement(style, "lineColor")
-        rgb = RGBA()
-        rgb.color = n.line_color
-        lc.set("r", str(rgb.r))
-        lc.set("g", str(rgb.r))
-        lc.set("b", str(rgb.b))
+        lc = _color_child(style, "lineColor", n.line_color)
         lc.set("a", "100" if n.opacity is None else str(n.lc_opacity))
     if n.fill_color is not None:
         if n.fill_color != default_color(n.type or "", default_theme):
-            fc = et.SubElement(style, "fillColor")
-            rgb = RGBA()
-            rgb.color = n.fill_color
-            fc.set("r", str(rgb.r))
-            fc.set("g", str(rgb.g))
-            fc.set("b", str(rgb.b))
+            fc = _color_child(style, "fillColor", n.fill_color)
             fc.set("a", "100" if n.opacity is None else str(n.opacity))
     if n.font_name is not None:
         ft = et.SubElement(style, "font", attrib={"name": n.font_name, "size": str(n.font_size)})
-        rgb = RGBA()
-        ftc = et.SubElement(ft, "color")
-        rgb.color = n.font_color
-        ftc.set("r", str(rgb.r))
-        ftc.set("g", str(rgb.g))
-        ftc.set("b", str(rgb.b))
+        _color_child(ft, "color", n.font_color)
 
 
 def _add_node(parent: _Element, n: Node, xsi: et.QName) -> None:
@@ -281,8 +273,7 @@ def _add_node(parent: _Element, n: Node, xsi: et.QName) -> None:
             "node",
             attrib={"identifier": n.uuid, str(xsi): n.cat, "x": str(n.x), "y": str(n.y), "w": str(n.w), "h": str(n.h)},
         )
-        lbl = et.SubElement(n_elem, "label")
-        lbl.text = n.label
+        _text_child(n_elem, "label", n.label)
     _write_node_style(n_elem, n)
     if n.cat == "Model":
         et.SubElement(n_elem, "viewRef", ref=n.ref or "")
@@ -297,26 +288,16 @@ def _write_conn_style(c_elem: _Element, c: Any) -> None:
         style.set("lineWidth", str(c.line_width))
     if c.line_color is not None:
         if c.line_color != default_color(c.type, default_theme):
-            lc = et.SubElement(style, "lineColor")
-            rgb = RGBA()
-            rgb.color = c.line_color
-            lc.set("r", str(rgb.r))
-            lc.set("g", str(rgb.g))
-            lc.set("b", str(rgb.b))
+            _color_child(style, "lineColor", c.line_color)
     if c.font_name is not None:
         ft = et.SubElement(style, "font", attrib={"name": c.font_name, "size": str(c.font_size)})
-        rgb = RGBA()
-        ftc = et.SubElement(ft, "color")
-        rgb.color = c.font_color
-        ftc.set("r", str(rgb.r))
-        ftc.set("g", str(rgb.g))
-        ftc.set("b", str(rgb.b))
+        _color_child(ft, "color", c.font_color)
 
 
 def _write_connections(view_elem: _Element, _v: object, xsi: et.QName) -> None:
     for c in _v.conns:  # type: ignore[attr-defined]
         if c.source is None or c.target is None:
-            log.debug(f"Skipping connection {c.uuid}: missing source or target node")
+            log.debug("Skipping connection %s: missing source or target node", c.uuid)
             continue
         # Do NOT skip connections between embedded nodes — the OpenGroup format
         # must preserve all explicit connections regardless of visual containment.
@@ -333,10 +314,11 @@ def _write_connections(view_elem: _Element, _v: object, xsi: et.QName) -> None:
         )
         _write_conn_style(c_elem, c)
         for bp in c.get_all_bendpoints():
-            et.SubElement(c_elem, "bendpoint", x=str(int(round(bp.x))), y=str(int(round(bp.y))))
+            # round() already returns an int, so each coordinate is converted once
+            et.SubElement(c_elem, "bendpoint", x=str(round(bp.x)), y=str(round(bp.y)))
 
 
-def _write_views(root: _Element, model: Model, xsi: et.QName) -> None:
+def _write_views(root: _Element, model: Model, xsi: et.QName, get_prop_id: _GetPropId) -> None:
     if not model.views:
         return
     views = et.SubElement(root, "views")
@@ -349,13 +331,11 @@ def _write_views(root: _Element, model: Model, xsi: et.QName) -> None:
             view_attrib["viewpoint"] = primary_vp
         view_elem = et.SubElement(diag, "view", attrib=view_attrib)
         if _v.name is not None:
-            v_name = et.SubElement(view_elem, "name")
-            v_name.text = _v.name
+            _text_child(view_elem, "name", _v.name)
         if _v.desc is not None:
-            doc = et.SubElement(view_elem, "documentation")
-            doc.text = _v.desc
+            _text_child(view_elem, "documentation", _v.desc)
         if _v.props:
-            _write_properties(view_elem, _v.props, model)
+            _write_properties(view_elem, _v.props, get_prop_id)
         for _n in _v.nodes:
             _add_node(view_elem, _n, xsi)
         _write_connections(view_elem, _v, xsi)
@@ -368,42 +348,30 @@ def archimate_writer(model: Model, file_path: str | None = None) -> str:
     Used by Model.write(filepath) method
 
     """
-    xml = b"""<?xml version="1.0" encoding="UTF-8"?>
-    <model xmlns="http://www.opengroup.org/xsd/archimate/3.0/" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://www.opengroup.org/xsd/archimate/3.0/ http://www.opengroup.org/xsd/archimate/3.0/archimate3.xsd" identifier="id-a84d2455d48c44a2847b3407e270599f">
-    </model>
-    """
-
-    root = et.fromstring(xml)
-    nsp_url = "http://www.opengroup.org/xsd/archimate/3.0/"  # NOSONAR
-    xsi_url = "http://www.w3.org/2001/XMLSchema-instance"  # NOSONAR
-    xsi = et.QName(xsi_url, "type")
-    ns_find: dict[str, str] = {"ns": nsp_url}
+    root = copy.deepcopy(_MODEL_TEMPLATE)
+    xsi = _XSI_TYPE
 
-    name = et.SubElement(root, "name")
-    name.text = model.name if model.name is not None else "Archimate Model"
+    _text_child(root, "name", model.name if model.name is not None else "Archimate Model")
 
     if model.desc is not None:
-        doc = et.SubElement(root, "documentation")
-        doc.text = model.desc
+        _text_child(root, "documentation", model.desc)
 
+    get_prop_id = _prop_def_lookup(model)
     if model.props:
-        _write_properties(root, model.props, model)
-
-    _write_elements(root, model, xsi)
-    _write_relationships(root, model, xsi)
-    _write_organizations(root, model, ns_find)
+        _write_properties(root, model.props, get_prop_id)
 
-    pd = et.SubElement(root, "propertyDefinitions")
-    for k, v in model.pdefs.items():
-        p = et.SubElement(pd, "propertyDefinition", identifier=k, type="string")
-        p_name = et.SubElement(p, "name")
-        p_name.text = str(v)
+    _write_elements(root, model, xsi, get_prop_id)
+    _write_relationships(root, model, xsi, get_prop_id)
+    _write_organizations(root, model)
 
-    _write_views(root, model, xsi)
+    # Emitted in a single pass: the container only exists when there is something to put in it
+    if model.pdefs:
+        pd = et.SubElement(root, "propertyDefinitions")
+        for k, v in model.pdefs.items():
+            p = et.SubElement(pd, "propertyDefinition", identifier=k, type="string")
+            _text_child(p, "name", str(v))
 
-    pd_check = root.find("propertyDefinitions")
-    if pd_check is not None and pd_check.find("propertyDefinition") is None:
-        root.remove(pd_check)
+    _write_views(root, model, xsi, get_prop_id)
 
     xml_str = et.tostring(root, encoding="UTF-8", pretty_print=True)
 
@@ -0,0 +1,53 @@
+"""Wall-clock import budgets for the lazy top-level package.
+
+Timing depends on the machine, so this module sits outside the default ``testpaths``; run it
+explicitly with ``pytest tests/performance/test_import_time_budget.py``.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+# Generous budgets (microseconds): the lazy package itself costs well under 10 ms locally
+PACKAGE_IMPORT_BUDGET_US = 150_000
+ARCHI_TYPE_IMPORT_BUDGET_US = 30_000
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    """Return the cumulative import time (us) of each top-level pyArchimate import in ``statement``."""
+    code = f"import sys; sys.path.insert(0, {str(SRC_DIR)!r}); {statement}"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={k: v for k, v in os.environ.items() if k != "EAGER_IMPORT"},
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        # nested imports are indented under their importer and already counted in its cumulative time
+        if name.startswith(" pyArchimate") and cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize(
+    ("statement", "budget_us"),
+    [
+        ("import pyArchimate", PACKAGE_IMPORT_BUDGET_US),
+        ("from pyArchimate import ArchiType", ARCHI_TYPE_IMPORT_BUDGET_US),
+    ],
+)
+def test_import_time_within_budget(statement, budget_us):
+    times = _import_times(statement)
+    assert "pyArchimate" in times
+    total_us = sum(times.values())
+    assert total_us < budget_us, f"{statement!r} took {total_us} us: {times}"
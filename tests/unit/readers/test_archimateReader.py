@@ -1,4 +1,5 @@
-from unittest.mock import MagicMock, patch
+import logging
+from unittest.mock import MagicMock
 
 import pytest
 from lxml import etree
@@ -12,6 +13,7 @@ from src.pyArchimate.readers.archimateReader import (
     _build_hierarchy_from_parents,
     _extract_visual_style_properties,
     _normalize_color_on_import,
+    _xml_color,
     archimate_reader,
 )
 
@@ -216,6 +218,13 @@ def test_archimate_reader_merges_property_with_conflicting_definition():
     assert any(name.startswith("propid-") for name in model.pdefs)
 
 
+def test_archimate_reader_merge_reuses_property_definition_with_same_name():
+    model = Model("same-name")
+    model.pdefs["propid-7"] = "priority"
+    archimate_reader(model, etree.fromstring(MERGE_PROP_MODEL), merge_flg=True)
+    assert model.pdefs == {"propid-7": "priority"}
+
+
 # ArchiMate 3.x Compliance: BusinessInteraction
 BUSINESS_INTERACTION_OPENGROUP_MODEL = """<?xml version='1.0'?>
 <model xmlns='http://www.opengroup.org/xsd/archimate/3.0/' xmlns:xsi='http://www.w3.org/2001/XMLSchema-instance'>
@@ -350,6 +359,11 @@ def test_apply_node_style_line_color_with_alpha():
     assert node.lc_opacity == 64
 
 
+def test_xml_color_clamps_and_formats_each_channel():
+    assert _xml_color(etree.Element("fillColor", r="10", g="300", b="-5")) == "#0AFF00"
+    assert _xml_color(etree.Element("lineColor", r="10", g="300", b="-5")) == "#0AFF00"
+
+
 def test_apply_conn_style_no_style_element():
     """Connection without <style> element does not raise (line 178)."""
     root = etree.fromstring(LINE_COLOR_ALPHA_MODEL)
@@ -495,6 +509,11 @@ def test_normalize_color_on_import_valid_hex_lowercased():
     assert result == "#ff0000"
 
 
+def test_normalize_color_on_import_rejects_hex_with_extra_digits():
+    """Only exactly six hex digits are accepted."""
+    assert _normalize_color_on_import("#ff00001") is None
+
+
 # ---------------------------------------------------------------------------
 # _extract_visual_style_properties coverage (lines 53, 56, 67, 73-75)
 # ---------------------------------------------------------------------------
@@ -820,7 +839,7 @@ def test_element_hierarchy_via_parent_id():
     assert parent.uuid == "p1"
 
 
-def test_visual_style_application_warnings_real():
+def test_visual_style_application_warnings_real(caplog):
     """Lines 418-434: log.warning is called when visual style application fails.
     Renamed to avoid conflict with existing test_visual_style_except_blocks_do_not_raise.
     """
@@ -858,14 +877,14 @@ def test_visual_style_application_warnings_real():
     model.add = mocked_add
     model.elems_dict["e1"] = mock_elem
 
-    with patch("src.pyArchimate.readers.archimateReader.log") as mock_log:
+    with caplog.at_level(logging.WARNING):
         archimate_reader(model, root)
 
-        warning_calls = [call.args[0] for call in mock_log.warning.call_args_list]
-        assert any("Failed to apply fillColor" in msg for msg in warning_calls)
-        assert any("Failed to apply lineColor" in msg for msg in warning_calls)
-        assert any("Failed to apply lineWidth" in msg for msg in warning_calls)
-        assert any("Failed to apply transparency" in msg for msg in warning_calls)
+    warnings = [r.getMessage() for r in caplog.records if r.levelno == logging.WARNING]
+    assert "Failed to apply fillColor to e1: bad color" in warnings
+    assert "Failed to apply lineColor to e1: bad line color" in warnings
+    assert "Failed to apply lineWidth to e1: bad width" in warnings
+    assert "Failed to apply transparency to e1: bad alpha" in warnings
 
 
 # ---------------------------------------------------------------------------
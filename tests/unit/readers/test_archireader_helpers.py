@@ -7,6 +7,7 @@ from src.pyArchimate.enums import AccessType
 from src.pyArchimate.pyArchimate import Model
 from src.pyArchimate.readers._archireader_helpers import (
     _parse_rel_attributes,
+    _process_property,
     _resolve_bp_coords,
     _resolve_rel_endpoints,
 )
@@ -24,6 +25,18 @@ def _fresh_rel(rel_type=ArchiType.Access):
     return m.add_relationship(rel_type, source=s, target=d)
 
 
+def test_process_property_shares_one_interned_key_across_elements():
+    m = Model("t")
+    a = m.add(ArchiType.BusinessActor, "A")
+    b = m.add(ArchiType.BusinessActor, "B")
+    _process_property(a, etree.Element("property", key="Owner", value="x"))
+    _process_property(b, etree.Element("property", key="Owner", value="y"))
+    key_a = next(iter(a.props))
+    key_b = next(iter(b.props))
+    assert key_a == "Owner"
+    assert key_a is key_b
+
+
 def test_parse_rel_attributes_access_type_read():
     rel = _fresh_rel()
     _parse_rel_attributes(rel, etree.Element("e", accessType="1"))
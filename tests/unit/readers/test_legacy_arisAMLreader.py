@@ -26,3 +26,34 @@ def test_aris_reader_handles_empty_tree():
     with pytest.raises(SystemExit) as exc:
         aris_reader(model, root)
     assert exc.value.code == 1
+
+
+def _aml_with_label(obj_id: str, label: str) -> etree._Element:
+    return etree.fromstring(
+        f'<AML><FFTextDef FFTextDef.ID="txt.{obj_id}" IsModelAttr="TEXT">'
+        f'<AttrDef AttrDef.Type="AT_NAME"><PlainText TextValue="{label}"/></AttrDef></FFTextDef>'
+        f'<Group><ObjDef ObjDef.ID="obj.{obj_id}" SymbolNum="ST_ARCHIMATE_APPLICATION_COMPONENT">'
+        f'<GUID>g-{obj_id}</GUID><AttrDef AttrDef.Type="AT_NAME"><PlainText TextValue="App"/></AttrDef>'
+        "</ObjDef></Group></AML>"
+    )
+
+
+def test_aris_reader_keeps_conversion_state_on_each_model():
+    first, second = Model("first"), Model("second")
+    aris_reader(first, _aml_with_label("1", "One"))
+    aris_reader(second, _aml_with_label("2", "Two"))
+    assert list(first.elems_dict) == ["id-1"] and list(first.labels_dict) == ["id-1"]
+    assert list(second.elems_dict) == ["id-2"] and list(second.labels_dict) == ["id-2"]
+
+
+def test_aris_reader_no_view_skips_labels_and_diagram_checks(monkeypatch):
+    model = Model("no-view")
+
+    def fail(*_args):
+        raise AssertionError("diagram checks must not run in no-view mode")
+
+    monkeypatch.setattr(model, "check_invalid_conn", fail)
+    monkeypatch.setattr(model, "check_invalid_nodes", fail)
+    aris_reader(model, _aml_with_label("1", "One"), no_view=True)
+    assert list(model.elems_dict) == ["id-1"]
+    assert not model.labels_dict
@@ -7,13 +7,19 @@ These tests are kept for backward compatibility but are not executed
 by default. Use tests for archimateReader or archiReader instead.
 """
 
+import sys
+
 import pytest
 from lxml import etree
 
 from src.pyArchimate.pyArchimate import Model
+from src.pyArchimate.readers import _arisamlreader_helpers as helpers
 from src.pyArchimate.readers._arisamlreader_helpers import (
+    _attr_text,
     clean_nested_conns,
+    get_text_size,
     id_of,
+    iter_groups,
     parse_connections,
     parse_containers,
     parse_elements,
@@ -65,6 +71,35 @@ def test_id_of_without_dot():
     assert id_of("simple") == "id-simple"
 
 
+def test_id_of_keeps_only_the_second_dotted_segment():
+    assert id_of("ObjDef.abc.extra") == "id-abc"
+
+
+# ── get_text_size ──────────────────────────────────────────────────────────
+
+
+def test_get_text_size_is_memoized_per_text_and_font():
+    first = get_text_size("Memo label", 9, "Segoe UI")
+    assert get_text_size("Memo label", 9, "Segoe UI") is first
+    assert first[0] > 0
+
+
+def test_get_text_size_pil_falls_back_to_heuristic_without_font(monkeypatch):
+    monkeypatch.setattr(helpers, "_pil_font", lambda points: None)
+    assert helpers._get_text_size_pil("abcd", 10, "Segoe UI") == (24.0, 10.0)
+
+
+# ── _attr_text ─────────────────────────────────────────────────────────────
+
+
+def test_attr_text_joins_nested_plain_text_values():
+    attr = etree.fromstring(
+        '<AttrDef AttrDef.Type="AT_NAME"><AttrValue><StyledElement><PlainText TextValue="Line 1"/>'
+        '</StyledElement><PlainText TextValue="Line 2"/></AttrValue></AttrDef>'
+    )
+    assert _attr_text(attr) == "Line 1\nLine 2\n"
+
+
 # ── parse_elements ─────────────────────────────────────────────────────────
 
 
@@ -101,6 +136,18 @@ def test_parse_elements_adds_element_with_props():
     assert len(model.elems_dict) == 1
 
 
+def test_parse_elements_adds_element_without_guid():
+    root = _make_aml_root()
+    g = _make_group("Application")
+    obj = _make_objdef("obj.1", "ST_ARCHIMATE_APPLICATION_COMPONENT", "MyApp")
+    obj.remove(obj.find("GUID"))
+    g.append(obj)
+    root.append(g)
+    model = _make_model()
+    parse_elements(None, root, model)
+    assert model.elems_dict["id-1"].prop("GUID") is None
+
+
 def test_parse_elements_with_explicit_group():
     # Wrap g inside parent so group.findall('Group') finds it
     parent = etree.Element("Container")
@@ -114,6 +161,32 @@ def test_parse_elements_with_explicit_group():
     assert len(model.elems_dict) == 1
 
 
+def test_iter_groups_yields_nested_groups_in_document_order_with_folders():
+    root = _make_aml_root()
+    a = _make_group("A")
+    a.append(_make_group("A1"))
+    root.append(a)
+    root.append(_make_group("B"))
+    assert [folder for _, folder in iter_groups(root)] == ["/A", "/A/A1", "/B"]
+
+
+def test_iter_groups_joins_every_name_line_into_the_folder_path():
+    root = _make_aml_root()
+    g = _make_group("A")
+    etree.SubElement(g.find("AttrDef"), "PlainText").set("TextValue", "B")
+    etree.SubElement(g, "Group")
+    root.append(g)
+    assert [folder for _, folder in iter_groups(root, "/Root")] == ["/Root/A/B", "/Root/A/B"]
+
+
+def test_iter_groups_handles_folder_trees_deeper_than_the_recursion_limit():
+    root = _make_aml_root()
+    parent = root
+    for i in range(sys.getrecursionlimit() + 100):
+        parent = etree.SubElement(parent, "Group")
+    assert sum(1 for _ in iter_groups(root)) == i + 1
+
+
 # ── parse_relationships ────────────────────────────────────────────────────
 
 
@@ -132,6 +205,23 @@ def test_parse_relationships_skips_unknown_target():
     assert len(model.rels_dict) == 0
 
 
+def test_parse_relationships_skips_cxndefs_of_objdef_not_added_as_element():
+    root = _make_aml_root()
+    g = _make_group("Rels")
+    src = etree.SubElement(g, "ObjDef")  # no SymbolNum: never added as an element
+    src.set("ObjDef.ID", "obj.1")
+    rel = etree.SubElement(src, "CxnDef")
+    rel.set("CxnDef.Type", "CT_ARCHIMATE_ASSOCIATION")
+    rel.set("CxnDef.ID", "rel.1")
+    rel.set("ToObjDef.IdRef", "obj.2")
+    g.append(_make_objdef("obj.2", "ST_ARCHIMATE_APPLICATION_COMPONENT", "Tgt"))
+    root.append(g)
+    model = _make_model()
+    parse_elements(None, root, model)
+    parse_relationships(None, root, model)
+    assert len(model.rels_dict) == 0
+
+
 def test_parse_relationships_adds_relationship():
     root = _make_aml_root()
     g = _make_group("Group")
@@ -239,6 +329,20 @@ def test_parse_nodes_grouping_node():
     assert node.fill_color == "#FFFFFF"
 
 
+def test_parse_nodes_skips_occurrence_of_unknown_element():
+    model, _ = _setup_model_with_element()
+    occ = etree.Element("ObjOcc")
+    occ.set("SymbolNum", "ST_ARCHIMATE_APPLICATION_COMPONENT")
+    occ.set("ObjOcc.ID", "occ.1")
+    occ.set("ObjDef.IdRef", "missing.1")
+    grp = etree.Element("View")
+    grp.append(occ)
+    view = model.add(concept_type="View", name="V")
+    parse_nodes(grp, view, model, 1.0, 1.0)
+    assert len(model.nodes_dict) == 0
+    assert "id-missing" not in model.elems_dict
+
+
 # ── parse_containers ───────────────────────────────────────────────────────
 
 
@@ -301,6 +405,20 @@ def test_parse_labels_adds_to_labels_dict():
     assert "id-1" in model.labels_dict
 
 
+def test_parse_labels_keeps_only_the_name_attribute():
+    root = _make_aml_root()
+    txt = etree.SubElement(root, "FFTextDef")
+    txt.set("FFTextDef.ID", "lbl.2")
+    txt.set("IsModelAttr", "TEXT")
+    for key, value in (("AT_NAME", "Label"), ("AT_DESC", "ignored")):
+        attr = etree.SubElement(txt, "AttrDef")
+        attr.set("AttrDef.Type", key)
+        etree.SubElement(attr, "PlainText").set("TextValue", value)
+    model = _make_model()
+    parse_labels(root, model)
+    assert model.labels_dict["id-2"] == "Label\n"
+
+
 # ── parse_connections ──────────────────────────────────────────────────────
 
 
@@ -341,6 +459,32 @@ def test_parse_connections_skips_unknown_rel():
     parse_connections(grp, view, model, 1.0, 1.0)  # no-op on unknown rel
 
 
+def test_parse_connections_adds_inner_positions_as_bendpoints():
+    model = _make_model()
+    model.add(concept_type="ApplicationComponent", name="A", uuid="id-a")
+    model.add(concept_type="ApplicationService", name="S", uuid="id-s")
+    model.add_relationship(rel_type="Serving", source="id-a", target="id-s", uuid="id-rel")
+    view = model.add(concept_type="View", name="V")
+    view.add(ref="id-a", x=0, y=0, w=120, h=55, uuid="id-na")
+    view.add(ref="id-s", x=300, y=0, w=120, h=55, uuid="id-ns")
+
+    grp = etree.Element("Group")
+    occ = etree.SubElement(grp, "ObjOcc")
+    occ.set("ObjOcc.ID", "na")
+    conn = etree.SubElement(occ, "CxnOcc")
+    conn.set("CxnOcc.ID", "c")
+    conn.set("CxnDef.IdRef", "rel")
+    conn.set("ToObjOcc.IdRef", "ns")
+    for x, y in ((0, 0), (10, 20), (30, 40), (300, 0)):
+        pos = etree.SubElement(conn, "Position")
+        pos.set("Pos.X", str(x))
+        pos.set("Pos.Y", str(y))
+
+    parse_connections(grp, view, model, 1.0, 1.0)
+    c = model.conns_dict["id-c"]
+    assert [(bp.x, bp.y) for bp in c.bendpoints] == [(10, 20), (30, 40)]
+
+
 # ── clean_nested_conns ─────────────────────────────────────────────────────
 
 
@@ -349,6 +493,28 @@ def test_clean_nested_conns_no_error_on_empty_model():
     clean_nested_conns(model)  # should not raise
 
 
+class _StubConn:
+    def __init__(self, model, uuid, parent, source, target):
+        self.model, self.uuid, self.parent, self.source, self.target = model, uuid, parent, source, target
+        model.conns_dict[uuid] = self
+
+    def delete(self):
+        del self.model.conns_dict[self.uuid]
+
+
+def test_clean_nested_conns_removes_conns_touching_their_parent_node_in_one_pass():
+    model, elem_uuid = _setup_model_with_element()
+    view = model.add(concept_type="View", name="V")
+    outer = view.add(ref=elem_uuid, x=0, y=0, w=300, h=200)
+    inner = view.add(ref=elem_uuid, x=10, y=10, w=120, h=55)
+    _StubConn(model, "from-parent", outer, outer, inner)
+    _StubConn(model, "to-parent", outer, inner, outer)
+    _StubConn(model, "sibling", outer, inner, inner)
+    _StubConn(model, "in-view", view, outer, inner)
+    clean_nested_conns(model)
+    assert sorted(model.conns_dict) == ["in-view", "sibling"]
+
+
 # ── parse_labels_in_view ──────────────────────────────────────────────────
 
 
@@ -387,6 +553,24 @@ def test_parse_labels_in_view_adds_label_node():
     assert len(model.nodes_dict) == 1
 
 
+def test_parse_labels_in_view_sizes_from_widest_and_tallest_lines(monkeypatch):
+    sizes = {"wide line": (100, 5), "tall": (10, 40)}
+    monkeypatch.setattr(helpers, "get_text_size", lambda text, points, font: sizes[text])
+    model = _make_model()
+    model.labels_dict = {"id-lbl1": "wide line\ntall"}
+    view = model.add(concept_type="View", name="V")
+
+    grp = etree.Element("Group")
+    occ = etree.SubElement(grp, "FFTextOcc")
+    occ.set("FFTextDef.IdRef", "lbl1")
+    etree.SubElement(occ, "Position")
+
+    parse_labels_in_view(grp, view, model, 1.0, 1.0)
+    node = next(iter(model.nodes_dict.values()))
+    assert node.w == 118
+    assert node.h == 30 + 40 * 1.5 * 2
+
+
 def test_parse_labels_in_view_skips_unknown_ref():
     model = _make_model()
     model.labels_dict = {}
@@ -400,6 +584,20 @@ def test_parse_labels_in_view_skips_unknown_ref():
     assert len(model.nodes_dict) == 0
 
 
+def test_parse_labels_in_view_skips_label_without_name():
+    model = _make_model()
+    model.labels_dict = {"id-lbl1": None}
+    view = model.add(concept_type="View", name="V")
+
+    grp = etree.Element("Group")
+    occ = etree.SubElement(grp, "FFTextOcc")
+    occ.set("FFTextDef.IdRef", "lbl1")
+    etree.SubElement(occ, "Position")
+
+    parse_labels_in_view(grp, view, model, 1.0, 1.0)
+    assert len(model.nodes_dict) == 0
+
+
 # ── parse_views ─────────────────────────────────────────────────────────────
 
 
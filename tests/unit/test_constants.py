@@ -1,4 +1,13 @@
-from src.pyArchimate.constants import RGBA
+import pytest
+
+from src.pyArchimate.constants import (
+    ALLOWED_RELATIONSHIP_TRIPLES,
+    ALLOWED_RELATIONSHIPS,
+    ARCHI_CATEGORY,
+    ARIS_TYPE_MAP,
+    INFLUENCE_STRENGTH,
+    RGBA,
+)
 
 
 def test_rgba_color_setter():
@@ -9,9 +18,66 @@ def test_rgba_color_setter():
     assert rgb.b == 0x3C
 
 
+def test_rgba_color_getter_is_zero_padded_uppercase_hex():
+    assert RGBA(r=10, g=171, b=0).color == "#0AAB00"
+
+
 def test_rgba_color_setter_none_is_noop():
     rgb = RGBA(r=10, g=20, b=30)
     rgb.color = None
     assert rgb.r == 10
     assert rgb.g == 20
     assert rgb.b == 30
+
+
+def test_rgba_clamps_channels_and_has_no_instance_dict():
+    rgb = RGBA(r=-5, g="300", b=12.9, a=150)
+    assert (rgb.r, rgb.g, rgb.b, rgb.a) == (0, 255, 12, 100)
+    assert not hasattr(rgb, "__dict__")
+
+
+def test_rgba_color_setter_reuses_parsed_channels():
+    from src.pyArchimate.constants import _parse_hex_rgb
+
+    _parse_hex_rgb.cache_clear()
+    first, second = RGBA(), RGBA()
+    first.color = "#FFFFB5"
+    second.color = "#FFFFB5"
+    assert (second.r, second.g, second.b) == (255, 255, 181)
+    assert _parse_hex_rgb.cache_info().hits == 1
+    with pytest.raises(ValueError):
+        first.color = "#GGGGGG"
+
+
+def test_allowed_relationship_triples_mirror_nested_rules():
+    assert ("ApplicationComponent", "ApplicationService", "r") in ALLOWED_RELATIONSHIP_TRIPLES
+    expected = {
+        (src, dst, key) for src, dsts in ALLOWED_RELATIONSHIPS.items() for dst, keys in dsts.items() for key in keys
+    }
+    assert expected == ALLOWED_RELATIONSHIP_TRIPLES
+
+
+def test_aris_type_map_is_read_only():
+    assert ARIS_TYPE_MAP["ST_ARCHIMATE_CAPABILITY"] == "Capability"
+    with pytest.raises(TypeError):
+        ARIS_TYPE_MAP["ST_NEW"] = "BusinessActor"  # type: ignore[index]
+
+
+def test_archi_category_is_read_only():
+    assert ARCHI_CATEGORY["BusinessActor"] == "Business"
+    with pytest.raises(TypeError):
+        ARCHI_CATEGORY["BusinessActor"] = "Other"  # type: ignore[index]
+
+
+def test_influence_strength_is_a_value_set():
+    assert {"++", "--", "0", "10"} <= INFLUENCE_STRENGTH
+    assert "11" not in INFLUENCE_STRENGTH
+
+
+def test_checker_rules_are_loaded_with_a_safe_yaml_loader():
+    import yaml
+
+    from src.pyArchimate.constants import _YamlLoader
+
+    assert issubclass(_YamlLoader, yaml.constructor.SafeConstructor)
+    assert not issubclass(_YamlLoader, yaml.constructor.FullConstructor)
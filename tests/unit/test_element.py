@@ -41,6 +41,12 @@ def test_element_invalid_type_raises():
         Element(elem_type="NotAType", name="x")
 
 
+@pytest.mark.parametrize("elem_type", ["name", "value", "upper", "mro"])
+def test_element_non_member_archi_type_attribute_raises(elem_type):
+    with pytest.raises(ArchimateConceptTypeError):
+        Element(elem_type=elem_type, name="x")
+
+
 def test_element_relationship_type_raises():
     with pytest.raises(ArchimateConceptTypeError):
         Element(elem_type=ArchiType.Serving, name="x")
@@ -103,6 +109,13 @@ def test_element_remove_prop_missing_is_noop(model_with_elem):
     e.remove_prop("ghost")  # must not raise
 
 
+def test_element_update_props_sets_many(model_with_elem):
+    _, e = model_with_elem
+    e.prop("x", "1")
+    e.update_props({"x": "2", "GUID": "g"})
+    assert e.props == {"x": "2", "GUID": "g"}
+
+
 # ---------------------------------------------------------------------------
 # Element.profile_name / profile_id / set_profile / reset_profile
 # ---------------------------------------------------------------------------
@@ -205,6 +218,21 @@ def test_element_rels_filtered(model_with_elem):
     assert len(e.rels(ArchiType.Serving)) == 1
 
 
+def test_element_rels_split_by_direction_and_type():
+    m = Model("rels")
+    a = m.add(ArchiType.ApplicationComponent, "A")
+    b = m.add(ArchiType.ApplicationComponent, "B")
+    c = m.add(ArchiType.ApplicationService, "C")
+    flow_in = m.add_relationship(ArchiType.Flow, source=b, target=a)
+    serving_out = m.add_relationship(ArchiType.Serving, source=a, target=c)
+    m.add_relationship(ArchiType.Serving, source=b, target=c)
+    assert a.in_rels() == [flow_in]
+    assert a.out_rels() == [serving_out]
+    assert a.rels() == [flow_in, serving_out]
+    assert a.rels(ArchiType.Serving) == [serving_out]
+    assert a.in_rels(ArchiType.Serving) == []
+
+
 def test_element_remove_folder(model_with_elem):
     _, e = model_with_elem
     e.folder = "/app"
@@ -221,6 +249,18 @@ def test_element_merge_same_type(model_with_elem):
     assert other.uuid not in m.elems_dict
 
 
+def test_element_merge_props_keeps_existing_and_takes_over_missing(model_with_elem):
+    m, e = model_with_elem
+    other = m.add(ArchiType.ApplicationComponent, "Other")
+    tags = ["a", "b"]
+    e.prop("color", "red")
+    other.prop("color", "blue")
+    other.prop("tags", tags)
+    e.merge(other, merge_props=True)
+    assert e.prop("color") == "red"
+    assert e.prop("tags") is tags
+
+
 def test_element_merge_wrong_type_raises(model_with_elem):
     m, e = model_with_elem
     other = m.add(ArchiType.ApplicationService, "Svc")
@@ -250,6 +290,18 @@ def test_element_delete_removes_related_relationships():
     assert rel_id not in m.rels_dict
 
 
+def test_element_delete_keeps_relationships_of_other_elements():
+    m = Model("del-test")
+    a = m.add(ArchiType.ApplicationComponent, "A")
+    b = m.add(ArchiType.ApplicationComponent, "B")
+    c = m.add(ArchiType.ApplicationService, "C")
+    outgoing = m.add_relationship(ArchiType.Flow, source=a, target=b)
+    unrelated = m.add_relationship(ArchiType.Serving, source=b, target=c)
+    a.delete()
+    assert outgoing.uuid not in m.rels_dict
+    assert list(m.rels_dict) == [unrelated.uuid]
+
+
 # ---------------------------------------------------------------------------
 # ArchiMate 3.x Compliance: BusinessInteraction
 # ---------------------------------------------------------------------------
@@ -342,6 +394,15 @@ def test_normalize_color_none_returns_none():
     assert _normalize_color(None) is None
 
 
+@pytest.mark.parametrize("color", ["#ABCDE", "#ABCDEFA", "#GGGGGG", "#abc\n12"])
+def test_normalize_color_rejects_malformed_hex(color):
+    """Hex colors must be exactly #RRGGBB."""
+    from src.pyArchimate.element import _normalize_color
+
+    with pytest.raises(ValueError, match="Invalid hex color"):
+        _normalize_color(color)
+
+
 # ---------------------------------------------------------------------------
 # element.delete with nodes in views (lines 187-188)
 # ---------------------------------------------------------------------------
@@ -405,6 +466,41 @@ def test_is_valid_uuid_invalid_string():
     assert _is_valid_uuid("not-a-uuid") is False
 
 
+@pytest.mark.parametrize(
+    "candidate",
+    [
+        "c9bf9e57-1685-4c89-bafb-ff5af830be8a",
+        "C9BF9E57-1685-4C89-BAFB-FF5AF830BE8A",
+        "c9bf9e57-1685-1c89-bafb-ff5af830be8a",
+        "c9bf9e57-1685-4c89-7afb-ff5af830be8a",
+        "c9bf9e5716854c89bafbff5af830be8a",
+        "{c9bf9e57-1685-4c89-bafb-ff5af830be8a}",
+        "c9bf9e57-1685-4c89-bafb-ff5af830be8g",
+        "id-c9bf9e57",
+    ],
+)
+def test_is_valid_uuid_v4_fast_path_matches_uuid_round_trip(candidate):
+    from uuid import UUID
+
+    from src.pyArchimate.element import _is_valid_uuid
+
+    try:
+        expected = str(UUID(candidate, version=4)) == candidate
+    except ValueError:
+        expected = False
+    assert _is_valid_uuid(candidate) is expected
+
+
+def test_set_id_normalizes_only_canonical_v4_uuids():
+    from src.pyArchimate.element import set_id
+
+    assert set_id("c9bf9e57-1685-4c89-bafb-ff5af830be8a") == "id-c9bf9e5716854c89bafbff5af830be8a"
+    assert set_id("C9BF9E57-1685-4C89-BAFB-FF5AF830BE8A") == "C9BF9E57-1685-4C89-BAFB-FF5AF830BE8A"
+    assert set_id("id-c9bf9e5716854c89bafbff5af830be8a") == "id-c9bf9e5716854c89bafbff5af830be8a"
+    generated = set_id()
+    assert generated.startswith("id-") and len(generated) == 35
+
+
 def test_normalize_color_variants():
     """Lines 70-78: _normalize_color logic coverage."""
     from src.pyArchimate.element import _normalize_color
@@ -472,6 +568,15 @@ def test_element_merge_updates_nodes_and_rels_extended():
     assert rel.target.uuid == e1.uuid
 
 
+def test_element_merge_repoints_both_ends_of_self_relationship():
+    m = Model("merge-loop")
+    keep = m.add(ArchiType.ApplicationComponent, "Keep")
+    other = m.add(ArchiType.ApplicationComponent, "Other")
+    loop = m.add_relationship(ArchiType.Flow, source=other, target=other)
+    keep.merge(other)
+    assert loop.source is keep and loop.target is keep
+
+
 def test_parent_uuid_property():
     """Line 501: parent_uuid coverage."""
     m = Model("m")
@@ -553,3 +658,12 @@ def test_junction_type_methods():
 
     with pytest.raises(ValueError, match="Invalid junction type"):
         e.set_junction_type("invalid")
+
+
+def test_element_type_is_stored_as_shared_plain_string():
+    model = Model("interned-types")
+    parsed = "".join(["Business", "Actor"])
+    a = model.add(parsed, "A")
+    b = model.add(ArchiType.BusinessActor, "B")
+    assert type(b.type) is str
+    assert a.type is b.type
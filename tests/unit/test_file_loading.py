@@ -89,6 +89,39 @@ class TestUnifiedFileLoading:
         assert "<?xml" in content
         assert "archimateModel" in content or "model" in content
 
+    def test_load_archimate_zip_reads_images_and_model_from_one_archive_open(self, tmp_path, monkeypatch):
+        """Images and model.xml are read through a single ZipFile instance."""
+        archive = tmp_path / "with_image.archimate"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("model.xml", '<?xml version="1.0"?><model/>')
+            zf.writestr("images/logo.png", b"PNGDATA")
+        opened = []
+        real_zipfile = zipfile.ZipFile
+
+        def counting_zipfile(*args, **kwargs):
+            opened.append(args[0])
+            return real_zipfile(*args, **kwargs)
+
+        monkeypatch.setattr("src.pyArchimate.model.zipfile.ZipFile", counting_zipfile)
+        m = Model("test")
+        content = m._load_file_contents(str(archive), "read")
+
+        assert content.endswith("<model/>")
+        assert m._images_dict == {"images/logo.png": b"PNGDATA"}
+        assert len(opened) == 1
+
+    def test_read_keeps_text_nodes_over_libxml2_default_limit(self, tmp_path):
+        doc = "x" * 11_000_000
+        xml = (
+            "<?xml version='1.0'?><model xmlns='http://www.opengroup.org/xsd/archimate/3.0/'>"
+            f"<name>big</name><documentation>{doc}</documentation></model>"
+        )
+        path = tmp_path / "big.xml"
+        path.write_text(xml, encoding="utf-8")
+        m = Model("test")
+        m.read(str(path))
+        assert m.desc == doc
+
     def test_load_file_encoding_error(self):
         """Handle encoding errors gracefully."""
         # Create a file with invalid UTF-8 bytes
@@ -0,0 +1,50 @@
+"""Import regression gate for the lazy top-level package.
+
+Imports pyArchimate in a fresh interpreter and fails if doing so starts pulling in heavy
+modules again.  Wall-clock budgets live in ``tests/performance/test_import_time_budget.py``,
+which is not collected by default.  To inspect a regression::
+
+    python -X importtime -c "import pyArchimate" 2> import.log && tuna import.log
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+HEAVY_MODULES = ("lxml", "PIL", "requests", "oyaml", "yaml")
+
+# EAGER_IMPORT=1 deliberately resolves every public name, so it must not leak into the cold-import checks
+_ENV = {k: v for k, v in os.environ.items() if k != "EAGER_IMPORT"}
+
+
+def _loaded_modules(statement: str) -> list[str]:
+    code = (
+        f"import sys; sys.path.insert(0, {str(SRC_DIR)!r}); {statement}\n"
+        "print('\\n'.join(sys.modules))"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=_ENV)
+    return proc.stdout.splitlines()
+
+
+def test_package_import_does_not_load_heavy_dependencies():
+    loaded = _loaded_modules("import pyArchimate")
+    assert not [m for m in loaded if m.split(".")[0] in HEAVY_MODULES]
+
+
+def test_archi_type_import_loads_only_the_enums_module():
+    loaded = _loaded_modules("from pyArchimate import ArchiType")
+    assert {m for m in loaded if m.split(".")[0] == "pyArchimate"} == {"pyArchimate", "pyArchimate.enums"}
+    assert not [m for m in loaded if m.split(".")[0] in HEAVY_MODULES]
+
+
+def test_readers_import_leaves_sys_path_untouched():
+    code = (
+        f"import sys; sys.path.insert(0, {str(SRC_DIR)!r}); before = list(sys.path)\n"
+        "import pyArchimate.readers.archimateReader\n"
+        "print(sys.path == before)"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=_ENV)
+    assert proc.stdout.strip() == "True"
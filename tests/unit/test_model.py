@@ -73,6 +73,11 @@ def test_default_color_unknown_type():
     assert default_color("NotAType") == "#FFFFFF"
 
 
+def test_default_color_unusable_theme_falls_back_to_archi_palette():
+    assert default_color("TechnologyService", "no-such-theme") == default_color("TechnologyService") == "#C9E7B7"
+    assert default_color("Assessment", {"business": "#AABBCC"}) == "#CCCCFF"
+
+
 # ---------------------------------------------------------------------------
 # Model.type property
 # ---------------------------------------------------------------------------
@@ -100,6 +105,18 @@ def test_model_remove_prop_missing_key_is_noop():
     m.remove_prop("no_such_key")  # must not raise
 
 
+def test_model_init_accepts_properties():
+    m = Model("x", author="X. Mayeur", version="1.0.0")
+    assert m.props == {"author": "X. Mayeur", "version": "1.0.0"}
+
+
+def test_model_update_props_sets_several_properties():
+    m = Model("x", author="a")
+    m.update_props({"author": "b", "release date": "2026"})
+    assert m.prop("author") == "b"
+    assert m.prop("release date") == "2026"
+
+
 # ---------------------------------------------------------------------------
 # Model.add_profile / get_profile
 # ---------------------------------------------------------------------------
@@ -163,6 +180,39 @@ def test_find_elements_no_criteria(simple_model):
     assert src in result and dst in result
 
 
+def test_find_elements_by_type_tracks_deletes_and_type_changes():
+    m = Model("type-index")
+    a = m.add(ArchiType.ApplicationComponent, "A")
+    b = m.add(ArchiType.ApplicationComponent, "B")
+    c = m.add(ArchiType.ApplicationComponent, "C")
+    b.delete()
+    c.type = ArchiType.Node
+    assert m.find_elements(elem_type=ArchiType.ApplicationComponent) == [a]
+    assert m.find_elements(name="C", elem_type="Node") == [c]
+
+
+def test_find_elements_by_type_keeps_model_order_after_retyping():
+    m = Model("retype")
+    a = m.add(ArchiType.BusinessRole, "dup")
+    b = m.add(ArchiType.BusinessActor, "dup")
+    a.type = ArchiType.BusinessActor
+    assert m.find_elements(elem_type=ArchiType.BusinessActor) == [a, b]
+    v = cast(View, m.add(ArchiType.View, "V"))
+    node = v.get_or_create_node("dup", ArchiType.BusinessActor, create_node=True)
+    assert node.ref == a.uuid
+    assert v.add_many(nodes=[("dup", ArchiType.BusinessActor, 0, 0)]) == [node]
+
+
+def test_add_replacing_an_id_with_another_type_keeps_model_order():
+    m = Model("replace")
+    first = m.add(ArchiType.BusinessRole, "X", uuid="id-1")
+    second = m.add(ArchiType.BusinessActor, "Y")
+    replacement = m.add(ArchiType.BusinessActor, "Z", uuid=first.uuid)
+    assert list(m.elems_dict.values()) == [replacement, second]
+    assert m.find_elements(elem_type=ArchiType.BusinessActor) == [replacement, second]
+    assert m.find_elements(elem_type=ArchiType.BusinessRole) == []
+
+
 # ---------------------------------------------------------------------------
 # Model.find_relationships / filter_relationships
 # ---------------------------------------------------------------------------
@@ -447,6 +497,37 @@ def test_model_embed_props_remove_props():
     assert a.prop("x") is None
 
 
+def test_model_embed_props_remove_props_clears_model_and_views():
+    m = Model("ep-rm-all")
+    m.prop("scope", "all")
+    v = m.add(ArchiType.View, "V")
+    v.prop("layer", "app")
+    m.embed_props(remove_props=True)
+    assert m.props == {}
+    assert v.props == {}
+    assert '"scope": "all"' in m.desc
+    assert '"layer": "app"' in v.desc
+
+
+def test_model_expand_props_parses_each_embedded_block_once(monkeypatch):
+    import src.pyArchimate.model as model_module
+
+    m = Model("ex-once")
+    a = m.add(ArchiType.ApplicationComponent, "App", desc='Intro\n\nproperties = {"k": "v"}\n')
+    calls = []
+    real_raw_decode = model_module._JSON_DECODER.raw_decode
+
+    def counting_raw_decode(text, idx=0):
+        calls.append(idx)
+        return real_raw_decode(text, idx)
+
+    monkeypatch.setattr(model_module._JSON_DECODER, "raw_decode", counting_raw_decode)
+    model_module._expand_element(a, clean_doc=True)
+    assert a.prop("k") == "v"
+    assert a.desc == "Intro"
+    assert len(calls) == 1
+
+
 def test_model_expand_props_restores_element():
     m = Model("ex-elem")
     a = m.add(ArchiType.ApplicationComponent, "App")
@@ -556,6 +637,20 @@ def test_find_props_block_hash_prefix():
     assert parsed == {"key": "val"}
 
 
+def test_find_props_block_without_marker_skips_marker_searches():
+    """Text that never mentions 'properties' is rejected by one scan, without the per-marker searches."""
+
+    class CountingStr(str):
+        finds = 0
+
+        def find(self, *args):
+            CountingStr.finds += 1
+            return super().find(*args)
+
+    assert _find_props_block(CountingStr('plain text with {"json": "like"} braces')) is None
+    assert CountingStr.finds == 0
+
+
 def test_strip_props_block_no_block_returns_original():
     """Text without a block is returned unchanged."""
     text = "just some description"
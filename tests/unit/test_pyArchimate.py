@@ -1,4 +1,13 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import src.pyArchimate as pa
 from src.pyArchimate import Model as PackageModel
+from src.pyArchimate import constants
 from src.pyArchimate.element import Element
 from src.pyArchimate.model import Model
 from src.pyArchimate.relationship import Relationship
@@ -9,3 +18,59 @@ def test_modular_imports_expose_public_api_surface():
     assert Model.__name__ == "Model"
     assert Element.__name__ == "Element"
     assert Relationship.__name__ == "Relationship"
+
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+
+def _run_isolated(code: str, **env: str) -> None:
+    """Run ``code`` in a fresh interpreter so ``sys.modules`` reflects a cold import."""
+    prelude = f"import sys\nsys.path.insert(0, {str(SRC_DIR)!r})\n"
+    environ = {k: v for k, v in os.environ.items() if k != "EAGER_IMPORT"}
+    subprocess.run([sys.executable, "-c", prelude + code], check=True, env={**environ, **env})
+
+
+def test_package_import_defers_heavy_submodules():
+    """``import pyArchimate`` must not load the model/view/writer stack until a name is used."""
+    _run_isolated(
+        "import pyArchimate as pa\n"
+        "assert 'pyArchimate.model' not in sys.modules\n"
+        "assert 'pyArchimate.writers' not in sys.modules\n"
+        "assert pa.ArchiType.BusinessActor.value == 'BusinessActor'\n"
+        "assert 'pyArchimate.model' not in sys.modules\n"
+    )
+
+
+def test_archi_type_resolves_from_dependency_free_enums_module():
+    """Referencing a type constant only pulls in the Layer 1 ``enums`` module."""
+    _run_isolated(
+        "from pyArchimate import ArchiType\n"
+        "loaded = {m for m in sys.modules if m.split('.')[0] == 'pyArchimate'}\n"
+        "assert loaded == {'pyArchimate', 'pyArchimate.enums'}, loaded\n"
+        "assert ArchiType.View.value == 'View'\n"
+    )
+
+
+def test_package_getattr_caches_resolved_names_in_module_globals():
+    _run_isolated(
+        "import pyArchimate as pa\n"
+        "assert 'Readers' not in vars(pa)\n"
+        "readers = pa.Readers\n"
+        "assert vars(pa)['Readers'] is readers\n"
+    )
+
+
+def test_eager_import_env_var_resolves_everything_at_import_time():
+    _run_isolated(
+        "import pyArchimate as pa\n"
+        "assert 'pyArchimate.model' in sys.modules\n"
+        "assert 'Model' in vars(pa)\n",
+        EAGER_IMPORT="1",
+    )
+
+
+def test_package_getattr_resolves_aliases_and_rejects_unknown_names():
+    assert pa.archi_category is constants.ARCHI_CATEGORY
+    assert "View" in dir(pa)
+    with pytest.raises(AttributeError):
+        _ = pa.does_not_exist
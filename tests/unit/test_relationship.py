@@ -8,8 +8,10 @@ from src.pyArchimate.relationship import (
     Relationship,
     _is_valid_uuid,
     _resolve_and_validate_ref,
+    _triple_problem,
     check_valid_relationship,
     get_default_rel_type,
+    set_id,
 )
 
 # ---------------------------------------------------------------------------
@@ -69,6 +71,29 @@ def test_check_valid_relationship_logs_on_no_raise():
     check_valid_relationship("Composition", "BusinessActor", "ApplicationService", raise_flg=False)
 
 
+def test_check_valid_relationship_memoizes_verdict_but_raises_fresh_errors():
+    args = ("Composition", "BusinessActor", "ApplicationService")
+    errors = []
+    for _ in range(2):
+        with pytest.raises(ArchimateRelationshipError) as exc_info:
+            check_valid_relationship(*args, raise_flg=True)
+        errors.append(exc_info.value)
+    assert errors[0] is not errors[1]
+    assert str(errors[0]) == str(errors[1])
+    hits = _triple_problem.cache_info().hits
+    assert check_valid_relationship("Serving", "ApplicationComponent", "ApplicationService")
+    assert check_valid_relationship("Serving", "ApplicationComponent", "ApplicationService")
+    assert _triple_problem.cache_info().hits >= hits + 1
+
+
+def test_invalid_type_names_are_not_cached():
+    size = _triple_problem.cache_info().currsize
+    for i in range(3):
+        assert not check_valid_relationship("Serving", f"NotAType{i}", "ApplicationService")
+        assert not check_valid_relationship(f"NotARel{i}", "ApplicationComponent", "ApplicationService")
+    assert _triple_problem.cache_info().currsize == size
+
+
 # ---------------------------------------------------------------------------
 # get_default_rel_type
 # ---------------------------------------------------------------------------
@@ -79,6 +104,10 @@ def test_get_default_rel_type_returns_string():
     assert isinstance(result, str)
 
 
+def test_get_default_rel_type_prefers_realization_over_serving():
+    assert get_default_rel_type("ApplicationComponent", "ApplicationService") == "Realization"
+
+
 def test_get_default_rel_type_invalid_source_raises():
     with pytest.raises(ArchimateConceptTypeError):
         get_default_rel_type("NotAType", "ApplicationService")
@@ -169,6 +198,12 @@ def test_relationship_remove_prop_missing_is_noop(model_with_rel):
     rel.remove_prop("no_such_key")  # must not raise
 
 
+def test_relationship_update_props_sets_many(model_with_rel):
+    _, _, _, rel = model_with_rel
+    rel.update_props({"k": "v", "AT_PROP": "w"})
+    assert rel.prop("k") == "v" and rel.prop("AT_PROP") == "w"
+
+
 def test_relationship_remove_folder(model_with_rel):
     _, _, _, rel = model_with_rel
     rel.folder = "/rels"
@@ -410,6 +445,14 @@ def test_relationship_target_is_relationship():
 def test_is_valid_uuid_invalid_string_returns_false():
     """Non-UUID string triggers UUID() ValueError and returns False."""
     assert _is_valid_uuid("not-a-valid-uuid") is False
+    assert _is_valid_uuid("not-a-valid-uuid", version=1) is False
+
+
+def test_set_id_returns_prefixed_identifier_unchanged():
+    ident = "id-" + "ab" * 16
+    assert set_id(ident) is ident
+    assert set_id("c9bf9e57-1685-4c89-bafb-ff5af830be8a") == "id-c9bf9e5716854c89bafbff5af830be8a"
+    assert set_id("custom-id") == "custom-id"
 
 
 # ---------------------------------------------------------------------------
@@ -581,3 +624,23 @@ def test_resolve_and_validate_ref_unknown_uuid_raises():
     m = Model("rr-unknown")
     with pytest.raises(ValueError, match="Invalid source"):
         _resolve_and_validate_ref("id-deadbeef", m.elems_dict, m.rels_dict, "source")
+
+
+def test_resolve_and_validate_ref_accepts_concept_objects():
+    """Element and Relationship objects resolve to their uuid."""
+    m = Model("rr-objects")
+    a = m.add(ArchiType.ApplicationComponent, "A")
+    b = m.add(ArchiType.ApplicationService, "B")
+    rel = m.add_relationship(ArchiType.Serving, source=a, target=b)
+    assert _resolve_and_validate_ref(a, m.elems_dict, m.rels_dict, "source") == a.uuid
+    assert _resolve_and_validate_ref(rel, m.elems_dict, m.rels_dict, "target") == rel.uuid
+
+
+def test_relationship_type_is_stored_as_shared_plain_string():
+    model = Model("interned-rel-types")
+    src = model.add(ArchiType.ApplicationComponent, "Src")
+    dst = model.add(ArchiType.ApplicationService, "Dst")
+    r1 = model.add_relationship("".join(["Real", "ization"]), source=src, target=dst)
+    r2 = model.add_relationship(ArchiType.Realization, source=src, target=dst)
+    assert type(r2.type) is str
+    assert r1.type is r2.type
@@ -62,3 +62,23 @@ def test_resolve_writer_with_invalid_int_raises():
 
     with pytest.raises(ValueError):
         _resolve_writer(99999)  # not a valid Writers enum value — hits except ValueError branch
+
+
+def test_resolve_writer_imports_only_the_requested_default_writer(monkeypatch):
+    from src.pyArchimate import writers
+    from src.pyArchimate.enums import Writers
+
+    monkeypatch.setattr(writers, "_writer_registry", {})
+    fn = writers._resolve_writer("csv")
+    assert fn.__name__ == "csv_writer"
+    assert list(writers._writer_registry) == [Writers.csv]
+
+
+def test_registered_writer_overrides_default(monkeypatch):
+    from src.pyArchimate import writers
+    from src.pyArchimate.enums import Writers
+
+    monkeypatch.setattr(writers, "_writer_registry", {})
+    custom = lambda m, f: None  # noqa: E731
+    writers.register_writer(Writers.archi, custom)
+    assert writers._resolve_writer(Writers.archi) is custom
@@ -144,3 +144,13 @@ class TestNormalizeEdges:
         edges = [{"target": 1}]
         result = normalize_edges(edges, nodes)
         assert result == []
+
+    def test_builtin_subclasses_and_short_tuples(self) -> None:
+        """Test tuple/dict subclasses still normalize and tuples of the wrong length are dropped."""
+        from collections import OrderedDict, namedtuple
+
+        Edge = namedtuple("Edge", "source target")
+        nodes = [MockNode("uuid-a"), MockNode("uuid-b")]
+        edges: list[Any] = [Edge(0, 1), OrderedDict(source="uuid-b", target="uuid-a"), (0, 1, 2), (1,)]
+        result = normalize_edges(edges, nodes)
+        assert result == [(0, 1), (1, 0)]
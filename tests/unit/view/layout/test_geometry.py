@@ -1,5 +1,7 @@
 """Tests for geometry utilities."""
 
+import math
+
 from src.pyArchimate.view.layout.utils.geometry import Point, Rectangle, bounding_box, distance, midpoint
 
 
@@ -12,12 +14,21 @@ class TestPoint:
         assert p.x == 3.0
         assert p.y == 4.0
 
+    def test_point_and_rectangle_have_no_instance_dict(self) -> None:
+        """Test the geometry value types are slotted."""
+        assert not hasattr(Point(0, 0), "__dict__")
+        assert not hasattr(Rectangle(0, 0, 1, 1), "__dict__")
+
     def test_distance_to(self) -> None:
         """Test distance calculation between points."""
         p1 = Point(0, 0)
         p2 = Point(3, 4)
         assert p1.distance_to(p2) == 5.0
 
+    def test_distance_to_does_not_overflow_on_large_coordinates(self) -> None:
+        """Test distance stays finite where squaring the deltas would overflow."""
+        assert math.isclose(Point(0, 0).distance_to(Point(3e200, 4e200)), 5e200)
+
     def test_distance_function(self) -> None:
         """Test module distance function."""
         p1 = Point(0, 0)
@@ -35,6 +35,13 @@ class TestGraph:
         assert "B" in g.edges["A"]
         assert "A" in g.edges["B"]
 
+    def test_add_node_keeps_existing_edges(self) -> None:
+        """Test re-adding a connected node does not drop its adjacency."""
+        g = Graph()
+        g.add_edge("A", "B")
+        g.add_node("A")
+        assert g.edges["A"] == {"B"}
+
     def test_get_neighbors_existing(self) -> None:
         """Test getting neighbors of existing node."""
         g = Graph()
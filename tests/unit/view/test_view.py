@@ -1,5 +1,6 @@
 """Tests for View/Node/Connection/Profile implementations."""
 
+import logging
 from typing import cast
 
 import pytest
@@ -86,6 +87,11 @@ def test_point_negative_clamped():
     assert p.y == 0
 
 
+def test_point_and_position_use_slots():
+    assert not hasattr(Point(1, 2), "__dict__")
+    assert not hasattr(Position(), "__dict__")
+
+
 # ---------------------------------------------------------------------------
 # Position
 # ---------------------------------------------------------------------------
@@ -281,6 +287,58 @@ def test_view_get_or_create_connection_no_rel_type_returns_none(simple_view):
     assert result is None
 
 
+def test_view_lookup_of_unknown_node_or_connection_does_not_create_one():
+    m = Model("lookup")
+    v = cast(View, m.add(ArchiType.View, "V"))
+    with pytest.raises(KeyError):
+        v.nodes_dict["missing"]
+    with pytest.raises(KeyError):
+        v.conns_dict["missing"]
+    assert not v.nodes_dict and not v.conns_dict
+
+
+def test_view_add_many_creates_elements_nodes_and_connections():
+    m = Model("batch")
+    v = cast(View, m.add(ArchiType.View, "V"))
+    srv, comp = v.add_many(
+        nodes=[
+            ("Svc", ArchiType.ApplicationService, 20, 20),
+            ("Comp", ArchiType.ApplicationComponent, 200, 20, 150, 60),
+        ],
+        connections=[(ArchiType.Serving, "Comp", "Svc", "Serves")],
+    )
+    assert (srv.name, srv.x, srv.y) == ("Svc", 20, 20)
+    assert (comp.w, comp.h) == (150, 60)
+    assert len(m.elems_dict) == 2
+    [conn] = v.conns
+    assert conn.source is comp and conn.target is srv
+    assert conn.concept.name == "Serves"
+
+
+def test_view_add_many_reuses_existing_elements_nodes_and_connections(simple_view):
+    m, v, _, _, rel, na, nb, conn = simple_view
+    elems_before = len(m.elems_dict)
+    found_a, found_b = v.add_many(
+        nodes=[("CompA", ArchiType.ApplicationComponent, 0, 0), ("SvcB", ArchiType.ApplicationService, 0, 0)],
+        connections=[(ArchiType.Serving, na, nb)],
+    )
+    assert (found_a, found_b) == (na, nb)
+    assert len(m.elems_dict) == elems_before
+    assert v.conns == [conn]
+
+
+def test_view_add_many_picks_the_same_duplicates_as_get_or_create_node():
+    m = Model("dupes")
+    v = cast(View, m.add(ArchiType.View, "V"))
+    first = m.add(ArchiType.ApplicationComponent, "Twin")
+    m.add(ArchiType.ApplicationComponent, "Twin")
+    first_node = v.add(first, 0, 0)
+    v.add(first, 300, 0)
+    [found] = v.add_many(nodes=[("Twin", ArchiType.ApplicationComponent, 0, 0)])
+    expected = v.get_or_create_node("Twin", ArchiType.ApplicationComponent)
+    assert found is expected is first_node
+
+
 # ---------------------------------------------------------------------------
 # Node operations
 # ---------------------------------------------------------------------------
@@ -994,6 +1052,19 @@ def test_node_resize_desc_sort():
     assert parent_n.w > 0
 
 
+def test_node_resize_orders_equal_size_children_by_position():
+    m = Model("resize-ties")
+    a = m.add(ArchiType.ApplicationComponent, "Parent")
+    b = m.add(ArchiType.ApplicationService, "Right")
+    c = m.add(ArchiType.ApplicationService, "Left")
+    v = cast(View, m.add(ArchiType.View, "V"))
+    parent_n = v.add(ref=a.uuid, x=0, y=0, w=400, h=300)
+    right = parent_n.add(ref=b.uuid, x=150, y=10)
+    left = parent_n.add(ref=c.uuid, x=10, y=10)
+    parent_n.resize(max_in_row=2)
+    assert left.rx < right.rx
+
+
 def test_node_resize_no_sort():
     """resize() with unrecognised sort value — covers the else branch (line 460)."""
     m = Model("resize-none")
@@ -1432,6 +1503,16 @@ def test_connection_valid_target_not_in_nodes_dict_raises(simple_view):
     assert c._target == "nonexistent-node-uuid"
 
 
+def test_connection_unknown_ref_debug_message_is_formatted_lazily(simple_view, caplog):
+    """The debug message is only rendered when a handler emits it, with the reference filled in."""
+    _, v, _, _, _, na, nb, _ = simple_view
+    with caplog.at_level(logging.DEBUG):
+        Connection(ref="nonexistent-rel-uuid", source=na, target=nb, parent=v)
+    record = next(r for r in caplog.records if "not found in model" in r.getMessage())
+    assert record.args == ("nonexistent-rel-uuid",)
+    assert record.getMessage() == 'Relationship reference "nonexistent-rel-uuid" not found in model'
+
+
 # ---------------------------------------------------------------------------
 # View.get_or_create_node — string elem paths (lines 992, 1004)
 # ---------------------------------------------------------------------------
@@ -215,3 +215,39 @@ def test_archi_writer_propagates_target_connections_to_group_ancestors(tmp_path)
 
     assert conn.uuid not in (group_node.get("targetConnections") or "")
     assert conn.uuid in (tgt_node.get("targetConnections") or "")
+
+
+def test_archi_writer_escapes_characters_invalid_in_xml(tmp_path):
+    model = Model("invalid-chars")
+    elem = model.add(ArchiType.ApplicationComponent, "App\x0bOne")
+    elem.prop("Key", "va\x1flue")
+    xml_str = archi_writer(model, str(tmp_path / "invalid_chars.archimate"))
+    root = etree.fromstring(xml_str.encode("utf-8"))
+    el = root.find(".//element[@name='App[#x000B]One']")
+    assert el is not None  # NOSONAR — lxml stubs omit Optional; find() returns None at runtime
+    assert el.find("property").get("value") == "va[#x001F]lue"
+
+
+def test_archi_writer_reuses_nested_folder_for_shared_path(tmp_path):
+    model = Model("shared-folder")
+    for name in ("A", "B"):
+        model.add(ArchiType.ApplicationComponent, name).folder = "/Application/Sub"
+    xml_str = archi_writer(model, str(tmp_path / "shared_folder.archimate"))
+    root = etree.fromstring(xml_str.encode("utf-8"))
+    subs = root.findall(".//folder[@name='Sub']")
+    assert len(subs) == 1
+    assert [e.get("name") for e in subs[0].findall("element")] == ["A", "B"]
+    assert "shared-folder" not in archi_writer(Model("other"), str(tmp_path / "other.archimate"))
+
+
+def test_archi_writer_stores_precompressed_images_without_deflate(tmp_path):
+    model = Model("images")
+    model._images_dict["images/photo.PNG"] = b"PNG" * 100
+    model._images_dict["images/scan.bmp"] = b"BMP" * 100
+    target = tmp_path / "images.archimate"
+    archi_writer(model, str(target))
+    with zipfile.ZipFile(target) as zf:
+        assert zf.getinfo("images/photo.PNG").compress_type == zipfile.ZIP_STORED
+        assert zf.getinfo("images/scan.bmp").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.getinfo("model.xml").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.read("images/photo.PNG") == b"PNG" * 100
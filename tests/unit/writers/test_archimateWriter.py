@@ -43,10 +43,10 @@ def test_archimate_writer_with_views_to_file(tmp_path):
 
 
 def test_write_elem_viewpoints_creates_properties_element():
-    """_write_elem_viewpoints writes viewpoint slugs as <property> children (lines 70-76).
+    """Viewpoint slugs are written as <property> children.
 
-    Exercises the 'pp is None' branch: element has no existing <properties>, so the
-    function must create one before appending the viewpoint property.
+    The element has no props of its own, so the <properties> block must be created
+    for the viewpoint property.
     """
     model = Model("vp-no-props")
     elem = model.add(ArchiType.ApplicationComponent, "App")
@@ -65,10 +65,10 @@ def test_write_elem_viewpoints_creates_properties_element():
 
 
 def test_write_elem_viewpoints_reuses_existing_properties_element():
-    """_write_elem_viewpoints appends to the existing <properties> element (lines 70-76).
+    """Viewpoint properties share the element's single <properties> block.
 
-    Exercises the 'pp is not None' branch: element already has a <properties> child
-    from its own props, so the viewpoint property must be appended to that element.
+    The element already has props of its own, so the viewpoint property must be
+    appended to the same <properties> element.
     """
     model = Model("vp-with-props")
     elem = model.add(ArchiType.ApplicationComponent, "App")
@@ -113,3 +113,100 @@ def test_archimate_writer_exports_business_interaction():
     doc = bi_elem.find("ns:documentation", namespaces=ns)
     assert doc is not None  # NOSONAR — lxml stubs omit Optional; find() returns None at runtime
     assert doc.text == "Service interactions"
+
+
+def test_archimate_writer_escapes_characters_invalid_in_xml():
+    model = Model("invalid-chars")
+    model.add(ArchiType.ApplicationComponent, "App\x0bOne", desc="line\x01feed")
+    xml_content = archimate_writer(model)
+    root = etree.fromstring(xml_content.encode("utf-8"))
+    ns = {"ns": "http://www.opengroup.org/xsd/archimate/3.0/"}  # NOSONAR — XML namespace URI, not a network request
+    elem = root.find("ns:elements/ns:element", namespaces=ns)
+    assert elem is not None  # NOSONAR — lxml stubs omit Optional; find() returns None at runtime
+    assert elem.findtext("ns:name", namespaces=ns) == "App[#x000B]One"
+    assert elem.findtext("ns:documentation", namespaces=ns) == "line[#x0001]feed"
+
+
+def test_archimate_writer_omits_property_definitions_without_properties():
+    model = Model("no-props")
+    model.add(ArchiType.ApplicationComponent, "App")
+    root = etree.fromstring(archimate_writer(model).encode("utf-8"))
+    ns = {"ns": "http://www.opengroup.org/xsd/archimate/3.0/"}  # NOSONAR — XML namespace URI, not a network request
+    assert root.find("ns:propertyDefinitions", namespaces=ns) is None
+
+
+def test_archimate_writer_reuses_property_definition_ids():
+    model = Model("shared-props")
+    model.pdefs["propid-7"] = "owner"
+    for name in ("A", "B"):
+        model.add(ArchiType.ApplicationComponent, name).prop("owner", name)
+    model.add(ArchiType.ApplicationComponent, "C").prop("status", "draft")
+    root = etree.fromstring(archimate_writer(model).encode("utf-8"))
+    ns = {"ns": "http://www.opengroup.org/xsd/archimate/3.0/"}  # NOSONAR — XML namespace URI, not a network request
+    refs = [p.get("propertyDefinitionRef") for p in root.iterfind(".//ns:element/ns:properties/ns:property", ns)]
+    assert refs == ["propid-7", "propid-7", "propid-2"]
+    assert model.pdefs == {"propid-7": "owner", "propid-2": "status"}
+
+
+def test_archimate_writer_repeated_writes_do_not_share_state():
+    first = archimate_writer(Model("first"))
+    second = archimate_writer(Model("second"))
+    assert "first" not in second
+    assert first.count("<name>") == second.count("<name>") == 1
+
+
+def test_archimate_writer_rounds_float_bendpoints():
+    from src.pyArchimate.view import Point
+
+    model = Model("float-bendpoints")
+    a = model.add(ArchiType.ApplicationComponent, "A")
+    b = model.add(ArchiType.ApplicationService, "B")
+    rel = model.add_relationship(ArchiType.Serving, source=a, target=b)
+    view = model.add(ArchiType.View, "V")
+    na = view.add(ref=a.uuid, x=0, y=0, w=100, h=50)
+    nb = view.add(ref=b.uuid, x=200, y=0, w=100, h=50)
+    view.add_connection(ref=rel.uuid, source=na, target=nb).add_bendpoint(Point(110.6, 27.5))
+    root = etree.fromstring(archimate_writer(model).encode("utf-8"))
+    ns = {"ns": "http://www.opengroup.org/xsd/archimate/3.0/"}  # NOSONAR — XML namespace URI, not a network request
+    bp = root.find(".//ns:connection/ns:bendpoint", namespaces=ns)
+    assert bp is not None  # NOSONAR — lxml stubs omit Optional; find() returns None at runtime
+    assert (bp.get("x"), bp.get("y")) == ("111", "28")
+
+
+def test_archimate_writer_nests_shared_folder_prefixes_once():
+    from src.pyArchimate.readers.archimateReader import archimate_reader
+
+    model = Model("orgs")
+    folders = {"A": "/Application/Sub", "B": "/Application/Sub", "C": "/Application", "D": "/Business/X/Y"}
+    for name, folder in folders.items():
+        model.add(ArchiType.ApplicationComponent, name).folder = folder
+    xml_str = archimate_writer(model)
+    root = etree.fromstring(xml_str.encode("utf-8"))
+    ns = {"ns": "http://www.opengroup.org/xsd/archimate/3.0/"}  # NOSONAR — XML namespace URI, not a network request
+    top_labels = [lbl.text for lbl in root.findall("ns:organizations/ns:item/ns:label", namespaces=ns)]
+    assert top_labels == ["Application", "Business"]
+
+    reread = Model("reread")
+    archimate_reader(reread, root)
+    assert {e.name: e.folder for e in reread.elements} == folders
+
+
+def test_archimate_writer_escapes_invalid_characters_in_folder_labels():
+    model = Model("org-escape")
+    model.add(ArchiType.ApplicationComponent, "A").folder = "/Application/Bad\x07Name"
+    root = etree.fromstring(archimate_writer(model).encode("utf-8"))
+    ns = {"ns": "http://www.opengroup.org/xsd/archimate/3.0/"}  # NOSONAR — XML namespace URI, not a network request
+    labels = [lbl.text for lbl in root.iterfind(".//ns:organizations//ns:label", namespaces=ns)]
+    assert labels == ["Application", "Bad[#x0007]Name"]
+
+
+def test_archimate_writer_node_line_color_keeps_each_channel():
+    model = Model("line-color")
+    view = model.add(ArchiType.View, "V")
+    node = view.add(ref=model.add(ArchiType.ApplicationComponent, "A").uuid, x=0, y=0, w=100, h=50)
+    node.line_color = "#102030"
+    root = etree.fromstring(archimate_writer(model).encode("utf-8"))
+    ns = {"ns": "http://www.opengroup.org/xsd/archimate/3.0/"}  # NOSONAR — XML namespace URI, not a network request
+    lc = root.find(".//ns:node/ns:style/ns:lineColor", namespaces=ns)
+    assert lc is not None  # NOSONAR — lxml stubs omit Optional; find() returns None at runtime
+    assert (lc.get("r"), lc.get("g"), lc.get("b")) == ("16", "32", "48")
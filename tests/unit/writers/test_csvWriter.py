@@ -1,5 +1,6 @@
 from src.pyArchimate import ArchiType
 from src.pyArchimate.model import Model
+from src.pyArchimate.writers import csvWriter
 from src.pyArchimate.writers.csvWriter import csv_writer
 from tests._helpers import simple_archimate_model
 
@@ -23,3 +24,43 @@ def test_csv_writer_with_relationship_properties(tmp_path):
     csv_writer(m, str(destination))
     props_file = tmp_path / "props_properties.csv"
     assert props_file.exists()
+
+
+def test_csv_writer_quotes_every_field_with_semicolon_delimiter(tmp_path):
+    m = Model("csv-format", uuid="id-model")
+    m.prop("scope", "all")
+    a = m.add(ArchiType.ApplicationComponent, 'A "quoted";name', uuid="id-a")
+    a.prop("owner", "team")
+    csv_writer(m, str(tmp_path / "fmt.csv"))
+    assert (tmp_path / "fmt_elements.csv").read_text(encoding="utf-8").splitlines()[2] == (
+        '"id-a";"ApplicationComponent";"A ""quoted"";name";"";""'
+    )
+    assert (tmp_path / "fmt_properties.csv").read_text(encoding="utf-8").splitlines() == [
+        '"ID";"Key";"Value"',
+        '"id-model";"scope";"all"',
+        '"id-a";"owner";"team"',
+    ]
+
+
+def test_csv_writer_relationship_rows_carry_endpoint_ids(tmp_path):
+    m = Model("csv-rels")
+    a = m.add(ArchiType.ApplicationComponent, "A", uuid="id-a")
+    b = m.add(ArchiType.ApplicationService, "B", uuid="id-b")
+    m.add_relationship(ArchiType.Serving, source=a, target=b, uuid="id-r", name="serves")
+    csv_writer(m, str(tmp_path / "rels.csv"))
+    assert (tmp_path / "rels_relations.csv").read_text(encoding="utf-8").splitlines()[1] == (
+        '"id-r";"Serving";"serves";"";"id-a";"id-b";""'
+    )
+
+
+def test_csv_writer_opens_every_file_with_large_buffer(tmp_path, monkeypatch):
+    buffering = []
+    real_open = open
+
+    def recording_open(*args, **kwargs):
+        buffering.append(kwargs.get("buffering"))
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr(csvWriter, "open", recording_open, raising=False)
+    csv_writer(simple_archimate_model(), str(tmp_path / "out.csv"))
+    assert buffering == [csvWriter._CSV_BUFFER_SIZE] * 3
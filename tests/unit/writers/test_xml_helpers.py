@@ -0,0 +1,25 @@
+from src.pyArchimate.writers._xml_helpers import escape_invalid_xml
+
+
+def test_escape_invalid_xml_returns_printable_text_unchanged():
+    text = "Café & <Service>"
+    assert escape_invalid_xml(text) is text
+
+
+def test_escape_invalid_xml_keeps_whitespace_allowed_by_xml():
+    assert escape_invalid_xml("a\tb\nc\rd") == "a\tb\nc\rd"
+
+
+def test_escape_invalid_xml_marks_control_and_non_characters():
+    assert escape_invalid_xml("a\x0bb\x00") == "a[#x000B]b[#x0000]"
+    assert escape_invalid_xml("x\ufffe") == "x[#xFFFE]"
+
+
+def test_escape_invalid_xml_memoizes_repeated_strings():
+    escape_invalid_xml.cache_clear()
+    escape_invalid_xml("Business\x0bActor")
+    escape_invalid_xml("Business\x0bActor")
+    info = escape_invalid_xml.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    escape_invalid_xml.cache_clear()
+    assert escape_invalid_xml.cache_info().currsize == 0